@@ -31,6 +31,8 @@ PerformanceMetrics PerformanceAnalyzer::calculate_metrics() {
 
     if (equity_curve_.empty()) {
         std::cerr << "Warning: Empty equity curve provided to PerformanceAnalyzer" << std::endl;
+        // Trades ingested via add_trades_batch() carry their own P&L and do not need the curve
+        calculate_trade_statistics(metrics);
         return metrics;
     }
 
@@ -143,6 +145,36 @@ void PerformanceAnalyzer::record_event_latency(const nexus::core::Event& start_e
     }
 }
 
+void PerformanceAnalyzer::add_trades_batch(const double* pnls,
+                                           const int64_t* entry_times,
+                                           const int64_t* exit_times,
+                                           size_t count) {
+    if (count == 0) [[unlikely]] {
+        return;
+    }
+
+    // One reserve per column, then a straight copy of each contiguous buffer
+    trade_pnls_.reserve(trade_pnls_.size() + count);
+    trade_entry_times_.reserve(trade_entry_times_.size() + count);
+    trade_exit_times_.reserve(trade_exit_times_.size() + count);
+
+    trade_pnls_.insert(trade_pnls_.end(), pnls, pnls + count);
+    trade_entry_times_.insert(trade_entry_times_.end(), entry_times, entry_times + count);
+    trade_exit_times_.insert(trade_exit_times_.end(), exit_times, exit_times + count);
+}
+
+void PerformanceAnalyzer::reset() {
+    equity_curve_.clear();
+    trade_history_.clear();
+    trade_pnls_.clear();
+    trade_entry_times_.clear();
+    trade_exit_times_.clear();
+
+    if (latency_tracker_) {
+        latency_tracker_->clear();
+    }
+}
+
 std::vector<double> PerformanceAnalyzer::calculate_daily_returns() const {
     std::vector<double> returns;
     
@@ -185,6 +217,13 @@ double PerformanceAnalyzer::calculate_max_drawdown() const {
 }
 
 void PerformanceAnalyzer::calculate_trade_statistics(PerformanceMetrics& metrics) const {
+    // Closed trades from add_trades_batch() have realized P&L, so they take
+    // precedence over the fill-based approximation below
+    if (!trade_pnls_.empty()) {
+        calculate_batch_trade_statistics(metrics);
+        return;
+    }
+
     if (trade_history_.empty()) {
         return;
     }
@@ -223,4 +262,36 @@ void PerformanceAnalyzer::calculate_trade_statistics(PerformanceMetrics& metrics
     }
 }
 
+void PerformanceAnalyzer::calculate_batch_trade_statistics(PerformanceMetrics& metrics) const {
+    int winning_trades = 0;
+    int losing_trades = 0;
+    double gross_profit = 0.0;
+    double gross_loss = 0.0;
+    double best_trade = trade_pnls_.front();
+    double worst_trade = trade_pnls_.front();
+
+    for (double pnl : trade_pnls_) {
+        if (pnl > 0.0) {
+            ++winning_trades;
+            gross_profit += pnl;
+        } else if (pnl < 0.0) {
+            ++losing_trades;
+            gross_loss -= pnl;
+        }
+        best_trade = std::max(best_trade, pnl);
+        worst_trade = std::min(worst_trade, pnl);
+    }
+
+    metrics.total_trades = static_cast<int>(trade_pnls_.size());
+    metrics.winning_trades = winning_trades;
+    metrics.losing_trades = losing_trades;
+    metrics.win_rate = static_cast<double>(winning_trades) / metrics.total_trades;
+    metrics.average_trade_return = (gross_profit - gross_loss) / metrics.total_trades;
+    metrics.best_trade = best_trade;
+    metrics.worst_trade = worst_trade;
+    if (gross_loss > 0.0) {
+        metrics.profit_factor = gross_profit / gross_loss;
+    }
+}
+
 } // namespace nexus::analytics
\ No newline at end of file
@@ -7,6 +7,7 @@
 #include "core/latency_tracker.h" // NEW: For Phase 3.2 latency tracking
 #include <vector>
 #include <memory>
+#include <cstdint>
 #include <unordered_map> // NEW: For latency statistics map
 
 namespace nexus::analytics {
@@ -85,10 +86,44 @@ public:
                              const nexus::core::Event& end_event,
                              const std::string& operation_name);
 
+    /**
+     * @brief Ingests a batch of closed trades in struct-of-arrays layout.
+     * @param pnls Pointer to `count` realized P&L values.
+     * @param entry_times Pointer to `count` entry timestamps.
+     * @param exit_times Pointer to `count` exit timestamps.
+     * @param count Number of trades in the batch.
+     *
+     * The three columns are appended with a single reserve() per column,
+     * avoiding per-trade call overhead when trades come from Python arrays.
+     * When present, these trades drive the trade statistics in calculate_metrics().
+     */
+    void add_trades_batch(const double* pnls,
+                          const int64_t* entry_times,
+                          const int64_t* exit_times,
+                          size_t count);
+
+    /**
+     * @brief Gets the number of trades ingested through add_trades_batch().
+     */
+    size_t get_batch_trade_count() const noexcept { return trade_pnls_.size(); }
+
+    /**
+     * @brief Clears equity curve, trades and latency data for reuse.
+     *
+     * Vectors are cleared without releasing capacity, so a reused analyzer
+     * does not reallocate on the next batch of the same size.
+     */
+    void reset();
+
 private:
     double initial_capital_;
     std::vector<double> equity_curve_;
     std::vector<nexus::core::TradeExecutionEvent> trade_history_;
+
+    // Closed trades ingested in batch (struct-of-arrays)
+    std::vector<double> trade_pnls_;
+    std::vector<int64_t> trade_entry_times_;
+    std::vector<int64_t> trade_exit_times_;
     
     // NEW: Phase 3.2 - Latency tracking components
     std::unique_ptr<nexus::core::LatencyTracker> latency_tracker_;
@@ -111,6 +146,12 @@ private:
      * @param metrics The metrics object to populate with trade statistics.
      */
     void calculate_trade_statistics(PerformanceMetrics& metrics) const;
+
+    /**
+     * @brief Calculates trade statistics from the realized P&L of batch trades.
+     * @param metrics The metrics object to populate with trade statistics.
+     */
+    void calculate_batch_trade_statistics(PerformanceMetrics& metrics) const;
 };
 
 } // namespace nexus::analytics
\ No newline at end of file
@@ -323,10 +323,8 @@ void BacktestEngine::add_event_safe(Event* event) {
 }
 
 EventPool& BacktestEngine::get_event_pool_safe() {
-    // For now, use a static EventPool since EventQueue doesn't expose one
-    // In a real implementation, you might want to add an event pool to EventQueue
-    // or pass it as a separate dependency
-    static EventPool event_pool_;
+    // Each engine owns its pool: grid search runs one engine per worker thread,
+    // and a function-static pool would be grown and recycled by all of them at once
     return event_pool_;
 }
 
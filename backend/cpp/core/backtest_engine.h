@@ -261,6 +261,9 @@ private:
     std::shared_ptr<nexus::position::PositionManager> position_manager_;
     std::shared_ptr<nexus::execution::ExecutionSimulator> execution_simulator_;
 
+    // Per-engine event pool (see get_event_pool_safe)
+    EventPool event_pool_;
+
     // Configuration and state
     BacktestEngineConfig config_;
     std::atomic<bool> is_running_{false};
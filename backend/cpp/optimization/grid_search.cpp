@@ -8,11 +8,73 @@
 #include "data/market_data_handler.h"
 #include "execution/execution_simulator.h"
 #include "position/position_manager.h"
+#include <algorithm>
+#include <atomic>
+#include <exception>
+#include <fstream>
 #include <iostream>
 #include <functional>
+#include <mutex>
+#include <stdexcept>
+#include <thread>
 
 namespace nexus::optimization {
 
+namespace {
+
+/**
+ * @brief Runs a single backtest for one parameter combination.
+ *
+ * Every call owns its EventQueue, BacktestEngine and collaborators, so
+ * concurrent calls share nothing but the read-only strategy template.
+ */
+OptimizationResult run_single_backtest(
+    const nexus::strategies::AbstractStrategy& strategy_template,
+    const std::unordered_map<std::string, double>& current_params,
+    double initial_capital,
+    const std::string& data_filepath,
+    const std::string& symbol) {
+
+    // CsvDataHandler only logs an unreadable file, which would score the run on an
+    // empty equity curve; fail the combination instead so the caller sees the error
+    if (!std::ifstream(data_filepath).is_open()) {
+        throw std::runtime_error("Could not open market data file: " + data_filepath);
+    }
+
+    auto strategy = strategy_template.clone();
+    for(const auto& p : current_params) {
+        strategy->set_parameter(p.first, p.second);
+    }
+
+    nexus::core::EventQueue event_queue;
+    auto position_manager = std::make_shared<nexus::position::PositionManager>(initial_capital);
+    auto execution_simulator = std::make_shared<nexus::execution::ExecutionSimulator>(nexus::execution::MarketSimulationConfig{});
+
+    // --- CORRECTED for multi-asset ---
+    std::unordered_map<std::string, std::string> symbol_filepaths = {{symbol, data_filepath}};
+    auto data_handler = std::make_shared<nexus::data::CsvDataHandler>(event_queue, symbol_filepaths);
+
+    std::unordered_map<std::string, std::shared_ptr<nexus::strategies::AbstractStrategy>> strategies = {{symbol, std::move(strategy)}};
+
+    nexus::core::BacktestEngine engine(event_queue, data_handler, strategies, position_manager, execution_simulator);
+    engine.run();
+
+    nexus::analytics::PerformanceAnalyzer analyzer(
+        initial_capital,
+        position_manager->get_equity_curve(),
+        position_manager->get_trade_history()
+    );
+    auto metrics = analyzer.calculate_metrics();
+
+    OptimizationResult result;
+    result.parameters = current_params;
+    result.performance = metrics;
+    result.fitness_score = metrics.sharpe_ratio;
+    return result;
+}
+
+} // namespace
+
 std::vector<OptimizationResult> perform_grid_search(
     const nexus::strategies::AbstractStrategy& strategy_template,
     const std::unordered_map<std::string, std::vector<double>>& parameter_grid,
@@ -20,49 +82,15 @@ std::vector<OptimizationResult> perform_grid_search(
     const std::string& data_filepath,
     const std::string& symbol) {
     
-    std::vector<OptimizationResult> all_results;
     std::vector<std::pair<std::string, std::vector<double>>> grid_vec(
         parameter_grid.begin(), parameter_grid.end());
-    
-    std::function<void(int, std::unordered_map<std::string, double>)> generate_combinations =
-        [&](int k, std::unordered_map<std::string, double> current_params) {
-        if (k == grid_vec.size()) {
-            std::cout << "\n--- Running Backtest for Parameters: ---\n";
-            for(const auto& p : current_params) {
-                std::cout << p.first << ": " << p.second << "\n";
-            }
-
-            auto strategy = strategy_template.clone();
-            for(const auto& p : current_params) {
-                strategy->set_parameter(p.first, p.second);
-            }
-
-            nexus::core::EventQueue event_queue;
-            auto position_manager = std::make_shared<nexus::position::PositionManager>(initial_capital);
-            auto execution_simulator = std::make_shared<nexus::execution::ExecutionSimulator>(nexus::execution::MarketSimulationConfig{});
-            
-            // --- CORRECTED for multi-asset ---
-            std::unordered_map<std::string, std::string> symbol_filepaths = {{symbol, data_filepath}};
-            auto data_handler = std::make_shared<nexus::data::CsvDataHandler>(event_queue, symbol_filepaths);
-            
-            std::unordered_map<std::string, std::shared_ptr<nexus::strategies::AbstractStrategy>> strategies = {{symbol, std::move(strategy)}};
-
-            nexus::core::BacktestEngine engine(event_queue, data_handler, strategies, position_manager, execution_simulator);
-            engine.run();
-
-            nexus::analytics::PerformanceAnalyzer analyzer(
-                initial_capital,
-                position_manager->get_equity_curve(),
-                position_manager->get_trade_history()
-            );
-            auto metrics = analyzer.calculate_metrics();
-
-            OptimizationResult result;
-            result.parameters = current_params;
-            result.performance = metrics;
-            result.fitness_score = metrics.sharpe_ratio;
-            all_results.push_back(result);
 
+    // Expand the Cartesian product up front so the runs can be distributed across threads
+    std::vector<std::unordered_map<std::string, double>> combinations;
+    std::function<void(size_t, std::unordered_map<std::string, double>&)> generate_combinations =
+        [&](size_t k, std::unordered_map<std::string, double>& current_params) {
+        if (k == grid_vec.size()) {
+            combinations.push_back(current_params);
             return;
         }
 
@@ -74,7 +102,63 @@ std::vector<OptimizationResult> perform_grid_search(
         }
     };
 
-    generate_combinations(0, {});
+    std::unordered_map<std::string, double> current_params;
+    generate_combinations(0, current_params);
+
+    // Each worker pulls the next combination index and writes into its own slot,
+    // so results keep the sequential ordering without any locking on the output
+    std::vector<OptimizationResult> all_results(combinations.size());
+    std::atomic<size_t> next_index{0};
+    std::mutex log_mutex;
+
+    // An exception escaping a std::thread would call std::terminate and take the
+    // Python interpreter with it, so workers capture the first failure instead
+    std::exception_ptr first_error;
+    std::mutex error_mutex;
+
+    auto worker = [&]() {
+        try {
+            for (size_t i = next_index.fetch_add(1); i < combinations.size(); i = next_index.fetch_add(1)) {
+                {
+                    std::lock_guard<std::mutex> lock(log_mutex);
+                    std::cout << "\n--- Running Backtest for Parameters: ---\n";
+                    for(const auto& p : combinations[i]) {
+                        std::cout << p.first << ": " << p.second << "\n";
+                    }
+                }
+
+                all_results[i] = run_single_backtest(
+                    strategy_template, combinations[i], initial_capital, data_filepath, symbol);
+            }
+        } catch (...) {
+            {
+                std::lock_guard<std::mutex> lock(error_mutex);
+                if (!first_error) {
+                    first_error = std::current_exception();
+                }
+            }
+            // Drain the remaining combinations so the other workers stop early
+            next_index.store(combinations.size());
+        }
+    };
+
+    const size_t num_threads = std::min<size_t>(
+        std::max(1u, std::thread::hardware_concurrency()), combinations.size());
+
+    std::vector<std::thread> workers;
+    workers.reserve(num_threads);
+    for (size_t t = 0; t < num_threads; ++t) {
+        workers.emplace_back(worker);
+    }
+    for (auto& thread : workers) {
+        thread.join();
+    }
+
+    // Rethrown on the calling thread, where pybind11 translates it into a Python exception
+    if (first_error) {
+        std::rethrow_exception(first_error);
+    }
+
     return all_results;
 }
 
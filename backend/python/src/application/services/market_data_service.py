@@ -121,8 +121,8 @@ class MarketDataService:
                 def on_trade(trade_data):
                     self._logger.debug(
                         f"Received trade: {trade_data}",
-                        symbol=trade_data.get("s"),
-                        price=trade_data.get("p"),
+                        symbol=trade_data.s,
+                        price=trade_data.p,
                     )
 
                 self._finnhub.connect_websocket(on_trade)
@@ -0,0 +1,66 @@
+"""
+Risk Service - checagens de risco vetorizadas.
+
+Implementei este serviço para avaliar drawdown e stop loss sobre arrays inteiros.
+Decidi usar ufuncs NumPy (cumulative max, where) em vez de loops por tick em Python.
+"""
+
+import numpy as np
+
+
+class RiskService:
+    """
+    Service para checagens de risco de live trading.
+
+    Implementei os limites como estado do serviço para que cada conta/estratégia
+    tenha sua própria configuração de risco.
+    """
+
+    def __init__(self, max_drawdown: float = 0.10, stop_loss_threshold: float = 0.02):
+        """
+        Construtor com limites de risco.
+
+        Args:
+            max_drawdown: Drawdown máximo permitido (ex: 0.10 para 10%)
+            stop_loss_threshold: Perda máxima relativa à entrada (ex: 0.02 para 2%)
+        """
+        self._max_drawdown = max_drawdown
+        self._stop_loss_threshold = stop_loss_threshold
+
+    def check_drawdown(self, equity_curve: np.ndarray) -> int:
+        """
+        Encontro o primeiro índice em que o drawdown ultrapassa o limite.
+
+        Implementei com high-water mark via np.maximum.accumulate em uma única passada.
+        Decidi tratar high-water mark <= 0 como limite atingido: sem capital positivo
+        o drawdown não é definido e não há mais o que arriscar.
+
+        Args:
+            equity_curve: Curva de equity
+
+        Returns:
+            Índice do primeiro tick que dispara o limite, ou -1 se nunca dispara
+        """
+        equity = np.asarray(equity_curve, dtype=np.float64)
+        if equity.size == 0:
+            return -1
+
+        highwater = np.maximum.accumulate(equity)
+        drawdown = np.full_like(equity, -np.inf)
+        np.divide(equity - highwater, highwater, out=drawdown, where=highwater > 0)
+        breached = drawdown < -self._max_drawdown
+        trip_idx = int(np.argmax(breached))
+        return trip_idx if breached[trip_idx] else -1
+
+    def check_stop_loss(self, pnl: np.ndarray, entry: np.ndarray) -> np.ndarray:
+        """
+        Encontro as posições cujo P&L ultrapassou o stop loss.
+
+        Args:
+            pnl: P&L por posição
+            entry: Valor de entrada por posição
+
+        Returns:
+            Índices das posições que devem ser fechadas
+        """
+        return np.where(np.asarray(pnl) < -self._stop_loss_threshold * np.asarray(entry))[0]
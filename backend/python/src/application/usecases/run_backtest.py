@@ -9,6 +9,9 @@ from datetime import datetime
 from typing import List
 from uuid import UUID
 
+import numpy as np
+import pandas as pd
+
 from domain.entities.strategy import Strategy
 from domain.entities.backtest import Backtest
 from domain.value_objects.symbol import Symbol
@@ -20,6 +23,43 @@ from infrastructure.telemetry.prometheus_metrics import get_metrics
 from infrastructure.telemetry.loki_logger import get_logger
 from infrastructure.telemetry.tempo_tracer import get_tracer
 
+# Scan de preços compilado com Numba (opcional)
+# Decidi cair para um decorator no-op sem numba: o mesmo loop roda em Python puro
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        def decorator(fn):
+            return fn
+        return decorator
+
+
+# Códigos de status do scan de preços
+PRICES_OK = 0
+PRICES_NAN = 1
+PRICES_NEGATIVE = 2
+
+
+@njit(cache=True)
+def _scan_prices(prices: np.ndarray, allow_nan: bool) -> int:
+    """
+    Varro os preços em um único loop e devolvo o primeiro problema encontrado.
+
+    Implementei como kernel sobre o ndarray float64 para evitar scans do pandas.
+    """
+    for i in range(prices.shape[0]):
+        price = prices[i]
+        if price != price:  # NaN
+            if allow_nan:
+                continue
+            return PRICES_NAN
+        if price < 0.0:
+            return PRICES_NEGATIVE
+    return PRICES_OK
+
 
 class RunBacktestUseCase:
     """
@@ -49,6 +89,32 @@ class RunBacktestUseCase:
         self._logger = get_logger()
         self._tracer = get_tracer()
 
+    @staticmethod
+    def validate_market_data(
+        df: pd.DataFrame, min_days: int = 30, allow_nan: bool = False
+    ) -> None:
+        """
+        Valido market data antes de enviar ao engine.
+
+        Decidi exigir no mínimo 30 barras e rejeitar NaN/preços negativos em close.
+
+        Args:
+            df: DataFrame com coluna close
+            min_days: Número mínimo de barras
+            allow_nan: Se True, ignora NaN em close
+
+        Raises:
+            ValueError: Se os dados forem insuficientes ou inválidos
+        """
+        if len(df) < min_days:
+            raise ValueError(f"Insufficient data points: {len(df)} < {min_days}")
+
+        status = _scan_prices(df["close"].to_numpy(dtype=np.float64, copy=False), allow_nan)
+        if status == PRICES_NAN:
+            raise ValueError("Missing data detected in close prices")
+        if status == PRICES_NEGATIVE:
+            raise ValueError("Invalid price data: negative close prices")
+
     def execute(
         self,
         strategy_id: UUID,
@@ -62,7 +128,7 @@ class RunBacktestUseCase:
 
         Implementei fluxo completo:
         1. Busco estratégia
-        2. Fetch market data
+        2. Fetch e validação de market data
         3. Executo C++ engine
         4. Persisto resultados
 
@@ -75,6 +141,9 @@ class RunBacktestUseCase:
 
         Returns:
             Backtest entity com resultados
+
+        Raises:
+            ValueError: Se a estratégia não existir ou o market data for inválido
         """
         with self._tracer.start_span("run_backtest", strategy_id=str(strategy_id)):
             # 1. Busco estratégia
@@ -108,6 +177,10 @@ class RunBacktestUseCase:
                     bars = self._market_data_service.fetch_historical(
                         symbol, time_range, interval="1d"
                     )
+                    # Valido cada símbolo antes de enviar ao engine
+                    self.validate_market_data(
+                        pd.DataFrame({"close": [bar.close for bar in bars]})
+                    )
                     all_market_data.extend(bars)
 
                 self._logger.info(f"Fetched {len(all_market_data)} bars")
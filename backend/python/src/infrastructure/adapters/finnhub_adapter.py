@@ -14,6 +14,7 @@ import time
 from typing import Callable, List, Optional
 from datetime import datetime
 
+import msgspec
 import websocket
 from finnhub import Client as FinnhubClient
 
@@ -22,6 +23,31 @@ from domain.value_objects.symbol import Symbol
 from domain.repositories.market_data_repository import MarketDataBar, MarketDataAPIError
 
 
+class FinnhubTrade(msgspec.Struct, gc=False):
+    """
+    Trade real-time da Finnhub.
+
+    Decidi usar msgspec.Struct para decodificar direto em slots fixos,
+    sem materializar dict por trade.
+    """
+
+    s: str
+    p: float
+    v: float
+    t: int
+
+
+class FinnhubMessage(msgspec.Struct, gc=False):
+    """Mensagem do WebSocket da Finnhub (trade, ping, etc)."""
+
+    type: str
+    data: List[FinnhubTrade] = []
+
+
+# Decoder reutilizado por todas as mensagens
+_message_decoder = msgspec.json.Decoder(FinnhubMessage)
+
+
 class FinnhubAdapter:
     """
     Adapter para Finnhub API (WebSocket real-time).
@@ -103,7 +129,7 @@ class FinnhubAdapter:
             raise MarketDataAPIError("Finnhub", f"Failed to fetch candles: {e}")
 
     def connect_websocket(
-        self, on_trade_callback: Callable[[dict], None]
+        self, on_trade_callback: Callable[[FinnhubTrade], None]
     ) -> None:
         """
         Conecto ao WebSocket da Finnhub para dados real-time.
@@ -121,9 +147,9 @@ class FinnhubAdapter:
 
             def on_message(ws, message):
                 """Callback quando mensagem é recebida."""
-                data = json.loads(message)
-                if data["type"] == "trade":
-                    for trade in data["data"]:
+                data = _message_decoder.decode(message)
+                if data.type == "trade":
+                    for trade in data.data:
                         on_trade_callback(trade)
 
             def on_error(ws, error):
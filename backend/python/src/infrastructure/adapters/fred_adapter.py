@@ -21,12 +21,20 @@ class FredAdapter:
     Implementei acesso a dados macroeconômicos do Federal Reserve.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+    ):
         """
         Construtor.
 
+        Decidi aceitar requests.Session injetada para reaproveitar o pool de
+        conexões entre adapters em vez de abrir conexão nova a cada chamada.
+
         Args:
             api_key: API key do FRED
+            session: Session HTTP compartilhada (opcional)
         """
         from config.settings import Settings
 
@@ -35,6 +43,7 @@ class FredAdapter:
         self.base_url = "https://api.stlouisfed.org/fred"
         self._logger = LokiLogger()
         self._timeout = 30
+        self._session = session or requests.Session()
 
     def get_series(
         self,
@@ -76,7 +85,7 @@ class FredAdapter:
                 extra={"series": series_id, "provider": "fred"},
             )
 
-            response = requests.get(url, params=params, timeout=self._timeout)
+            response = self._session.get(url, params=params, timeout=self._timeout)
             response.raise_for_status()
 
             data = response.json()
@@ -115,7 +124,7 @@ class FredAdapter:
                 "file_type": "json",
             }
 
-            response = requests.get(url, params=params, timeout=self._timeout)
+            response = self._session.get(url, params=params, timeout=self._timeout)
             response.raise_for_status()
 
             data = response.json()
@@ -151,7 +160,7 @@ class FredAdapter:
                 "limit": limit,
             }
 
-            response = requests.get(url, params=params, timeout=self._timeout)
+            response = self._session.get(url, params=params, timeout=self._timeout)
             response.raise_for_status()
 
             data = response.json()
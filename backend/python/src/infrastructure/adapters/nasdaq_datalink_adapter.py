@@ -21,12 +21,20 @@ class NasdaqDataLinkAdapter:
     Implementei acesso a datasets históricos de alta qualidade.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+    ):
         """
         Construtor.
 
+        Decidi aceitar requests.Session injetada para reaproveitar o pool de
+        conexões entre adapters em vez de abrir conexão nova a cada chamada.
+
         Args:
             api_key: API key do Nasdaq Data Link
+            session: Session HTTP compartilhada (opcional)
         """
         from config.settings import Settings
 
@@ -35,6 +43,7 @@ class NasdaqDataLinkAdapter:
         self.base_url = "https://data.nasdaq.com/api/v3"
         self._logger = LokiLogger()
         self._timeout = 30
+        self._session = session or requests.Session()
 
     def get_dataset(
         self,
@@ -72,7 +81,7 @@ class NasdaqDataLinkAdapter:
                 extra={"dataset": dataset_code, "provider": "nasdaq_datalink"},
             )
 
-            response = requests.get(url, params=params, timeout=self._timeout)
+            response = self._session.get(url, params=params, timeout=self._timeout)
             response.raise_for_status()
 
             data = response.json()
@@ -135,7 +144,7 @@ class NasdaqDataLinkAdapter:
             if end_date:
                 params["date.lte"] = end_date.strftime("%Y-%m-%d")
 
-            response = requests.get(url, params=params, timeout=self._timeout)
+            response = self._session.get(url, params=params, timeout=self._timeout)
             response.raise_for_status()
 
             data = response.json()
@@ -180,7 +189,7 @@ class NasdaqDataLinkAdapter:
                 "per_page": per_page,
             }
 
-            response = requests.get(url, params=params, timeout=self._timeout)
+            response = self._session.get(url, params=params, timeout=self._timeout)
             response.raise_for_status()
 
             data = response.json()
@@ -9,9 +9,11 @@ Referências:
 - SQLAlchemy ORM: https://docs.sqlalchemy.org/en/20/orm/
 """
 
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 from uuid import UUID
 
+from sqlalchemy import bindparam, inspect, select
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -26,6 +28,39 @@ from infrastructure.database.models import Strategy as StrategyModel
 from infrastructure.database.postgres_client import PostgresClient
 
 
+class _StrategyBatch:
+    """
+    Proxy de escrita que acumula operações em uma única session.
+
+    Implementei para StrategyRepositoryImpl.batch(): nada é enviado ao banco
+    até o flush/commit único na saída do context manager.
+    """
+
+    def __init__(self, repository: "StrategyRepositoryImpl", session: Session):
+        self._repository = repository
+        self._session = session
+        self.names: List[str] = []
+
+    def create(self, strategy: StrategyEntity) -> StrategyEntity:
+        """Enfileiro INSERT da estratégia."""
+        self._session.add(self._repository._entity_to_model(strategy))
+        self.names.append(strategy.name)
+        return strategy
+
+    def update(self, strategy: StrategyEntity) -> StrategyEntity:
+        """Enfileiro UPDATE da estratégia (merge pelo ID)."""
+        self._session.merge(self._repository._entity_to_model(strategy))
+        return strategy
+
+    def delete(self, strategy_id: UUID) -> bool:
+        """Enfileiro DELETE da estratégia, se existir."""
+        model = self._session.get(StrategyModel, strategy_id)
+        if model is None:
+            return False
+        self._session.delete(model)
+        return True
+
+
 class StrategyRepositoryImpl(StrategyRepository):
     """
     Implementação PostgreSQL do StrategyRepository.
@@ -46,6 +81,12 @@ class StrategyRepositoryImpl(StrategyRepository):
         """
         self._client = postgres_client
 
+        # Pré-compilo o SELECT por ID uma vez: SQLAlchemy reaproveita o compiled_cache
+        # e o PostgreSQL passa a usar plano genérico após execuções repetidas
+        self._find_by_id_stmt = select(StrategyModel).where(
+            StrategyModel.id == bindparam("id")
+        )
+
     def _entity_to_model(self, entity: StrategyEntity) -> StrategyModel:
         """
         Converto domain entity para ORM model.
@@ -69,6 +110,25 @@ class StrategyRepositoryImpl(StrategyRepository):
             updated_at=entity.updated_at,
         )
 
+    def _entity_to_mapping(self, entity: StrategyEntity) -> Dict[str, Any]:
+        """
+        Converto domain entity para dict de colunas (bulk insert).
+
+        Derivo as chaves das colunas do ORM model a partir de _entity_to_model,
+        para que o mapeamento entity → tabela exista em um único lugar.
+
+        Args:
+            entity: Strategy entity
+
+        Returns:
+            Dict coluna → valor
+        """
+        model = self._entity_to_model(entity)
+        return {
+            attr.key: getattr(model, attr.key)
+            for attr in inspect(StrategyModel).column_attrs
+        }
+
     def _model_to_entity(self, model: StrategyModel) -> StrategyEntity:
         """
         Converto ORM model para domain entity.
@@ -136,6 +196,90 @@ class StrategyRepositoryImpl(StrategyRepository):
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to save strategy: {e}")
 
+    def create_many(
+        self,
+        strategies: List[StrategyEntity],
+        session: Optional[Session] = None,
+    ) -> List[StrategyEntity]:
+        """
+        Persisto várias estratégias em um único INSERT.
+
+        Implementei com bulk_insert_mappings para pular o unit-of-work do ORM
+        e emitir um INSERT multi-VALUES em vez de add + flush por registro.
+        Assim como em batch(), com a session do chamador apenas faço o flush.
+
+        Args:
+            strategies: Estratégias novas a persistir
+            session: Session do chamador (opcional)
+
+        Returns:
+            As mesmas estratégias, já persistidas
+
+        Raises:
+            DuplicateStrategyError: Se algum nome já existe
+            RepositoryError: Se persistência falhar
+        """
+        payload = [self._entity_to_mapping(strategy) for strategy in strategies]
+
+        try:
+            with self._session_scope(session) as active:
+                active.bulk_insert_mappings(StrategyModel, payload)
+                active.flush()
+                return list(strategies)
+
+        except IntegrityError as e:
+            if "name" in str(e.orig):
+                raise DuplicateStrategyError(", ".join(s.name for s in strategies))
+            raise RepositoryError(f"Database integrity error: {e}")
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Failed to save strategies: {e}")
+
+    @contextmanager
+    def batch(self, session: Optional[Session] = None) -> Iterator[_StrategyBatch]:
+        """
+        Agrupo várias escritas em uma única transação.
+
+        Implementei com autoflush desligado: create/update/delete só são
+        enviados no flush final, e get_session faz um único commit na saída.
+        Se o chamador passar a própria session, apenas faço o flush: o commit
+        (ou rollback) fica com quem é dono da transação.
+
+        Uso:
+            with repository.batch() as batch:
+                batch.create(s1)
+                batch.create(s2)
+
+        Args:
+            session: Session do chamador (opcional)
+
+        Raises:
+            DuplicateStrategyError: Se algum nome já existe
+            RepositoryError: Se persistência falhar
+        """
+        batch = None
+        try:
+            with self._session_scope(session) as active:
+                batch = _StrategyBatch(self, active)
+                with active.no_autoflush:
+                    yield batch
+                active.flush()
+
+        except IntegrityError as e:
+            if "name" in str(e.orig):
+                raise DuplicateStrategyError(", ".join(batch.names) if batch else "")
+            raise RepositoryError(f"Database integrity error: {e}")
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Failed to write strategy batch: {e}")
+
+    @contextmanager
+    def _session_scope(self, session: Optional[Session]) -> Iterator[Session]:
+        """Uso a session do chamador, ou abro uma do PostgresClient com commit na saída."""
+        if session is not None:
+            yield session
+            return
+        with self._client.get_session() as owned:
+            yield owned
+
     def find_by_id(self, strategy_id: UUID) -> Optional[StrategyEntity]:
         """
         Busco estratégia por ID.
@@ -151,7 +295,9 @@ class StrategyRepositoryImpl(StrategyRepository):
         """
         try:
             with self._client.get_session() as session:
-                model = session.query(StrategyModel).filter_by(id=strategy_id).first()
+                model = session.execute(
+                    self._find_by_id_stmt, {"id": strategy_id}
+                ).scalar_one_or_none()
                 return self._model_to_entity(model) if model else None
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to find strategy by id: {e}")
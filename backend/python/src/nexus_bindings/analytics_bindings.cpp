@@ -6,6 +6,12 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/functional.h>
+#include <pybind11/numpy.h>
+
+#include <cstdint>
+#include <stdexcept>
+#include <utility>
+#include <vector>
 
 #include "analytics/performance_analyzer.h"
 #include "analytics/performance_metrics.h"
@@ -19,6 +25,17 @@ namespace py = pybind11;
 using namespace nexus::analytics;
 using namespace nexus::core;
 
+// Implementei este helper para devolver std::vector como ndarray sem cópia
+// Decidi mover o vetor para o heap e deixar um py::capsule liberar a memória junto com o array
+template <typename T>
+py::array_t<T> as_pyarray(std::vector<T>&& values) {
+    auto* owned = new std::vector<T>(std::move(values));
+    py::capsule free_when_done(owned, [](void* p) {
+        delete static_cast<std::vector<T>*>(p);
+    });
+    return py::array_t<T>(owned->size(), owned->data(), free_when_done);
+}
+
 PYBIND11_MODULE(nexus_analytics, m) {
     m.doc() = R"doc(
         Nexus Analytics Python Bindings
@@ -97,7 +114,31 @@ PYBIND11_MODULE(nexus_analytics, m) {
              "Registra latência de operação")
         .def("record_event_latency", &PerformanceAnalyzer::record_event_latency,
              py::arg("start_event"), py::arg("end_event"), py::arg("operation_name"),
-             "Registra latência entre eventos");
+             "Registra latência entre eventos")
+        .def("add_trades_batch",
+             [](PerformanceAnalyzer& self,
+                py::array_t<double, py::array::c_style | py::array::forcecast> pnls,
+                py::array_t<int64_t, py::array::c_style | py::array::forcecast> entry_times,
+                py::array_t<int64_t, py::array::c_style | py::array::forcecast> exit_times) {
+                 // Decidi receber colunas paralelas (SoA) em vez de um dict por trade
+                 const auto count = static_cast<size_t>(pnls.size());
+                 if (static_cast<size_t>(entry_times.size()) != count ||
+                     static_cast<size_t>(exit_times.size()) != count) {
+                     throw std::invalid_argument("pnls, entry_times and exit_times must have the same length");
+                 }
+                 self.add_trades_batch(pnls.data(), entry_times.data(), exit_times.data(), count);
+             },
+             py::arg("pnls"), py::arg("entry_times"), py::arg("exit_times"),
+             R"doc(
+                Adiciona batch de trades fechados em uma única chamada.
+
+                Args:
+                    pnls: np.ndarray float64 com P&L de cada trade
+                    entry_times: np.ndarray int64 com timestamps de entrada
+                    exit_times: np.ndarray int64 com timestamps de saída
+             )doc")
+        .def("reset", &PerformanceAnalyzer::reset,
+             "Limpa equity curve, trades e latências mantendo a capacidade alocada");
 
     // ========== Monte Carlo Config ==========
 
@@ -160,12 +201,31 @@ PYBIND11_MODULE(nexus_analytics, m) {
         .def("run_simulation", &MonteCarloSimulator::run_simulation,
              py::arg("simulation_func"), py::arg("initial_parameters"),
              "Executa simulação Monte Carlo com função customizada")
-        .def("simulate_portfolio", &MonteCarloSimulator::simulate_portfolio,
+        .def("simulate_portfolio",
+             [](MonteCarloSimulator& self,
+                const std::vector<double>& returns,
+                const std::vector<double>& volatilities,
+                const std::vector<std::vector<double>>& correlation_matrix,
+                double time_horizon) {
+                 std::vector<double> values;
+                 {
+                     py::gil_scoped_release release;
+                     values = self.simulate_portfolio(
+                         returns, volatilities, correlation_matrix, time_horizon);
+                 }
+                 return as_pyarray(std::move(values));
+             },
              py::arg("returns"),
              py::arg("volatilities"),
              py::arg("correlation_matrix"),
              py::arg("time_horizon") = 1.0,
-             "Simula portfólio com retornos e volatilidades")
+             R"doc(
+                Simula portfólio com retornos e volatilidades.
+
+                Retorna ndarray float64 (um valor por simulação) que aponta direto
+                para o buffer C++, sem cópia nem cast elemento a elemento.
+                O GIL fica liberado durante a simulação.
+             )doc")
         .def("calculate_var", &MonteCarloSimulator::calculate_var,
              py::arg("portfolio_returns"),
              py::arg("confidence_level") = 0.95,
@@ -11,7 +11,14 @@
 #include <pybind11/stl.h>
 #include <pybind11/chrono.h>
 #include <pybind11/functional.h>
+#include <pybind11/numpy.h>
 
+#include <chrono>
+#include <cstdint>
+#include <stdexcept>
+#include <vector>
+
+#include "analytics/performance_analyzer.h"
 #include "core/backtest_engine.h"
 #include "core/event_queue.h"
 #include "core/event_types.h"
@@ -33,6 +40,90 @@ using namespace nexus::position;
 using namespace nexus::execution;
 using namespace nexus::strategies;
 
+using F64Array = py::array_t<double, py::array::c_style | py::array::forcecast>;
+using I64Array = py::array_t<int64_t, py::array::c_style | py::array::forcecast>;
+
+// Implementei este helper para rodar um backtest long/flat simplificado direto sobre buffers OHLCV
+// Decidi ler os arrays NumPy por ponteiro (sem dicts intermediários) e liberar o GIL no loop
+// Não passa pelo BacktestEngine: sem comissão, slippage ou PositionManager, por isso é função livre
+py::dict run_long_flat_backtest(
+    AbstractStrategy& strategy,
+    I64Array timestamps,
+    F64Array open,
+    F64Array high,
+    F64Array low,
+    F64Array close,
+    I64Array volume,
+    double initial_capital) {
+    const auto n = close.shape(0);
+    if (timestamps.shape(0) != n || open.shape(0) != n || high.shape(0) != n ||
+        low.shape(0) != n || volume.shape(0) != n) {
+        throw std::invalid_argument("OHLCV arrays must have the same length");
+    }
+
+    auto ts = timestamps.unchecked<1>();
+    auto o = open.unchecked<1>();
+    auto h = high.unchecked<1>();
+    auto l = low.unchecked<1>();
+    auto c = close.unchecked<1>();
+    auto v = volume.unchecked<1>();
+
+    std::vector<double> equity_curve;
+    std::vector<TradeExecutionEvent> trade_history;
+    nexus::analytics::PerformanceMetrics metrics;
+
+    {
+        py::gil_scoped_release release;
+        EventPool pool;
+        MarketDataEvent event;
+        double cash = initial_capital;
+        double quantity = 0.0;
+        equity_curve.reserve(static_cast<size_t>(n));
+
+        for (py::ssize_t i = 0; i < n; ++i) {
+            event.timestamp = std::chrono::system_clock::time_point(std::chrono::nanoseconds(ts(i)));
+            event.open = o(i);
+            event.high = h(i);
+            event.low = l(i);
+            event.close = c(i);
+            event.volume = static_cast<long>(v(i));
+            strategy.on_market_data(event);
+
+            Event* generated = strategy.generate_signal(pool);
+            if (generated) {
+                auto* signal = static_cast<TradingSignalEvent*>(generated);
+                const bool buy = signal->signal == TradingSignalEvent::SignalType::BUY && quantity == 0.0;
+                const bool sell = signal->signal == TradingSignalEvent::SignalType::SELL && quantity > 0.0;
+                if (buy || sell) {
+                    TradeExecutionEvent fill;
+                    fill.timestamp = event.timestamp;
+                    fill.price = c(i);
+                    fill.commission = 0.0;
+                    fill.is_buy = buy;
+                    fill.quantity = buy ? cash / c(i) : quantity;
+                    cash += buy ? -fill.quantity * c(i) : fill.quantity * c(i);
+                    quantity = buy ? fill.quantity : 0.0;
+                    trade_history.push_back(fill);
+                }
+                pool.destroy_event(generated);
+            }
+
+            equity_curve.push_back(cash + quantity * c(i));
+        }
+
+        nexus::analytics::PerformanceAnalyzer analyzer(initial_capital, equity_curve, trade_history);
+        metrics = analyzer.calculate_metrics();
+    }
+
+    py::dict results;
+    results["total_return"] = metrics.total_return;
+    results["sharpe_ratio"] = metrics.sharpe_ratio;
+    results["max_drawdown"] = metrics.max_drawdown;
+    results["total_trades"] = static_cast<int>(trade_history.size());
+    results["final_equity"] = equity_curve.empty() ? initial_capital : equity_curve.back();
+    return results;
+}
+
 // Implementei este módulo para expor o core do engine C++ ao Python
 PYBIND11_MODULE(nexus_core, m) {
     m.doc() = R"doc(
@@ -241,6 +332,28 @@ PYBIND11_MODULE(nexus_core, m) {
         .def("warm_caches", &BacktestEngine::warm_caches,
              "Pré-aquece caches para melhor performance inicial");
 
+    m.def("run_long_flat_backtest", &run_long_flat_backtest,
+          py::arg("strategy"),
+          py::arg("timestamps"),
+          py::arg("open"),
+          py::arg("high"),
+          py::arg("low"),
+          py::arg("close"),
+          py::arg("volume"),
+          py::arg("initial_capital") = 100000.0,
+          R"doc(
+            Executa backtest long/flat simplificado direto sobre arrays NumPy OHLCV.
+
+            Decidi aceitar buffers contíguos (timestamps/volume int64, preços float64)
+            para evitar materializar um dict Python por barra.
+
+            Não usa o BacktestEngine: executa no close sem comissão, slippage ou
+            PositionManager. Para resultados do engine real use BacktestEngine.run().
+
+            Retorna dict com total_return, sharpe_ratio, max_drawdown, total_trades
+            e final_equity.
+          )doc");
+
     // ========== High-Resolution Clock ==========
 
     py::class_<HighResolutionClock>(m, "HighResolutionClock",
@@ -266,6 +379,21 @@ PYBIND11_MODULE(nexus_core, m) {
         .def("record_latency", &LatencyTracker::record_latency,
              py::arg("latency_ns"),
              "Registra latência em nanossegundos")
+        .def("record", &LatencyTracker::record_latency,
+             py::arg("latency_ns"),
+             "Alias curto de record_latency para loops Python")
+        .def("record_many",
+             [](LatencyTracker& self,
+                py::array_t<int64_t, py::array::c_style | py::array::forcecast> latencies_ns) {
+                 // Decidi registrar o batch inteiro em C++ sem GIL (uma travessia em vez de N)
+                 auto buf = latencies_ns.unchecked<1>();
+                 py::gil_scoped_release release;
+                 for (py::ssize_t i = 0; i < buf.shape(0); ++i) {
+                     self.record_latency(buf(i));
+                 }
+             },
+             py::arg("latencies_ns"),
+             "Registra array NumPy int64 de latências em nanossegundos")
         .def("get_min", &LatencyTracker::get_min, "Retorna latência mínima")
         .def("get_max", &LatencyTracker::get_max, "Retorna latência máxima")
         .def("get_avg", &LatencyTracker::get_avg, "Retorna latência média")
@@ -6,6 +6,10 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/chrono.h>
+#include <pybind11/numpy.h>
+
+#include <cstdint>
+#include <stdexcept>
 
 #include "execution/execution_simulator.h"
 #include "execution/lock_free_order_book.h"
@@ -96,6 +100,8 @@ PYBIND11_MODULE(nexus_execution, m) {
              "Retorna estatísticas de execução")
         .def("reset_statistics", &ExecutionSimulator::reset_statistics,
              "Reseta estatísticas")
+        .def("reset", &ExecutionSimulator::reset_statistics,
+             "Reseta estado para reuso da mesma instância entre testes")
         .def("get_config", &ExecutionSimulator::get_config,
              py::return_value_policy::reference_internal,
              "Retorna configuração atual")
@@ -136,6 +142,39 @@ PYBIND11_MODULE(nexus_execution, m) {
              py::arg("symbol"), py::arg("tick_size") = 0.01)
         .def("add_order", &LockFreeOrderBook::add_order,
              "Adiciona ordem ao book")
+        .def("add_orders",
+             [](LockFreeOrderBook& self,
+                py::array_t<double, py::array::c_style | py::array::forcecast> prices,
+                py::array_t<double, py::array::c_style | py::array::forcecast> quantities,
+                py::array_t<uint8_t, py::array::c_style | py::array::forcecast> sides,
+                py::array_t<uint64_t, py::array::c_style | py::array::forcecast> order_ids) {
+                 const auto n = prices.shape(0);
+                 if (quantities.shape(0) != n || sides.shape(0) != n || order_ids.shape(0) != n) {
+                     throw std::invalid_argument("prices, quantities, sides and order_ids must have the same length");
+                 }
+
+                 auto p = prices.unchecked<1>();
+                 auto q = quantities.unchecked<1>();
+                 auto s = sides.unchecked<1>();
+                 auto id = order_ids.unchecked<1>();
+
+                 size_t accepted = 0;
+                 py::gil_scoped_release release;
+                 for (py::ssize_t i = 0; i < n; ++i) {
+                     const auto side = s(i) ? Order::Side::SELL : Order::Side::BUY;
+                     accepted += self.add_order(id(i), side, p(i), q(i)) ? 1 : 0;
+                 }
+                 return accepted;
+             },
+             py::arg("prices"), py::arg("quantities"), py::arg("sides"), py::arg("order_ids"),
+             R"doc(
+                Adiciona um lote de ordens em uma única chamada.
+
+                Decidi receber arrays NumPy em SoA (sides: 0 = BUY, 1 = SELL) e liberar
+                o GIL no loop para evitar o custo de kwargs por ordem.
+
+                Retorna quantas ordens foram aceitas pelo book.
+             )doc")
         .def("cancel_order", &LockFreeOrderBook::cancel_order,
              "Cancela ordem do book")
         .def("match_order", &LockFreeOrderBook::match_order,
@@ -65,7 +65,8 @@ PYBIND11_MODULE(nexus_optimization, m) {
              "Construtor com estratégia template")
         .def("grid_search", &StrategyOptimizer::grid_search,
              py::arg("parameter_grid"),
-             "Executa grid search exaustivo")
+             py::call_guard<py::gil_scoped_release>(),
+             "Executa grid search exaustivo em paralelo (GIL liberado)")
         .def("get_best_result", &StrategyOptimizer::get_best_result,
              "Retorna melhor resultado da última otimização");
 
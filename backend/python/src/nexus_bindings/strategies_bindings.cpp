@@ -10,6 +10,10 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/functional.h>
+#include <pybind11/numpy.h>
+
+#include <cstdint>
+#include <stdexcept>
 
 #include "strategies/abstract_strategy.h"
 #include "strategies/sma_strategy.h"
@@ -25,6 +29,65 @@ namespace py = pybind11;
 using namespace nexus::strategies;
 using namespace nexus::core;
 
+// Implementei este helper para converter o evento gerado pela estratégia em sinal inteiro
+// Retorno: 1 = BUY, -1 = SELL, 0 = sem sinal
+inline int8_t consume_signal(EventPool& pool, Event* generated) {
+    int8_t signal = 0;
+    if (generated) {
+        auto* trading_signal = static_cast<TradingSignalEvent*>(generated);
+        if (trading_signal->signal == TradingSignalEvent::SignalType::BUY) {
+            signal = 1;
+        } else if (trading_signal->signal == TradingSignalEvent::SignalType::SELL) {
+            signal = -1;
+        }
+        pool.destroy_event(generated);
+    }
+    return signal;
+}
+
+// Implementei este helper para o caminho escalar (um preço por chamada)
+// Decidi reaproveitar EventPool e MarketDataEvent thread_local para não alocar a cada chamada
+template <typename Strategy>
+int8_t on_data(Strategy& self, double price) {
+    thread_local EventPool pool;
+    thread_local MarketDataEvent event;
+
+    event.open = event.high = event.low = event.close = price;
+    self.on_market_data(event);
+    return consume_signal(pool, self.generate_signal(pool));
+}
+
+// Implementei este helper para processar um array inteiro de preços em uma única chamada
+// Decidi liberar o GIL e iterar direto no buffer para evitar N travessias Python → C++
+template <typename Strategy>
+py::array_t<int8_t> on_data_batch(
+    Strategy& self,
+    py::array_t<double, py::array::c_style | py::array::forcecast> prices) {
+    py::buffer_info buf = prices.request();
+    if (buf.ndim != 1) {
+        throw std::invalid_argument("prices must be a 1-dimensional array");
+    }
+
+    const auto n = buf.shape[0];
+    const double* ptr = static_cast<const double*>(buf.ptr);
+    py::array_t<int8_t> signals(n);
+    int8_t* out = signals.mutable_data();
+
+    {
+        py::gil_scoped_release release;
+        EventPool pool;
+        MarketDataEvent event;
+
+        for (py::ssize_t i = 0; i < n; ++i) {
+            event.open = event.high = event.low = event.close = ptr[i];
+            self.on_market_data(event);
+            out[i] = consume_signal(pool, self.generate_signal(pool));
+        }
+    }
+
+    return signals;
+}
+
 // Implementei este módulo para expor as estratégias de trading C++ ao Python
 PYBIND11_MODULE(nexus_strategies, m) {
     m.doc() = R"doc(
@@ -183,7 +246,19 @@ PYBIND11_MODULE(nexus_strategies, m) {
              "Construtor com janelas curta e longa")
         .def(py::init<const SmaCrossoverStrategy&>(),
              py::arg("other"),
-             "Copy constructor");
+             "Copy constructor")
+        .def("on_data", &on_data<SmaCrossoverStrategy>,
+             py::arg("price"),
+             "Processa um preço e retorna sinal (1 = BUY, -1 = SELL, 0 = nenhum)")
+        .def("on_data_batch", &on_data_batch<SmaCrossoverStrategy>,
+             py::arg("prices"),
+             R"doc(
+                Processa array de preços em uma única chamada.
+
+                Decidi aceitar NumPy float64 contíguo e liberar o GIL durante o loop.
+
+                Retorna array int8 com um sinal por preço (1 = BUY, -1 = SELL, 0 = nenhum).
+             )doc");
 
     // ========== MACD Strategy ==========
 
@@ -212,7 +287,19 @@ PYBIND11_MODULE(nexus_strategies, m) {
              "Construtor com períodos fast, slow e signal")
         .def(py::init<const MACDStrategy&>(),
              py::arg("other"),
-             "Copy constructor");
+             "Copy constructor")
+        .def("on_data", &on_data<MACDStrategy>,
+             py::arg("price"),
+             "Processa um preço e retorna sinal (1 = BUY, -1 = SELL, 0 = nenhum)")
+        .def("on_data_batch", &on_data_batch<MACDStrategy>,
+             py::arg("prices"),
+             R"doc(
+                Processa array de preços em uma única chamada.
+
+                Decidi aceitar NumPy float64 contíguo e liberar o GIL durante o loop.
+
+                Retorna array int8 com um sinal por preço (1 = BUY, -1 = SELL, 0 = nenhum).
+             )doc");
 
     // ========== RSI Strategy ==========
 
@@ -241,7 +328,19 @@ PYBIND11_MODULE(nexus_strategies, m) {
              "Construtor com período e thresholds")
         .def(py::init<const RSIStrategy&>(),
              py::arg("other"),
-             "Copy constructor");
+             "Copy constructor")
+        .def("on_data", &on_data<RSIStrategy>,
+             py::arg("price"),
+             "Processa um preço e retorna sinal (1 = BUY, -1 = SELL, 0 = nenhum)")
+        .def("on_data_batch", &on_data_batch<RSIStrategy>,
+             py::arg("prices"),
+             R"doc(
+                Processa array de preços em uma única chamada.
+
+                Decidi aceitar NumPy float64 contíguo e liberar o GIL durante o loop.
+
+                Retorna array int8 com um sinal por preço (1 = BUY, -1 = SELL, 0 = nenhum).
+             )doc");
 
     // Versão do módulo
     m.attr("__version__") = "0.7.0";
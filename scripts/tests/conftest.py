@@ -116,20 +116,22 @@ def sample_market_data() -> pd.DataFrame:
     Decidi criar 252 dias de trading (1 ano)
     """
     dates = pd.date_range('2024-01-01', periods=252, freq='B')
+    # Decidi usar default_rng (PCG64, sem o lock global do RandomState) com seed fixa por fixture
+    rng = np.random.default_rng(42)
 
     # Generate realistic price data with trend and noise
     base_price = 100.0
     trend = np.linspace(0, 10, 252)  # Uptrend
-    noise = np.random.normal(0, 2, 252)
+    noise = rng.normal(0, 2, 252)
     close_prices = base_price + trend + noise
 
     df = pd.DataFrame({
         'timestamp': dates,
-        'open': close_prices * np.random.uniform(0.98, 1.02, 252),
-        'high': close_prices * np.random.uniform(1.01, 1.05, 252),
-        'low': close_prices * np.random.uniform(0.95, 0.99, 252),
+        'open': close_prices * rng.uniform(0.98, 1.02, 252),
+        'high': close_prices * rng.uniform(1.01, 1.05, 252),
+        'low': close_prices * rng.uniform(0.95, 0.99, 252),
         'close': close_prices,
-        'volume': np.random.randint(1000000, 5000000, 252)
+        'volume': rng.integers(1000000, 5000000, 252)
     })
 
     return df
@@ -142,18 +144,19 @@ def sample_intraday_data() -> pd.DataFrame:
     """
     # 6.5 hours = 390 minutes (9:30 AM - 4:00 PM)
     timestamps = pd.date_range('2024-01-02 09:30', periods=390, freq='1min')
+    rng = np.random.default_rng(42)
 
     base_price = 100.0
-    noise = np.random.normal(0, 0.5, 390)
+    noise = rng.normal(0, 0.5, 390)
     close_prices = base_price + noise
 
     df = pd.DataFrame({
         'timestamp': timestamps,
-        'open': close_prices * np.random.uniform(0.999, 1.001, 390),
-        'high': close_prices * np.random.uniform(1.001, 1.003, 390),
-        'low': close_prices * np.random.uniform(0.997, 0.999, 390),
+        'open': close_prices * rng.uniform(0.999, 1.001, 390),
+        'high': close_prices * rng.uniform(1.001, 1.003, 390),
+        'low': close_prices * rng.uniform(0.997, 0.999, 390),
         'close': close_prices,
-        'volume': np.random.randint(1000, 10000, 390)
+        'volume': rng.integers(1000, 10000, 390)
     })
 
     return df
@@ -200,6 +203,39 @@ def sample_rsi_strategy() -> Strategy:
     )
 
 
+@pytest.fixture(scope="session")
+def _strategy_prototype() -> Strategy:
+    """
+    Implementei este fixture para validar uma única estratégia protótipo por sessão
+    """
+    return Strategy(
+        id=uuid4(),
+        name="Prototype Strategy",
+        strategy_type=StrategyType.SMA_CROSSOVER,
+        parameters=StrategyParameters(params={"fast_period": 50}),
+        is_active=True,
+        created_at=datetime.now()
+    )
+
+
+@pytest.fixture
+def strategy_factory(_strategy_prototype: Strategy):
+    """
+    Implementei este fixture para criar estratégias a partir do protótipo
+    Decidi usar model_copy(update=...) para id/created_at, gerados aqui e sempre válidos;
+    só os campos sobrescritos pelo chamador passam pela validação Pydantic
+    """
+    def make_strategy(**overrides) -> Strategy:
+        strategy = _strategy_prototype.model_copy(
+            update={"id": uuid4(), "created_at": datetime.now()}, deep=True
+        )
+        for field, value in overrides.items():
+            Strategy.__pydantic_validator__.validate_assignment(strategy, field, value)
+        return strategy
+
+    return make_strategy
+
+
 @pytest.fixture
 def sample_backtest(sample_strategy: Strategy) -> Backtest:
     """
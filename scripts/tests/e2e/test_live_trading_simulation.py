@@ -10,14 +10,12 @@ import time
 from datetime import datetime
 from typing import Dict, Any, List
 from unittest.mock import Mock, patch
-import websocket
 import json
+import numpy as np
 
-# Importações do projeto
-from backend.python.src.application.use_cases.live_trading import LiveTradingUseCase
-from backend.python.src.infrastructure.adapters.market_data.finnhub_adapter import FinnhubAdapter
-from backend.python.src.domain.entities.strategy import Strategy, StrategyType
-from backend.python.src.domain.value_objects import Symbol, StrategyParameters
+
+# Implementei batches de 64 ticks para amortizar overhead por chamada dos indicadores
+TICK_BATCH_SIZE = 64
 
 
 @pytest.mark.e2e
@@ -42,7 +40,13 @@ class TestLiveTradingSimulation:
     def live_trading_use_case(self):
         """
         Implementei este fixture para criar live trading use case
+        Decidi importar o projeto aqui dentro para manter barato o import em cada worker xdist
         """
+        from backend.python.src.application.use_cases.live_trading import LiveTradingUseCase
+        from backend.python.src.infrastructure.adapters.market_data.finnhub_adapter import FinnhubAdapter
+        from backend.python.src.domain.entities.strategy import Strategy, StrategyType
+        from backend.python.src.domain.value_objects import Symbol, StrategyParameters
+
         # TODO: Criar use case com dependências
         pytest.skip("Requires full dependency injection")
 
@@ -153,9 +157,38 @@ class TestLiveTradingPerformance:
         """
         Implementei este teste para validar HFT data stream
         Decidi testar com 1000 trades/second
-        """
-        # TODO: Implementar teste de HFT
-        pytest.skip("Requires high-frequency data simulation")
+        Decidi alimentar o on_message do FinnhubAdapter com frames no formato do WebSocket da Finnhub
+        """
+        from backend.python.src.infrastructure.adapters import finnhub_adapter
+        from backend.python.src.infrastructure.adapters.finnhub_adapter import FinnhubAdapter, FinnhubTrade
+
+        with patch.object(finnhub_adapter, "get_settings", return_value=Mock(finnhub_api_key="TEST_API_KEY")), \
+                patch.object(finnhub_adapter, "FinnhubClient"):
+            adapter = FinnhubAdapter()
+
+        received: List[FinnhubTrade] = []
+        adapter.connect_websocket(received.append)
+
+        # 10 frames com 100 trades cada (1000 trades/s) intercalados com pings, que não geram trades
+        frames = []
+        for batch in range(10):
+            frames.append(json.dumps({
+                "type": "trade",
+                "data": [
+                    {"s": "AAPL", "p": 189.0 + i * 0.01, "v": 100, "t": 1700000000000 + i}
+                    for i in range(batch * 100, (batch + 1) * 100)
+                ]
+            }).encode())
+            frames.append(b'{"type":"ping"}')
+
+        for frame in frames:
+            adapter._ws.on_message(adapter._ws, frame)
+
+        assert len(received) == 1000
+        assert all(isinstance(trade, FinnhubTrade) for trade in received)
+        assert [trade.t for trade in received] == list(range(1700000000000, 1700000001000))
+        assert received[-1].s == "AAPL"
+        assert received[-1].p == pytest.approx(189.0 + 999 * 0.01)
 
     def test_signal_generation_latency_under_1ms(self):
         """
@@ -194,16 +227,41 @@ class TestRiskManagement:
         Implementei este teste para validar stop loss
         Decidi que deve fechar position quando loss > 2%
         """
-        # TODO: Implementar teste de stop loss
-        pytest.skip("Requires stop loss mechanism")
+        from backend.python.src.application.services.risk_service import RiskService
+
+        risk_service = RiskService(stop_loss_threshold=0.02)
+        entry = np.full(5, 10_000.0)
+        pnl = np.array([150.0, -100.0, -250.0, -199.9, -1_000.0])
+
+        triggered = risk_service.check_stop_loss(pnl, entry)
+
+        np.testing.assert_array_equal(triggered, [2, 4])
 
     def test_stops_trading_when_max_drawdown_reached(self):
         """
         Implementei este teste para validar max drawdown
         Decidi que deve parar trading quando drawdown > 10%
         """
-        # TODO: Implementar teste de max drawdown
-        pytest.skip("Requires drawdown tracking")
+        from backend.python.src.application.services.risk_service import RiskService
+
+        risk_service = RiskService(max_drawdown=0.10)
+        rng = np.random.default_rng(42)
+        equity = rng.standard_normal(100_000).cumsum() * 1_000 + 1e6
+
+        trip_idx = risk_service.check_drawdown(equity)
+
+        # Referência escalar para validar a versão vetorizada
+        expected, highwater = -1, equity[0]
+        for i, value in enumerate(equity):
+            highwater = max(highwater, value)
+            if (value - highwater) / highwater < -0.10:
+                expected = i
+                break
+
+        assert trip_idx == expected
+
+        # Sem capital positivo o limite dispara no primeiro tick, sem dividir por zero
+        assert risk_service.check_drawdown(np.array([0.0, -5.0, 10.0])) == 0
 
 
 @pytest.mark.e2e
@@ -262,9 +320,36 @@ class TestMultiStrategyLiveTrading:
         """
         Implementei este teste para validar múltiplas strategies
         Decidi testar 3 strategies: SMA, RSI, MACD
-        """
-        # TODO: Implementar teste de multi-strategy
-        pytest.skip("Requires multi-strategy execution")
+        Decidi alimentar as strategies C++ em batches: o estado dos indicadores vive no objeto e atravessa os batches
+        """
+        nexus_strategies = pytest.importorskip("nexus_bindings.nexus_strategies")
+
+        def make_strategies():
+            return {
+                "sma": nexus_strategies.SmaCrossoverStrategy(short_window=20, long_window=50),
+                "rsi": nexus_strategies.RSIStrategy(period=14),
+                "macd": nexus_strategies.MACDStrategy(fast_period=12, slow_period=26, signal_period=9),
+            }
+
+        n_ticks = TICK_BATCH_SIZE * 100
+        rng = np.random.default_rng(42)
+        prices = 100.0 + np.cumsum(rng.normal(0.0, 0.05, n_ticks))
+
+        # Referência: cada strategy isolada consome o stream inteiro em uma chamada
+        expected = {name: strategy.on_data_batch(prices) for name, strategy in make_strategies().items()}
+
+        # Act - as 3 strategies consomem o mesmo stream intercalado em batches de 64 ticks
+        live = make_strategies()
+        batched: Dict[str, List[np.ndarray]] = {name: [] for name in live}
+        for start in range(0, n_ticks, TICK_BATCH_SIZE):
+            batch = prices[start:start + TICK_BATCH_SIZE]
+            for name, strategy in live.items():
+                batched[name].append(strategy.on_data_batch(batch))
+
+        # Assert - batching e intercalação não mudam nenhum sinal (estado carregado, sem interferência)
+        for name, signals in batched.items():
+            np.testing.assert_array_equal(np.concatenate(signals), expected[name])
+        assert any(np.any(signals != 0) for signals in expected.values())
 
     def test_strategies_share_market_data_stream(self):
         """
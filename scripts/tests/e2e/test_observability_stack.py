@@ -4,17 +4,139 @@ Implementei estes testes para validar stack completo de observabilidade
 Decidi testar: Prometheus metrics → Loki logs → Tempo traces → Grafana dashboards
 """
 
+import asyncio
 import pytest
+import pytest_asyncio
 import requests
+import aiohttp
+import httpx
+import orjson
+from tenacity import RetryError, retry, stop_after_delay, wait_exponential_jitter
 import time
-from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List
 import json
 
+if TYPE_CHECKING:
+    import hyperscan
 
+
+GRAFANA_URL = "http://localhost:3000"
+LOKI_URL = "http://localhost:3100"
+
+# Implementei este mapa com os endpoints de readiness de cada serviço do stack
+STACK_READY_ENDPOINTS = {
+    "prometheus": "http://localhost:9090/-/healthy",
+    "loki": f"{LOKI_URL}/ready",
+    "tempo": "http://localhost:3200/ready",
+    "grafana": f"{GRAFANA_URL}/api/health",
+}
+
+
+@retry(wait=wait_exponential_jitter(1, 10), stop=stop_after_delay(30))
+def _probe(url: str) -> None:
+    """
+    Implementei este probe com backoff exponencial para esperar o serviço subir
+    """
+    response = httpx.get(url, timeout=2)
+    response.raise_for_status()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def wait_stack():
+    """
+    Implementei este fixture para esperar o stack de observabilidade ficar pronto
+    Decidi pular uma única vez por sessão em vez de sondar conexão em cada teste
+    """
+    for name, url in STACK_READY_ENDPOINTS.items():
+        try:
+            _probe(url)
+        except RetryError:
+            pytest.skip(f"stack down: {name} not ready at {url}")
+
+
+# Implementei esta lista com os streams consultados no Loki em uma única rodada
+LOKI_STREAM_QUERIES = (
+    '{job="nexus-backend"}',
+    '{job="nexus-cpp"}',
+    '{job="nexus-frontend"}',
+)
+
+
+# Implementei este padrão para extrair trace_ids (32 hex) das linhas de log
+TRACE_ID_PATTERN = br'\btrace_id=([0-9a-f]{32})\b'
+
+
+@pytest.fixture(scope="session")
+def trace_id_db() -> "hyperscan.Database":
+    """
+    Implementei este fixture para compilar o filtro de trace_id uma vez por sessão
+    Decidi usar Hyperscan para escanear o body bruto sem backtracking do re
+    Decidi pular só os testes que dependem dele quando o hyperscan não está instalado
+    """
+    hyperscan = pytest.importorskip("hyperscan")
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[TRACE_ID_PATTERN],
+        ids=[1],
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST],
+    )
+    return db
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def loki():
+    """
+    Implementei este fixture para um client HTTP/2 compartilhado com o Loki
+    Decidi multiplexar todas as query_range em uma única conexão
+    """
+    async with httpx.AsyncClient(http2=True, base_url=LOKI_URL, timeout=5) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def grafana_session():
+    """
+    Implementei este fixture para compartilhar uma sessão HTTP com o Grafana
+    Decidi manter BasicAuth e keep-alive na sessão para evitar handshake a cada chamada
+    """
+    session = aiohttp.ClientSession(
+        base_url=GRAFANA_URL,
+        auth=aiohttp.BasicAuth("admin", "admin"),  # Default credentials
+        connector=aiohttp.TCPConnector(limit=0, force_close=False),
+        timeout=aiohttp.ClientTimeout(total=5),
+    )
+    yield session
+    await session.close()
+
+
+async def _get_json(session: aiohttp.ClientSession, path: str) -> Any:
+    """
+    Implementei este helper para GET + decode JSON via orjson
+    """
+    async with session.get(path) as response:
+        assert response.status == 200
+        return await response.json(loads=orjson.loads)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def grafana_provisioning(grafana_session: aiohttp.ClientSession) -> Dict[str, Any]:
+    """
+    Implementei este fixture para enumerar datasources e dashboards concorrentemente
+    Decidi buscar uma única vez por módulo e compartilhar entre os testes de provisioning
+    """
+    datasources, dashboards = await asyncio.gather(
+        _get_json(grafana_session, "/api/datasources"),
+        _get_json(grafana_session, "/api/search?type=dash-db"),
+    )
+    return {"datasources": datasources, "dashboards": dashboards}
+
+
+# Implementei um xdist_group por serviço: rodando com pytest -n auto --dist loadgroup
+# os testes de cada serviço ficam no mesmo worker (sem --dist loadgroup os marks são ignorados)
 @pytest.mark.e2e
 @pytest.mark.observability
 @pytest.mark.slow
+@pytest.mark.xdist_group("obs-prom")
 class TestPrometheusIntegration:
     """
     Implementei esta classe para testar integração com Prometheus
@@ -32,11 +154,8 @@ class TestPrometheusIntegration:
         """
         Implementei este teste para validar que Prometheus está rodando
         """
-        try:
-            response = requests.get(f"{prometheus_url}/-/healthy", timeout=5)
-            assert response.status_code == 200
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Prometheus not running at localhost:9090")
+        response = requests.get(f"{prometheus_url}/-/healthy", timeout=5)
+        assert response.status_code == 200
 
     def test_nexus_metrics_are_scraped(self, prometheus_url: str):
         """
@@ -48,61 +167,50 @@ class TestPrometheusIntegration:
         - nexus_api_calls_total
         - nexus_cpp_engine_latency_ns
         """
-        try:
-            # Query Prometheus API
-            response = requests.get(
-                f"{prometheus_url}/api/v1/query",
-                params={"query": "nexus_backtests_total"},
-                timeout=5
-            )
+        # Query Prometheus API
+        response = requests.get(
+            f"{prometheus_url}/api/v1/query",
+            params={"query": "nexus_backtests_total"},
+            timeout=5
+        )
 
-            assert response.status_code == 200
-            data = response.json()
+        assert response.status_code == 200
+        data = response.json()
 
-            assert data['status'] == 'success'
-            # Se há dados, métrica foi scraped
-            # Se não há dados, pode ser que ainda não rodou backtest
-
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Prometheus not reachable")
+        assert data['status'] == 'success'
+        # Se há dados, métrica foi scraped
+        # Se não há dados, pode ser que ainda não rodou backtest
 
     def test_custom_metrics_can_be_queried(self, prometheus_url: str):
         """
         Implementei este teste para validar queries customizadas
         """
-        try:
-            # Query rate of backtests
-            response = requests.get(
-                f"{prometheus_url}/api/v1/query",
-                params={"query": "rate(nexus_backtests_total[5m])"},
-                timeout=5
-            )
+        # Query rate of backtests
+        response = requests.get(
+            f"{prometheus_url}/api/v1/query",
+            params={"query": "rate(nexus_backtests_total[5m])"},
+            timeout=5
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert data['status'] == 'success'
-
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Prometheus not reachable")
+        assert response.status_code == 200
+        data = response.json()
+        assert data['status'] == 'success'
 
     def test_prometheus_retention_is_configured(self, prometheus_url: str):
         """
         Implementei este teste para validar retention configurada
         Decidi que deve ser 15 dias
         """
-        try:
-            # Query config
-            response = requests.get(f"{prometheus_url}/api/v1/status/config", timeout=5)
+        # Query config
+        response = requests.get(f"{prometheus_url}/api/v1/status/config", timeout=5)
 
-            assert response.status_code == 200
-            # Config validation seria aqui
-
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Prometheus not reachable")
+        assert response.status_code == 200
+        # Config validation seria aqui
 
 
 @pytest.mark.e2e
 @pytest.mark.observability
+@pytest.mark.xdist_group("obs-loki")
 class TestLokiIntegration:
     """
     Implementei esta classe para testar integração com Loki
@@ -114,55 +222,76 @@ class TestLokiIntegration:
         """
         Implementei este fixture para URL do Loki
         """
-        return "http://localhost:3100"
+        return LOKI_URL
 
     def test_loki_is_running(self, loki_url: str):
         """
         Implementei este teste para validar que Loki está rodando
         """
-        try:
-            response = requests.get(f"{loki_url}/ready", timeout=5)
-            assert response.status_code == 200
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Loki not running at localhost:3100")
+        response = requests.get(f"{loki_url}/ready", timeout=5)
+        assert response.status_code == 200
 
-    def test_application_logs_are_ingested(self, loki_url: str):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_application_logs_are_ingested(self, loki: httpx.AsyncClient):
         """
         Implementei este teste para validar ingestão de logs
+        Decidi disparar as query_range de todos os streams concorrentemente via HTTP/2
         """
-        try:
-            # Query logs from last 1 hour
-            query = '{job="nexus-backend"}'
-            params = {
-                "query": query,
-                "start": int((datetime.now() - timedelta(hours=1)).timestamp() * 1e9),
-                "end": int(datetime.now().timestamp() * 1e9)
-            }
-
-            response = requests.get(
-                f"{loki_url}/loki/api/v1/query_range",
-                params=params,
-                timeout=5
-            )
+        # Query logs from last 1 hour
+        # Decidi usar time.time_ns() para manter precisão de nanossegundos em inteiro
+        end_ns = time.time_ns()
+        start_ns = end_ns - 3600 * 1_000_000_000
+        queries = [{"query": q, "start": start_ns, "end": end_ns} for q in LOKI_STREAM_QUERIES]
 
-            assert response.status_code == 200
-            data = response.json()
-            # Se há dados, logs foram ingeridos
+        responses = await asyncio.gather(
+            *(loki.get("/loki/api/v1/query_range", params=p) for p in queries)
+        )
 
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Loki not reachable")
+        for response in responses:
+            assert response.status_code == 200
+            data = orjson.loads(response.content)
+            assert data['status'] == 'success'
+        # Se há dados, logs foram ingeridos
 
-    def test_logs_contain_trace_ids(self, loki_url: str):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_logs_contain_trace_ids(
+        self,
+        loki: httpx.AsyncClient,
+        trace_id_db: "hyperscan.Database"
+    ):
         """
         Implementei este teste para validar que logs contêm trace_ids
         Decidi que é necessário para correlação logs ↔ traces
+        Decidi escanear o body bruto em bytes em vez de decodificar cada linha
         """
-        # TODO: Implementar validação de trace_ids
-        pytest.skip("Requires log inspection")
+        end_ns = time.time_ns()
+        start_ns = end_ns - 3600 * 1_000_000_000
+        response = await loki.get(
+            "/loki/api/v1/query_range",
+            params={"query": '{job="nexus-backend"} |= "trace_id="', "start": start_ns, "end": end_ns}
+        )
+        assert response.status_code == 200
+
+        body = response.content
+        data = orjson.loads(body)
+        expected_traces = sum(len(stream['values']) for stream in data['data']['result'])
+        if expected_traces == 0:
+            pytest.skip("No trace-bearing logs in the last hour")
+
+        matches: List[bytes] = []
+
+        def on_match(id, frm, to, flags, ctx):
+            ctx.append(body[frm:to])
+
+        trace_id_db.scan(body, match_event_handler=on_match, context=matches)
+
+        # Cada linha retornada pelo filtro deve carregar exatamente um trace_id
+        assert len(matches) == expected_traces
 
 
 @pytest.mark.e2e
 @pytest.mark.observability
+@pytest.mark.xdist_group("obs-tempo")
 class TestTempoIntegration:
     """
     Implementei esta classe para testar integração com Tempo
@@ -180,11 +309,8 @@ class TestTempoIntegration:
         """
         Implementei este teste para validar que Tempo está rodando
         """
-        try:
-            response = requests.get(f"{tempo_url}/ready", timeout=5)
-            assert response.status_code == 200
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Tempo not running at localhost:3200")
+        response = requests.get(f"{tempo_url}/ready", timeout=5)
+        assert response.status_code == 200
 
     def test_traces_are_exported(self, tempo_url: str):
         """
@@ -204,6 +330,7 @@ class TestTempoIntegration:
 
 @pytest.mark.e2e
 @pytest.mark.observability
+@pytest.mark.xdist_group("obs-grafana")
 class TestGrafanaIntegration:
     """
     Implementei esta classe para testar integração com Grafana
@@ -215,7 +342,7 @@ class TestGrafanaIntegration:
         """
         Implementei este fixture para URL do Grafana
         """
-        return "http://localhost:3000"
+        return GRAFANA_URL
 
     @pytest.fixture(scope="class")
     def grafana_auth(self):
@@ -228,13 +355,11 @@ class TestGrafanaIntegration:
         """
         Implementei este teste para validar que Grafana está rodando
         """
-        try:
-            response = requests.get(f"{grafana_url}/api/health", timeout=5)
-            assert response.status_code == 200
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Grafana not running at localhost:3000")
+        response = requests.get(f"{grafana_url}/api/health", timeout=5)
+        assert response.status_code == 200
 
-    def test_datasources_are_provisioned(self, grafana_url: str, grafana_auth: tuple):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_datasources_are_provisioned(self, grafana_provisioning: Dict[str, Any]):
         """
         Implementei este teste para validar que datasources foram provisionados
 
@@ -243,25 +368,13 @@ class TestGrafanaIntegration:
         - Loki
         - Tempo
         """
-        try:
-            response = requests.get(
-                f"{grafana_url}/api/datasources",
-                auth=grafana_auth,
-                timeout=5
-            )
+        datasource_names = [ds['name'] for ds in grafana_provisioning['datasources']]
+        assert 'Prometheus' in datasource_names
+        assert 'Loki' in datasource_names
+        assert 'Tempo' in datasource_names
 
-            assert response.status_code == 200
-            datasources = response.json()
-
-            datasource_names = [ds['name'] for ds in datasources]
-            assert 'Prometheus' in datasource_names
-            assert 'Loki' in datasource_names
-            assert 'Tempo' in datasource_names
-
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Grafana not reachable")
-
-    def test_dashboards_are_provisioned(self, grafana_url: str, grafana_auth: tuple):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_dashboards_are_provisioned(self, grafana_provisioning: Dict[str, Any]):
         """
         Implementei este teste para validar que dashboards foram provisionados
 
@@ -270,23 +383,10 @@ class TestGrafanaIntegration:
         - C++ Engine Performance
         - System Metrics
         """
-        try:
-            response = requests.get(
-                f"{grafana_url}/api/search?type=dash-db",
-                auth=grafana_auth,
-                timeout=5
-            )
-
-            assert response.status_code == 200
-            dashboards = response.json()
-
-            dashboard_titles = [d['title'] for d in dashboards]
-            assert 'Nexus Trading Metrics' in dashboard_titles
-            assert 'C++ Engine Performance' in dashboard_titles
-            assert 'System Metrics' in dashboard_titles
-
-        except requests.exceptions.ConnectionError:
-            pytest.skip("Grafana not reachable")
+        dashboard_titles = [d['title'] for d in grafana_provisioning['dashboards']]
+        assert 'Nexus Trading Metrics' in dashboard_titles
+        assert 'C++ Engine Performance' in dashboard_titles
+        assert 'System Metrics' in dashboard_titles
 
     def test_dashboards_can_query_data(self, grafana_url: str, grafana_auth: tuple):
         """
@@ -299,6 +399,7 @@ class TestGrafanaIntegration:
 @pytest.mark.e2e
 @pytest.mark.observability
 @pytest.mark.critical
+@pytest.mark.xdist_group("obs-pillars")
 class TestThreePillarsIntegration:
     """
     Implementei esta classe para testar integração dos Three Pillars
@@ -347,6 +448,7 @@ class TestThreePillarsIntegration:
 
 @pytest.mark.e2e
 @pytest.mark.observability
+@pytest.mark.xdist_group("obs-alerting")
 class TestAlertingAndMonitoring:
     """
     Implementei esta classe para testar alerting e monitoring
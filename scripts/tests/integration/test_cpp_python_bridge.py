@@ -5,10 +5,15 @@ Decidi testar: BacktestEngine, Strategies, ExecutionSimulator, Analytics
 """
 
 import pytest
+import hashlib
+import inspect
+import itertools
+import os
+import sys
+import threading
+import time
 import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, Any, List
 
 # Importações dos bindings C++
 # Implementei import condicional para testes rodarem mesmo sem bindings compilados
@@ -17,27 +22,134 @@ try:
     HAS_CPP_BINDINGS = True
 except ImportError:
     HAS_CPP_BINDINGS = False
-    pytestmark = pytest.mark.skip(reason="C++ bindings not available")
+
+# Implementei o skip em nível de módulo para pytest pular na coleta, sem entrar em cada teste
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.cpp,
+    pytest.mark.skipif(not HAS_CPP_BINDINGS, reason="C++ bindings not available"),
+]
+
+
+def _prices(start, stop, step=1.0):
+    """
+    Implementei este helper para gerar preços float64 prontos para on_data_batch
+    """
+    return np.arange(start, stop, step, dtype=np.float64)
+
+
+SYNTHETIC_SEED = 42
+SYNTHETIC_PERIODS = 252  # 1 ano de trading
+
+# Arquivo que StrategyOptimizer.grid_search lê do diretório corrente
+GRID_SEARCH_DATA_FILE = "test_integration_data.csv"
+
+
+def _generate_synthetic_market_data(seed: int, periods: int) -> pd.DataFrame:
+    """
+    Implementei este gerador de OHLCV sintético com tendência + ruído
+    """
+    # Decidi usar Generator local (PCG64) em vez do RandomState global: mais rápido e sem estado compartilhado
+    rng = np.random.default_rng(seed)
+    base_price = 100.0
+    trend = np.linspace(0, 20, periods)
+    noise = rng.standard_normal(periods) * 2
+    prices = np.empty(periods)
+    np.add(base_price + trend, noise, out=prices)
+
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=periods, freq='B'),
+        'open': prices * 0.99,
+        'high': prices * 1.02,
+        'low': prices * 0.98,
+        'close': prices,
+        'volume': rng.integers(1_000_000, 5_000_000, periods)
+    })
+
+
+# Chave do cache: parâmetros + código do gerador, para que qualquer mudança invalide o parquet antigo
+_SYNTHETIC_KEY = hashlib.sha256(
+    f"{SYNTHETIC_SEED}:{SYNTHETIC_PERIODS}:{inspect.getsource(_generate_synthetic_market_data)}".encode()
+).hexdigest()[:16]
+
+
+@pytest.fixture(scope="session")
+def synthetic_market_data(tmp_path_factory):
+    """
+    Implementei este fixture para gerar dados de mercado sintéticos uma vez por sessão
+    Decidi memoizar em parquet chaveado pelo hash do gerador, dentro do basetemp da rodada:
+    sob xdist uso o pai (compartilhado pelos workers) e o pytest poda as rodadas antigas
+    """
+    basetemp = tmp_path_factory.getbasetemp()
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        basetemp = basetemp.parent
+    cache = basetemp / f"nexus_md_{_SYNTHETIC_KEY}.parquet"
+    if cache.exists():
+        return pd.read_parquet(cache)
+
+    market_data = _generate_synthetic_market_data(SYNTHETIC_SEED, SYNTHETIC_PERIODS)
+
+    # Decidi escrever em arquivo temporário e publicar com os.replace (atômico):
+    # workers xdist concorrentes nunca leem um parquet parcialmente escrito
+    tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+    market_data.to_parquet(tmp)
+    os.replace(tmp, cache)
+    return market_data
+
+
+# Implementei estes fixtures com scope="class" para reaproveitar instâncias C++ entre testes
+# Decidi que testes que dependem de estado limpo chamam reset() explicitamente
+
+@pytest.fixture(scope="class")
+def engine():
+    """
+    Implementei este fixture para compartilhar BacktestEngine na classe
+    """
+    yield nexus_bindings.BacktestEngine()
+
+
+@pytest.fixture(scope="class")
+def clock():
+    """
+    Implementei este fixture para compartilhar HighResolutionClock na classe
+    """
+    yield nexus_bindings.HighResolutionClock()
+
+
+@pytest.fixture(scope="class")
+def simulator():
+    """
+    Implementei este fixture para compartilhar ExecutionSimulator na classe
+    """
+    simulator = nexus_bindings.ExecutionSimulator(slippage=0.001, commission=0.002)
+    yield simulator
+    simulator.reset()
+
+
+@pytest.fixture(scope="class")
+def analyzer():
+    """
+    Implementei este fixture para compartilhar PerformanceAnalyzer na classe
+    """
+    analyzer = nexus_bindings.PerformanceAnalyzer(
+        initial_capital=100000.0,
+        equity_curve=[],
+        trade_history=[]
+    )
+    yield analyzer
+    analyzer.reset()
 
 
-@pytest.mark.integration
-@pytest.mark.cpp
 class TestCppPythonBridge:
     """
     Implementei esta classe para testar bridge C++↔Python
     Decidi validar que bindings funcionam corretamente com dados reais
     """
 
-    def test_backtest_engine_initialization(self):
+    def test_backtest_engine_initialization(self, engine):
         """
         Implementei este teste para validar criação de BacktestEngine
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
-
-        # Act
-        engine = nexus_bindings.BacktestEngine()
-
         # Assert
         assert engine is not None
         assert hasattr(engine, 'run_backtest')
@@ -47,24 +159,19 @@ class TestCppPythonBridge:
         """
         Implementei este teste para validar cálculo SMA com dados reais
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
-
         # Arrange
-        prices = [100.0, 101.0, 102.0, 103.0, 104.0, 105.0, 106.0, 107.0, 108.0, 109.0]
+        prices = _prices(100, 110)
         fast_period = 3
         slow_period = 5
 
         strategy = nexus_bindings.SmaStrategy(fast_period=fast_period, slow_period=slow_period)
 
-        # Act
-        signals = []
-        for price in prices:
-            signal = strategy.on_data(price)
-            signals.append(signal)
+        # Act - batch único em vez de uma chamada por preço
+        signals = strategy.on_data_batch(prices)
 
         # Assert
         assert len(signals) == len(prices)
+        assert signals.dtype == np.int8
         # Primeiros slow_period-1 sinais devem ser 0 (acumulando dados)
         assert all(s == 0 for s in signals[:slow_period-1])
 
@@ -72,12 +179,9 @@ class TestCppPythonBridge:
         """
         Implementei este teste para validar cálculo RSI com dados reais
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
-
         # Arrange
         # Dados com movimento: baixa → subida
-        prices = [100.0, 98.0, 96.0, 94.0, 95.0, 97.0, 99.0, 101.0, 103.0, 105.0, 107.0, 109.0, 111.0, 113.0, 115.0]
+        prices = np.concatenate((_prices(100, 93, -2), _prices(95, 116, 2)))
         period = 14
         oversold = 30
         overbought = 70
@@ -88,14 +192,12 @@ class TestCppPythonBridge:
             overbought=overbought
         )
 
-        # Act
-        signals = []
-        for price in prices:
-            signal = strategy.on_data(price)
-            signals.append(signal)
+        # Act - batch único em vez de uma chamada por preço
+        signals = strategy.on_data_batch(prices)
 
         # Assert
         assert len(signals) == len(prices)
+        assert signals.dtype == np.int8
         # Deve haver pelo menos um sinal de compra (1) quando oversold
         # Deve haver pelo menos um sinal de venda (-1) quando overbought
 
@@ -103,11 +205,8 @@ class TestCppPythonBridge:
         """
         Implementei este teste para validar cálculo MACD com dados reais
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
-
         # Arrange
-        prices = list(range(100, 150))  # 50 preços em uptrend
+        prices = _prices(100, 150)  # 50 preços em uptrend
         fast_period = 12
         slow_period = 26
         signal_period = 9
@@ -118,30 +217,20 @@ class TestCppPythonBridge:
             signal_period=signal_period
         )
 
-        # Act
-        signals = []
-        for price in float(p) for p in prices:
-            signal = strategy.on_data(price)
-            signals.append(signal)
+        # Act - batch único em vez de uma chamada por preço
+        signals = strategy.on_data_batch(prices)
 
         # Assert
         assert len(signals) == len(prices)
+        assert signals.dtype == np.int8
 
-    def test_execution_simulator_with_orders(self):
+    def test_execution_simulator_with_orders(self, simulator):
         """
         Implementei este teste para validar ExecutionSimulator com ordens reais
+        Decidi usar simulator compartilhado (slippage 0.1%, commission 0.2%)
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
-
         # Arrange
-        slippage = 0.001  # 0.1%
-        commission = 0.002  # 0.2%
-
-        simulator = nexus_bindings.ExecutionSimulator(
-            slippage=slippage,
-            commission=commission
-        )
+        simulator.reset()
 
         # Act - simular ordem de compra
         entry_price = 100.0
@@ -160,72 +249,61 @@ class TestCppPythonBridge:
         assert execution_result['commission'] > 0
         assert execution_result['quantity'] == quantity
 
-    def test_performance_analyzer_metrics(self):
+    def test_performance_analyzer_metrics(self, analyzer):
         """
         Implementei este teste para validar PerformanceAnalyzer com trades reais
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
-
         # Arrange
-        analyzer = nexus_bindings.PerformanceAnalyzer()
+        analyzer.reset()
 
-        # Simular trades
-        trades = [
-            {'pnl': 100.0, 'entry_time': 0, 'exit_time': 1},
-            {'pnl': -50.0, 'entry_time': 1, 'exit_time': 2},
-            {'pnl': 150.0, 'entry_time': 2, 'exit_time': 3},
-            {'pnl': 75.0, 'entry_time': 3, 'exit_time': 4},
-            {'pnl': -25.0, 'entry_time': 4, 'exit_time': 5},
-        ]
+        # Simular trades (colunas paralelas)
+        pnls = np.array([100.0, -50.0, 150.0, 75.0, -25.0], dtype=np.float64)
+        entry_times = np.arange(0, 5, dtype=np.int64)
+        exit_times = np.arange(1, 6, dtype=np.int64)
 
-        # Act
-        for trade in trades:
-            analyzer.add_trade(
-                pnl=trade['pnl'],
-                entry_time=trade['entry_time'],
-                exit_time=trade['exit_time']
-            )
+        # Act - uma única chamada para o batch inteiro
+        analyzer.add_trades_batch(pnls, entry_times, exit_times)
 
         metrics = analyzer.calculate_metrics()
 
-        # Assert
+        # Assert - estatísticas vêm do P&L realizado do batch
         assert metrics is not None
-        assert 'total_return' in metrics
-        assert 'sharpe_ratio' in metrics
-        assert 'max_drawdown' in metrics
-        assert 'win_rate' in metrics
-        assert metrics['total_trades'] == 5
-        assert metrics['profitable_trades'] == 3
-        assert metrics['losing_trades'] == 2
+        assert metrics.total_trades == 5
+        assert metrics.winning_trades == 3
+        assert metrics.losing_trades == 2
+        assert metrics.win_rate == pytest.approx(0.6)
+        assert metrics.profit_factor == pytest.approx(325.0 / 75.0)
 
     def test_monte_carlo_simulator(self):
         """
         Implementei este teste para validar MonteCarloSimulator com trades reais
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
-
         # Arrange
         returns = [0.01, -0.005, 0.015, 0.008, -0.003, 0.012, 0.007, -0.002]
+        volatilities = [0.02] * len(returns)
+        correlation_matrix = np.eye(len(returns)).tolist()
         num_simulations = 1000
-        num_periods = 252  # 1 ano de trading
 
-        simulator = nexus_bindings.MonteCarloSimulator(
-            num_simulations=num_simulations,
-            num_periods=num_periods
-        )
+        config = nexus_bindings.MonteCarloConfig()
+        config.num_simulations = num_simulations
+        simulator = nexus_bindings.MonteCarloSimulator(config)
 
         # Act
-        results = simulator.run(returns)
+        results = simulator.simulate_portfolio(
+            returns, volatilities, correlation_matrix, time_horizon=1.0
+        )
 
         # Assert
-        assert results is not None
+        assert isinstance(results, np.ndarray)
         assert len(results) == num_simulations
-        assert all(isinstance(r, (float, int)) for r in results)
+        assert results.dtype == np.float64
+        assert results.flags.c_contiguous
+
+        # Buffer vem do std::vector C++ e o capsule do próprio array o mantém vivo
+        assert results.base is not None
+        assert not isinstance(results.base, np.ndarray)
 
         # Estatísticas básicas
-        mean_return = np.mean(results)
         std_return = np.std(results)
         assert std_return > 0  # Deve haver variação
 
@@ -233,17 +311,16 @@ class TestCppPythonBridge:
         """
         Implementei este teste para validar LockFreeOrderBook
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
-
         # Arrange
         order_book = nexus_bindings.LockFreeOrderBook(symbol="AAPL")
 
-        # Act - adicionar ordens
-        order_book.add_order(price=100.0, quantity=100, side="BUY", order_id=1)
-        order_book.add_order(price=101.0, quantity=50, side="BUY", order_id=2)
-        order_book.add_order(price=102.0, quantity=75, side="SELL", order_id=3)
-        order_book.add_order(price=103.0, quantity=25, side="SELL", order_id=4)
+        # Act - adicionar ordens em lote (sides: 0 = BUY, 1 = SELL)
+        order_book.add_orders(
+            np.array([100.0, 101.0, 102.0, 103.0]),
+            np.array([100, 50, 75, 25], dtype=np.int64),
+            np.array([0, 0, 1, 1], dtype=np.uint8),
+            np.array([1, 2, 3, 4], dtype=np.int64),
+        )
 
         # Assert
         best_bid = order_book.get_best_bid()
@@ -254,45 +331,33 @@ class TestCppPythonBridge:
         assert order_book.get_bid_volume() == 150  # 100 + 50
         assert order_book.get_ask_volume() == 100  # 75 + 25
 
-    def test_high_resolution_clock(self):
+    def test_high_resolution_clock(self, clock):
         """
         Implementei este teste para validar HighResolutionClock
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
-
-        # Arrange
-        clock = nexus_bindings.HighResolutionClock()
-
-        # Act
+        # Act - duas leituras consecutivas, sem carga Python entre elas
         start = clock.now()
-        # Simular alguma operação
-        sum_result = sum(range(1000))
         end = clock.now()
 
         elapsed_ns = clock.elapsed_ns(start, end)
 
-        # Assert
+        # Assert - clock monotônico pode retornar 0 em resoluções grosseiras
         assert start > 0
-        assert end > start
-        assert elapsed_ns > 0
+        assert end >= start
+        assert elapsed_ns >= 0
         assert elapsed_ns < 1_000_000_000  # Menos de 1 segundo
 
     def test_latency_tracker(self):
         """
         Implementei este teste para validar LatencyTracker
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
-
         # Arrange
         tracker = nexus_bindings.LatencyTracker(name="test_operation")
 
-        # Act - registrar latências
+        # Act - registrar latências em uma única chamada
         latencies_ns = [1000, 1500, 2000, 1200, 1800, 1100, 1300, 1400, 1600, 1700]
 
-        for latency in latencies_ns:
-            tracker.record(latency)
+        tracker.record_many(np.asarray(latencies_ns, dtype=np.int64))
 
         stats = tracker.get_statistics()
 
@@ -307,46 +372,28 @@ class TestCppPythonBridge:
         assert stats['mean'] == pytest.approx(1460.0, rel=0.01)
 
 
-@pytest.mark.integration
-@pytest.mark.cpp
 @pytest.mark.slow
 class TestFullBacktestWorkflow:
     """
     Implementei esta classe para testar workflow completo de backtest usando C++
     """
 
-    def test_full_backtest_sma_strategy(self):
+    def test_full_backtest_sma_strategy(self, synthetic_market_data):
         """
         Implementei este teste para validar backtest completo com SMA strategy
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
-
         # Arrange
-        engine = nexus_bindings.BacktestEngine()
-
         strategy = nexus_bindings.SmaStrategy(fast_period=50, slow_period=200)
 
-        # Gerar dados de mercado sintéticos (1 ano, 252 dias)
-        np.random.seed(42)
-        base_price = 100.0
-        trend = np.linspace(0, 20, 252)
-        noise = np.random.normal(0, 2, 252)
-        prices = base_price + trend + noise
-
-        market_data = pd.DataFrame({
-            'timestamp': pd.date_range('2024-01-01', periods=252, freq='B'),
-            'open': prices * 0.99,
-            'high': prices * 1.02,
-            'low': prices * 0.98,
-            'close': prices,
-            'volume': np.random.randint(1000000, 5000000, 252)
-        })
-
         # Act
-        results = engine.run_backtest(
+        results = nexus_bindings.run_long_flat_backtest(
             strategy=strategy,
-            market_data=market_data.to_dict('records'),
+            timestamps=synthetic_market_data['timestamp'].to_numpy(dtype='datetime64[ns]').view(np.int64),
+            open=synthetic_market_data['open'].to_numpy(),
+            high=synthetic_market_data['high'].to_numpy(),
+            low=synthetic_market_data['low'].to_numpy(),
+            close=synthetic_market_data['close'].to_numpy(),
+            volume=synthetic_market_data['volume'].to_numpy(dtype=np.int64),
             initial_capital=100000.0
         )
 
@@ -358,48 +405,95 @@ class TestFullBacktestWorkflow:
         assert 'total_trades' in results
         assert results['total_trades'] > 0
 
-    def test_backtest_with_optimization(self):
+    @pytest.fixture
+    def grid_search_workdir(self, tmp_path, monkeypatch, synthetic_market_data):
         """
-        Implementei este teste para validar otimização de parâmetros
+        Implementei este fixture para o CSV que o StrategyOptimizer lê do diretório corrente
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
+        synthetic_market_data.to_csv(
+            tmp_path / GRID_SEARCH_DATA_FILE, index=False, date_format="%Y-%m-%d %H:%M:%S"
+        )
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
 
+    def test_backtest_with_optimization(self, grid_search_workdir):
+        """
+        Implementei este teste para validar otimização de parâmetros
+        Decidi checar que cada combinação do grid roda uma vez, mesmo distribuída entre threads
+        """
         # Arrange
-        optimizer = nexus_bindings.GridSearch()
-
-        # Parâmetros para otimizar
+        optimizer = nexus_bindings.StrategyOptimizer(
+            strategy_template=nexus_bindings.SmaStrategy(fast_period=20, slow_period=100)
+        )
         param_grid = {
-            'fast_period': [20, 30, 40, 50],
-            'slow_period': [100, 150, 200]
+            'fast_period': [20.0, 30.0, 40.0, 50.0],
+            'slow_period': [100.0, 150.0, 200.0]
         }
 
-        # Gerar dados de mercado
-        np.random.seed(42)
-        prices = 100.0 + np.cumsum(np.random.normal(0.001, 0.02, 252))
+        # Act
+        results = optimizer.grid_search(parameter_grid=param_grid)
+        best = optimizer.get_best_result()
 
-        market_data = pd.DataFrame({
-            'timestamp': pd.date_range('2024-01-01', periods=252, freq='B'),
-            'close': prices
-        })
+        # Assert
+        tested = sorted((r.parameters['fast_period'], r.parameters['slow_period']) for r in results)
+        assert tested == sorted(itertools.product(param_grid['fast_period'], param_grid['slow_period']))
+        assert best.fitness_score == max(r.fitness_score for r in results)
 
-        # Act
-        best_params = optimizer.optimize(
-            strategy_type='SMA',
-            param_grid=param_grid,
-            market_data=market_data.to_dict('records'),
-            objective='sharpe_ratio'
+    def test_grid_search_propagates_worker_errors(self, tmp_path, monkeypatch):
+        """
+        Implementei este teste para validar que exceções das threads do grid search chegam ao Python
+        Decidi rodar sem o CSV: cada worker falha e o erro é relançado após o join, sem std::terminate
+        """
+        # Arrange
+        monkeypatch.chdir(tmp_path)
+        optimizer = nexus_bindings.StrategyOptimizer(
+            strategy_template=nexus_bindings.SmaStrategy(fast_period=20, slow_period=100)
         )
 
+        # Act & Assert
+        with pytest.raises(RuntimeError, match=GRID_SEARCH_DATA_FILE):
+            optimizer.grid_search(parameter_grid={'fast_period': [10.0, 20.0, 30.0, 40.0]})
+
+    def test_grid_search_releases_gil(self, grid_search_workdir):
+        """
+        Implementei este teste para validar o call_guard gil_scoped_release do grid_search
+        Decidi usar um switch interval longo: com o GIL preso, a thread Python não avança durante a chamada
+        """
+        # Arrange
+        previous_interval = sys.getswitchinterval()
+        sys.setswitchinterval(5.0)
+        ticks = [0]
+        stop = threading.Event()
+
+        def spin():
+            while not stop.is_set():
+                ticks[0] += 1
+                time.sleep(0)
+
+        optimizer = nexus_bindings.StrategyOptimizer(
+            strategy_template=nexus_bindings.SmaStrategy(fast_period=20, slow_period=100)
+        )
+        param_grid = {
+            'fast_period': [float(p) for p in range(5, 45, 5)],
+            'slow_period': [float(p) for p in range(100, 260, 20)]
+        }
+        spinner = threading.Thread(target=spin, daemon=True)
+
+        # Act
+        try:
+            spinner.start()
+            before = ticks[0]
+            optimizer.grid_search(parameter_grid=param_grid)
+            during = ticks[0] - before
+        finally:
+            stop.set()
+            spinner.join()
+            sys.setswitchinterval(previous_interval)
+
         # Assert
-        assert best_params is not None
-        assert 'fast_period' in best_params
-        assert 'slow_period' in best_params
-        assert best_params['fast_period'] < best_params['slow_period']
+        assert during > 0
 
 
-@pytest.mark.integration
-@pytest.mark.cpp
 class TestDataTypeConversion:
     """
     Implementei esta classe para testar conversão de tipos Python ↔ C++
@@ -409,15 +503,12 @@ class TestDataTypeConversion:
         """
         Implementei este teste para validar que NumPy arrays são aceitos
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
-
         # Arrange
-        prices = np.array([100.0, 101.0, 102.0, 103.0, 104.0])
+        prices = _prices(100, 105)
         strategy = nexus_bindings.SmaStrategy(fast_period=2, slow_period=3)
 
-        # Act - deve aceitar NumPy array
-        signals = [strategy.on_data(float(p)) for p in prices]
+        # Act - deve aceitar NumPy array sem conversão elemento a elemento
+        signals = strategy.on_data_batch(prices)
 
         # Assert
         assert len(signals) == len(prices)
@@ -426,24 +517,30 @@ class TestDataTypeConversion:
         """
         Implementei este teste para validar que Pandas DataFrames são aceitos
         """
-        if not HAS_CPP_BINDINGS:
-            pytest.skip("C++ bindings not available")
-
         # Arrange
         df = pd.DataFrame({
             'timestamp': pd.date_range('2024-01-01', periods=10),
             'close': [100.0, 101.0, 102.0, 103.0, 104.0, 105.0, 106.0, 107.0, 108.0, 109.0]
         })
 
-        engine = nexus_bindings.BacktestEngine()
+        strategy = nexus_bindings.SmaStrategy(fast_period=2, slow_period=3)
 
-        # Act - deve aceitar DataFrame convertido para dict
-        # (PyBind11 não aceita DataFrame diretamente, precisa converter)
-        market_data_dict = df.to_dict('records')
+        # Act - colunas viram buffers NumPy contíguos, sem dict por linha
+        close = df['close'].to_numpy()
+        results = nexus_bindings.run_long_flat_backtest(
+            strategy=strategy,
+            timestamps=df['timestamp'].to_numpy(dtype='datetime64[ns]').view(np.int64),
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=np.full(len(df), 1000, dtype=np.int64),
+            initial_capital=100000.0
+        )
 
-        # Assert - não deve lançar exceção
-        assert isinstance(market_data_dict, list)
-        assert all(isinstance(record, dict) for record in market_data_dict)
+        # Assert - preços só sobem: long/flat sem custos nunca perde capital
+        assert results['final_equity'] >= 100000.0
+        assert results['total_return'] == pytest.approx(results['final_equity'] / 100000.0 - 1.0)
 
 
 if __name__ == "__main__":
@@ -9,8 +9,8 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 from uuid import uuid4, UUID
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
 
 # Importações do projeto
 from backend.python.src.infrastructure.database.models import Base, StrategyModel, BacktestModel, PositionModel, TradeModel
@@ -28,35 +28,58 @@ TEST_DB_URL = os.getenv(
 )
 
 
+# Schema por worker do pytest-xdist (gw0, gw1, ...) para rodar com -n auto sem colisão
+TEST_DB_SCHEMA = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+
+
 @pytest.fixture(scope="session")
 def test_engine():
     """
     Implementei este fixture para criar engine de teste
     Decidi usar scope=session para reutilizar conexão
+    Decidi fixar search_path no schema do worker em todas as conexões do pool
     """
-    engine = create_engine(TEST_DB_URL, echo=False)
+    engine = create_engine(
+        TEST_DB_URL,
+        echo=False,
+        connect_args={"options": f"-csearch_path={TEST_DB_SCHEMA}"}
+    )
     yield engine
     engine.dispose()
 
 
-@pytest.fixture(scope="function")
-def test_db(test_engine):
+@pytest.fixture(scope="session")
+def _schema(test_engine):
     """
-    Implementei este fixture para criar/limpar schema de teste
-    Decidi usar scope=function para isolamento total entre testes
+    Implementei este fixture para criar o schema uma única vez por sessão
+    Decidi evitar CREATE/DROP por teste pois DDL no PostgreSQL é caro e não é o que testamos
+    Cada worker do xdist ganha seu próprio schema, então os testes rodam isolados em paralelo
     """
-    # Create all tables
+    with test_engine.begin() as connection:
+        connection.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{TEST_DB_SCHEMA}"'))
     Base.metadata.create_all(test_engine)
+    yield
+    with test_engine.begin() as connection:
+        connection.execute(text(f'DROP SCHEMA IF EXISTS "{TEST_DB_SCHEMA}" CASCADE'))
 
-    # Create session
-    Session = sessionmaker(bind=test_engine)
-    session = Session()
+
+@pytest.fixture(scope="function")
+def test_db(_schema, test_engine):
+    """
+    Implementei este fixture para rodar cada teste dentro de uma transação descartável
+    Decidi usar join_transaction_mode="create_savepoint": commit() do teste vira RELEASE SAVEPOINT
+    e o rollback da transação externa no teardown garante que nada é gravado em disco
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
     yield session
 
-    # Cleanup
+    # Cleanup - rollback O(1) da transação externa, sem TRUNCATE nem DDL
     session.close()
-    Base.metadata.drop_all(test_engine)
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
@@ -74,28 +97,20 @@ class TestStrategyRepository:
     Implementei esta classe para testar StrategyRepository com PostgreSQL real
     """
 
-    def test_create_strategy(self, strategy_repository: StrategyRepositoryImpl, test_db: Session):
+    def test_create_strategy(self, strategy_repository: StrategyRepositoryImpl, test_db: Session, strategy_factory):
         """
         Implementei este teste para validar criação de estratégia no DB
         """
         # Arrange
-        strategy = Strategy(
-            id=uuid4(),
+        strategy = strategy_factory(
             name="Test SMA Strategy",
             strategy_type=StrategyType.SMA_CROSSOVER,
-            parameters=StrategyParameters(
-                params={
-                    "fast_period": 50,
-                    "slow_period": 200
-                }
-            ),
-            is_active=True,
-            created_at=datetime.now()
+            parameters=StrategyParameters(params={"fast_period": 50, "slow_period": 200})
         )
 
         # Act
-        created = strategy_repository.create(strategy)
-        test_db.commit()
+        with strategy_repository.batch(test_db) as repo:
+            created = repo.create(strategy)
 
         # Assert
         assert created is not None
@@ -107,21 +122,18 @@ class TestStrategyRepository:
         assert found is not None
         assert found.name == "Test SMA Strategy"
 
-    def test_get_by_id(self, strategy_repository: StrategyRepositoryImpl, test_db: Session):
+    def test_get_by_id(self, strategy_repository: StrategyRepositoryImpl, test_db: Session, strategy_factory):
         """
         Implementei este teste para validar busca por ID
         """
         # Arrange
-        strategy = Strategy(
-            id=uuid4(),
+        strategy = strategy_factory(
             name="Test Strategy",
             strategy_type=StrategyType.RSI_STRATEGY,
-            parameters=StrategyParameters(params={"period": 14}),
-            is_active=True,
-            created_at=datetime.now()
+            parameters=StrategyParameters(params={"period": 14})
         )
-        strategy_repository.create(strategy)
-        test_db.commit()
+        with strategy_repository.batch(test_db) as repo:
+            repo.create(strategy)
 
         # Act
         found = strategy_repository.get_by_id(strategy.id)
@@ -144,26 +156,20 @@ class TestStrategyRepository:
         # Assert
         assert found is None
 
-    def test_list_all_strategies(self, strategy_repository: StrategyRepositoryImpl, test_db: Session):
+    def test_list_all_strategies(self, strategy_repository: StrategyRepositoryImpl, test_db: Session, strategy_factory):
         """
         Implementei este teste para validar listagem de todas as estratégias
         """
         # Arrange - criar 3 estratégias
         strategies = [
-            Strategy(
-                id=uuid4(),
+            strategy_factory(
                 name=f"Strategy {i}",
-                strategy_type=StrategyType.SMA_CROSSOVER,
-                parameters=StrategyParameters(params={"fast_period": 50}),
-                is_active=True,
-                created_at=datetime.now()
+                strategy_type=StrategyType.SMA_CROSSOVER
             )
             for i in range(3)
         ]
 
-        for strategy in strategies:
-            strategy_repository.create(strategy)
-        test_db.commit()
+        strategy_repository.create_many(strategies, session=test_db)
 
         # Act
         all_strategies = strategy_repository.list_all()
@@ -175,27 +181,24 @@ class TestStrategyRepository:
         assert "Strategy 1" in names
         assert "Strategy 2" in names
 
-    def test_update_strategy(self, strategy_repository: StrategyRepositoryImpl, test_db: Session):
+    def test_update_strategy(self, strategy_repository: StrategyRepositoryImpl, test_db: Session, strategy_factory):
         """
         Implementei este teste para validar atualização de estratégia
         """
         # Arrange
-        strategy = Strategy(
-            id=uuid4(),
+        strategy = strategy_factory(
             name="Original Name",
             strategy_type=StrategyType.MACD_STRATEGY,
-            parameters=StrategyParameters(params={"fast_period": 12}),
-            is_active=True,
-            created_at=datetime.now()
+            parameters=StrategyParameters(params={"fast_period": 12})
         )
-        strategy_repository.create(strategy)
-        test_db.commit()
+        with strategy_repository.batch(test_db) as repo:
+            repo.create(strategy)
 
         # Act - atualizar nome
         strategy.name = "Updated Name"
         strategy.is_active = False
-        updated = strategy_repository.update(strategy)
-        test_db.commit()
+        with strategy_repository.batch(test_db) as repo:
+            updated = repo.update(strategy)
 
         # Assert
         assert updated.name == "Updated Name"
@@ -206,25 +209,21 @@ class TestStrategyRepository:
         assert found.name == "Updated Name"
         assert found.is_active is False
 
-    def test_delete_strategy(self, strategy_repository: StrategyRepositoryImpl, test_db: Session):
+    def test_delete_strategy(self, strategy_repository: StrategyRepositoryImpl, test_db: Session, strategy_factory):
         """
         Implementei este teste para validar deleção de estratégia
         """
         # Arrange
-        strategy = Strategy(
-            id=uuid4(),
+        strategy = strategy_factory(
             name="To Delete",
-            strategy_type=StrategyType.SMA_CROSSOVER,
-            parameters=StrategyParameters(params={"fast_period": 50}),
-            is_active=True,
-            created_at=datetime.now()
+            strategy_type=StrategyType.SMA_CROSSOVER
         )
-        strategy_repository.create(strategy)
-        test_db.commit()
+        with strategy_repository.batch(test_db) as repo:
+            repo.create(strategy)
 
         # Act
-        result = strategy_repository.delete(strategy.id)
-        test_db.commit()
+        with strategy_repository.batch(test_db) as repo:
+            result = repo.delete(strategy.id)
 
         # Assert
         assert result is True
@@ -233,32 +232,26 @@ class TestStrategyRepository:
         found = strategy_repository.get_by_id(strategy.id)
         assert found is None
 
-    def test_filter_active_strategies(self, strategy_repository: StrategyRepositoryImpl, test_db: Session):
+    def test_filter_active_strategies(self, strategy_repository: StrategyRepositoryImpl, test_db: Session, strategy_factory):
         """
         Implementei este teste para validar filtro de estratégias ativas
         """
         # Arrange
-        active_strategy = Strategy(
-            id=uuid4(),
+        active_strategy = strategy_factory(
             name="Active",
-            strategy_type=StrategyType.SMA_CROSSOVER,
-            parameters=StrategyParameters(params={"fast_period": 50}),
-            is_active=True,
-            created_at=datetime.now()
+            strategy_type=StrategyType.SMA_CROSSOVER
         )
 
-        inactive_strategy = Strategy(
-            id=uuid4(),
+        inactive_strategy = strategy_factory(
             name="Inactive",
             strategy_type=StrategyType.RSI_STRATEGY,
             parameters=StrategyParameters(params={"period": 14}),
-            is_active=False,
-            created_at=datetime.now()
+            is_active=False
         )
 
-        strategy_repository.create(active_strategy)
-        strategy_repository.create(inactive_strategy)
-        test_db.commit()
+        with strategy_repository.batch(test_db) as repo:
+            repo.create(active_strategy)
+            repo.create(inactive_strategy)
 
         # Act
         active_strategies = strategy_repository.find_by_active(is_active=True)
@@ -284,20 +277,16 @@ class TestBacktestRepository:
         return BacktestRepositoryImpl(session=test_db)
 
     @pytest.fixture
-    def sample_strategy(self, strategy_repository, test_db):
+    def sample_strategy(self, strategy_repository, test_db, strategy_factory):
         """
         Implementei este fixture para criar estratégia de teste
         """
-        strategy = Strategy(
-            id=uuid4(),
+        strategy = strategy_factory(
             name="Sample Strategy",
-            strategy_type=StrategyType.SMA_CROSSOVER,
-            parameters=StrategyParameters(params={"fast_period": 50}),
-            is_active=True,
-            created_at=datetime.now()
+            strategy_type=StrategyType.SMA_CROSSOVER
         )
-        created = strategy_repository.create(strategy)
-        test_db.commit()
+        with strategy_repository.batch(test_db) as repo:
+            created = repo.create(strategy)
         return created
 
     def test_create_backtest(self, backtest_repository, sample_strategy, test_db):
@@ -372,23 +361,22 @@ class TestBacktestRepository:
         Implementei este teste para validar listagem por estratégia
         """
         # Arrange - criar 2 backtests para mesma estratégia
-        backtests = [
-            Backtest(
-                id=uuid4(),
-                strategy_id=sample_strategy.id,
-                symbol=Symbol(value=symbol),
-                time_range=TimeRange(
-                    start_date=datetime(2024, 1, 1),
-                    end_date=datetime(2024, 12, 31)
-                ),
-                status=BacktestStatus.COMPLETED,
-                created_at=datetime.now()
-            )
-            for symbol in ["AAPL", "GOOGL"]
-        ]
-
-        for backtest in backtests:
-            backtest_repository.create(backtest)
+        # Decidi usar bulk_insert_mappings: um único INSERT multi-VALUES sem unit-of-work
+        test_db.bulk_insert_mappings(
+            BacktestModel,
+            [
+                {
+                    "id": uuid4(),
+                    "strategy_id": sample_strategy.id,
+                    "symbols": [symbol],
+                    "start_date": datetime(2024, 1, 1),
+                    "end_date": datetime(2024, 12, 31),
+                    "status": "completed",
+                    "executed_at": datetime.now(),
+                }
+                for symbol in ["AAPL", "GOOGL"]
+            ]
+        )
         test_db.commit()
 
         # Act
@@ -409,18 +397,14 @@ class TestDatabaseTransactions:
     Implementei esta classe para testar transações e rollback
     """
 
-    def test_transaction_commit(self, strategy_repository, test_db):
+    def test_transaction_commit(self, strategy_repository, test_db, strategy_factory):
         """
         Implementei este teste para validar commit de transação
         """
         # Arrange
-        strategy = Strategy(
-            id=uuid4(),
+        strategy = strategy_factory(
             name="Transaction Test",
-            strategy_type=StrategyType.SMA_CROSSOVER,
-            parameters=StrategyParameters(params={"fast_period": 50}),
-            is_active=True,
-            created_at=datetime.now()
+            strategy_type=StrategyType.SMA_CROSSOVER
         )
 
         # Act
@@ -431,18 +415,15 @@ class TestDatabaseTransactions:
         found = strategy_repository.get_by_id(strategy.id)
         assert found is not None
 
-    def test_transaction_rollback(self, strategy_repository, test_db):
+    def test_transaction_rollback(self, strategy_repository, test_db, strategy_factory):
         """
         Implementei este teste para validar rollback de transação
         """
         # Arrange
-        strategy = Strategy(
-            id=uuid4(),
+        strategy = strategy_factory(
             name="Rollback Test",
             strategy_type=StrategyType.RSI_STRATEGY,
-            parameters=StrategyParameters(params={"period": 14}),
-            is_active=True,
-            created_at=datetime.now()
+            parameters=StrategyParameters(params={"period": 14})
         )
 
         # Act
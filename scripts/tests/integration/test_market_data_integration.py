@@ -5,12 +5,9 @@ Decidi testar: API calls, rate limiting, WebSocket connections, error handling
 """
 
 import pytest
-import asyncio
-import time
-from datetime import datetime, timedelta
-from typing import Dict, Any, List
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 import pandas as pd
+import requests
 import requests_mock
 
 # Importações do projeto
@@ -18,138 +15,284 @@ from backend.python.src.infrastructure.adapters.market_data.alpha_vantage_adapte
 from backend.python.src.infrastructure.adapters.market_data.finnhub_adapter import FinnhubAdapter
 from backend.python.src.infrastructure.adapters.market_data.nasdaq_datalink_adapter import NasdaqDataLinkAdapter
 from backend.python.src.infrastructure.adapters.market_data.fred_adapter import FredAdapter
-from backend.python.src.domain.value_objects import Symbol
+
+# Decidi filtrar os warnings do pandas no módulo: DataFrames montados a partir de strings
+# geram FutureWarning/DeprecationWarning que o pytest capturaria e formataria a cada teste
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.filterwarnings("ignore::DeprecationWarning"),
+    pytest.mark.filterwarnings("ignore::FutureWarning"),
+]
+
+
+@pytest.fixture(scope="module")
+def http_session():
+    """
+    Implementei este fixture para compartilhar uma requests.Session no módulo
+    Decidi criar o pool de conexões uma vez; requests_mock intercepta o transport da Session
+    Com pytest-xdist cada worker constrói a sua própria Session, sem estado compartilhado
+    """
+    session = requests.Session()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_http():
+    """
+    Implementei este fixture para ativar um único requests_mock.Mocker por módulo
+    Decidi registrar URLs por teste na mesma instância em vez de abrir um Mocker a cada teste
+    """
+    with requests_mock.Mocker() as mocker:
+        mocker.get(AV_URL, json=_route_alpha_vantage)
+        yield mocker
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """
+    Implementei este fixture para anular o backoff real do adapter nos testes de retry
+    """
+    monkeypatch.setattr(f"{AlphaVantageAdapter.__module__}.time.sleep", lambda *_: None)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_http(mock_http):
+    """
+    Implementei este fixture para zerar o histórico de chamadas entre testes
+    """
+    mock_http.reset_mock()
+    yield
+
+
+@pytest.fixture
+def av_override(mock_http):
+    """
+    Implementei este fixture para registrar respostas pontuais (erro, status, sequência) na URL da Alpha Vantage
+    Decidi re-registrar o roteador no teardown para o override não vazar para os próximos testes
+    """
+    registered = []
+
+    def _override(*args, **kwargs):
+        registered.append(mock_http.get(AV_URL, *args, **kwargs))
+
+    yield _override
+    if registered:
+        mock_http.get(AV_URL, json=_route_alpha_vantage)
+
+
+# Payloads mock reaproveitados pelos testes (requests_mock serializa em JSON, sem mutação compartilhada)
+AV_DAILY_PAYLOAD = {
+    "Time Series (Daily)": {
+        "2024-01-05": {
+            "1. open": "100.00",
+            "2. high": "102.00",
+            "3. low": "99.00",
+            "4. close": "101.00",
+            "5. volume": "1000000"
+        },
+        "2024-01-04": {
+            "1. open": "99.00",
+            "2. high": "101.00",
+            "3. low": "98.00",
+            "4. close": "100.00",
+            "5. volume": "900000"
+        }
+    }
+}
+
+AV_DAILY_SINGLE_PAYLOAD = {
+    "Time Series (Daily)": {
+        "2024-01-05": {
+            "1. open": "100.00",
+            "2. high": "102.00",
+            "3. low": "99.00",
+            "4. close": "101.00",
+            "5. volume": "1000000"
+        }
+    }
+}
+
+AV_INTRADAY_PAYLOAD = {
+    "Time Series (1min)": {
+        "2024-01-05 16:00:00": {
+            "1. open": "100.00",
+            "2. high": "100.50",
+            "3. low": "99.50",
+            "4. close": "100.25",
+            "5. volume": "10000"
+        },
+        "2024-01-05 15:59:00": {
+            "1. open": "99.75",
+            "2. high": "100.00",
+            "3. low": "99.50",
+            "4. close": "99.90",
+            "5. volume": "8000"
+        }
+    }
+}
+
+AV_RATE_LIMIT_PAYLOAD = {
+    "Note": "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute and 500 calls per day."
+}
+
+_FIXED_TS = 1704470400  # 2024-01-05 16:00 UTC, fixo para o teste ser determinístico
+
+FH_QUOTE_PAYLOAD = {
+    "c": 100.50,  # current price
+    "h": 101.00,  # high
+    "l": 99.50,   # low
+    "o": 100.00,  # open
+    "pc": 99.75,  # previous close
+    "t": _FIXED_TS
+}
+
+NASDAQ_DATASET_PAYLOAD = {
+    "dataset": {
+        "data": [
+            ["2024-01-05", 100.0, 102.0, 99.0, 101.0, 1000000],
+            ["2024-01-04", 99.0, 101.0, 98.0, 100.0, 900000]
+        ],
+        "column_names": ["Date", "Open", "High", "Low", "Close", "Volume"]
+    }
+}
+
+FRED_OBSERVATIONS_PAYLOAD = {
+    "observations": [
+        {"date": "2024-01-01", "value": "2.5"},
+        {"date": "2024-02-01", "value": "2.6"},
+        {"date": "2024-03-01", "value": "2.7"}
+    ]
+}
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def _assert_ohlcv(df, n, cols=OHLCV_COLUMNS):
+    """
+    Implementei este helper para concentrar o schema esperado dos DataFrames em uma única asserção
+    """
+    assert isinstance(df, pd.DataFrame) and len(df) == n and set(cols).issubset(df.columns)
+
+
+AV_URL = 'https://www.alphavantage.co/query'
+
+# Respostas da Alpha Vantage por parâmetro "function"; testes trocam o payload via monkeypatch.setitem
+_ROUTER = {
+    "TIME_SERIES_DAILY": AV_DAILY_PAYLOAD,
+    "TIME_SERIES_INTRADAY": AV_INTRADAY_PAYLOAD,
+}
+
+
+def _route_alpha_vantage(request, context):
+    """
+    Implementei este callback para servir a Alpha Vantage a partir de um único matcher
+    Decidi despachar pela query (requests_mock normaliza request.qs para minúsculas)
+    """
+    return _ROUTER[request.qs["function"][0].upper()]
+
+
+# adapter -> (url, payload, método, kwargs, linhas esperadas — None quando retorna dict, colunas exigidas)
+ADAPTER_CASES = {
+    AlphaVantageAdapter: (AV_URL, AV_DAILY_PAYLOAD,
+                          "get_daily", {"symbol": "AAPL"}, 2, OHLCV_COLUMNS),
+    FinnhubAdapter: ("https://finnhub.io/api/v1/quote", FH_QUOTE_PAYLOAD,
+                     "get_quote", {"symbol": "AAPL"}, None, ()),
+    NasdaqDataLinkAdapter: ("https://data.nasdaq.com/api/v3/datasets/WIKI/AAPL", NASDAQ_DATASET_PAYLOAD,
+                            "get_dataset", {"dataset_code": "WIKI/AAPL"}, 2, ()),
+    FredAdapter: ("https://api.stlouisfed.org/fred/series/observations", FRED_OBSERVATIONS_PAYLOAD,
+                  "get_series", {"series_id": "GDP"}, 3, ()),
+}
+
+# Adapters que aceitam requests.Session injetada (os demais usam o client do SDK)
+SESSION_ADAPTERS = (NasdaqDataLinkAdapter, FredAdapter)
+
+
+@pytest.fixture(scope="module", params=[
+    pytest.param(AlphaVantageAdapter, id="alpha_vantage"),
+    pytest.param(FinnhubAdapter, id="finnhub"),
+    pytest.param(NasdaqDataLinkAdapter, id="nasdaq_datalink"),
+    pytest.param(FredAdapter, id="fred"),
+])
+def any_adapter(request, http_session):
+    """
+    Implementei este fixture para instanciar cada provider uma única vez no módulo
+    Decidi parametrizar o fixture em vez de repetir um fixture adapter por classe de teste
+    """
+    cls = request.param
+    extra = {"session": http_session} if cls in SESSION_ADAPTERS else {}
+    return cls(api_key="TEST_API_KEY", **extra)
+
+
+@pytest.mark.api
+def test_fetch_success(any_adapter, mock_http):
+    """
+    Implementei este teste para validar o caminho feliz de fetch de todos os adapters
+    Decidi parametrizar via any_adapter em vez de repetir arrange/mock/assert por provider
+    """
+    url, payload, method, kwargs, expected_len, cols = ADAPTER_CASES[type(any_adapter)]
+
+    # Arrange - Alpha Vantage já é servida pelo roteador registrado em mock_http
+    if url != AV_URL:
+        mock_http.get(url, json=payload)
+
+    # Act
+    data = getattr(any_adapter, method)(**kwargs)
+
+    # Assert
+    assert data is not None
+    if expected_len is None:
+        assert all(data[key] == value for key, value in payload.items())
+    else:
+        _assert_ohlcv(data, expected_len, cols)
 
 
-@pytest.mark.integration
 @pytest.mark.api
 class TestAlphaVantageAdapter:
     """
     Implementei esta classe para testar AlphaVantageAdapter com mock server
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def adapter(self):
         """
         Implementei este fixture para criar adapter com API key de teste
         """
         return AlphaVantageAdapter(api_key="TEST_API_KEY")
 
-    def test_get_daily_data_success(self, adapter: AlphaVantageAdapter):
-        """
-        Implementei este teste para validar fetch de dados diários com sucesso
-        """
-        with requests_mock.Mocker() as m:
-            # Arrange - mock response
-            mock_response = {
-                "Time Series (Daily)": {
-                    "2024-01-05": {
-                        "1. open": "100.00",
-                        "2. high": "102.00",
-                        "3. low": "99.00",
-                        "4. close": "101.00",
-                        "5. volume": "1000000"
-                    },
-                    "2024-01-04": {
-                        "1. open": "99.00",
-                        "2. high": "101.00",
-                        "3. low": "98.00",
-                        "4. close": "100.00",
-                        "5. volume": "900000"
-                    }
-                }
-            }
-
-            m.get(
-                'https://www.alphavantage.co/query',
-                json=mock_response
-            )
-
-            # Act
-            data = adapter.get_daily(symbol="AAPL")
-
-            # Assert
-            assert data is not None
-            assert isinstance(data, pd.DataFrame)
-            assert len(data) == 2
-            assert 'close' in data.columns
-            assert 'volume' in data.columns
-
-    def test_get_daily_data_api_error(self, adapter: AlphaVantageAdapter):
+    def test_get_daily_data_api_error(self, adapter: AlphaVantageAdapter, av_override):
         """
         Implementei este teste para validar tratamento de erro de API
         """
-        with requests_mock.Mocker() as m:
-            # Arrange - mock erro 500
-            m.get(
-                'https://www.alphavantage.co/query',
-                status_code=500
-            )
+        # Arrange - mock erro 500
+        av_override(status_code=500)
 
-            # Act & Assert
-            with pytest.raises(Exception):
-                adapter.get_daily(symbol="AAPL")
+        # Act & Assert
+        with pytest.raises(Exception):
+            adapter.get_daily(symbol="AAPL")
 
     def test_get_intraday_data(self, adapter: AlphaVantageAdapter):
         """
         Implementei este teste para validar fetch de dados intraday
         """
-        with requests_mock.Mocker() as m:
-            # Arrange
-            mock_response = {
-                "Time Series (1min)": {
-                    "2024-01-05 16:00:00": {
-                        "1. open": "100.00",
-                        "2. high": "100.50",
-                        "3. low": "99.50",
-                        "4. close": "100.25",
-                        "5. volume": "10000"
-                    },
-                    "2024-01-05 15:59:00": {
-                        "1. open": "99.75",
-                        "2. high": "100.00",
-                        "3. low": "99.50",
-                        "4. close": "99.90",
-                        "5. volume": "8000"
-                    }
-                }
-            }
-
-            m.get(
-                'https://www.alphavantage.co/query',
-                json=mock_response
-            )
+        # Act - TIME_SERIES_INTRADAY servido pelo roteador
+        data = adapter.get_intraday(symbol="AAPL", interval="1min")
 
-            # Act
-            data = adapter.get_intraday(symbol="AAPL", interval="1min")
+        # Assert
+        _assert_ohlcv(data, 2)
 
-            # Assert
-            assert data is not None
-            assert len(data) == 2
-
-    def test_rate_limiting(self, adapter: AlphaVantageAdapter):
+    def test_rate_limiting(self, adapter: AlphaVantageAdapter, monkeypatch):
         """
         Implementei este teste para validar rate limiting (25 calls/day)
         """
-        with requests_mock.Mocker() as m:
-            # Arrange - mock resposta de rate limit
-            mock_response = {
-                "Note": "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute and 500 calls per day."
-            }
-
-            m.get(
-                'https://www.alphavantage.co/query',
-                json=mock_response
-            )
+        # Arrange - mock resposta de rate limit
+        monkeypatch.setitem(_ROUTER, "TIME_SERIES_DAILY", AV_RATE_LIMIT_PAYLOAD)
 
-            # Act & Assert - deve detectar rate limit
-            with pytest.raises(Exception) as exc_info:
-                adapter.get_daily(symbol="AAPL")
+        # Act & Assert - deve detectar rate limit
+        with pytest.raises(Exception, match=r"(?i:rate limit)|Note"):
+            adapter.get_daily(symbol="AAPL")
 
-            assert "rate limit" in str(exc_info.value).lower() or "Note" in str(exc_info.value)
 
-
-@pytest.mark.integration
 @pytest.mark.api
 @pytest.mark.websocket
 class TestFinnhubAdapter:
@@ -158,41 +301,14 @@ class TestFinnhubAdapter:
     Decidi focar em WebSocket + REST
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def adapter(self):
         """
         Implementei este fixture para criar adapter de teste
         """
         return FinnhubAdapter(api_key="TEST_API_KEY")
 
-    def test_get_quote_success(self, adapter: FinnhubAdapter):
-        """
-        Implementei este teste para validar fetch de cotação em tempo real
-        """
-        with requests_mock.Mocker() as m:
-            # Arrange
-            mock_response = {
-                "c": 100.50,  # current price
-                "h": 101.00,  # high
-                "l": 99.50,   # low
-                "o": 100.00,  # open
-                "pc": 99.75,  # previous close
-                "t": int(datetime.now().timestamp())
-            }
-
-            m.get(
-                'https://finnhub.io/api/v1/quote',
-                json=mock_response
-            )
-
-            # Act
-            quote = adapter.get_quote(symbol="AAPL")
-
-            # Assert
-            assert quote is not None
-            assert quote['c'] == 100.50
-            assert quote['h'] == 101.00
-
+    @pytest.mark.skip(reason="Full WebSocket testing requires running server")
     def test_websocket_connection_mock(self, adapter: FinnhubAdapter):
         """
         Implementei este teste para validar conexão WebSocket (mocked)
@@ -207,103 +323,8 @@ class TestFinnhubAdapter:
 
             # Assert
             # Este é um mock simples - WebSocket real seria testado em E2E
-            pytest.skip("Full WebSocket testing requires running server")
-
-    def test_subscribe_to_trades(self, adapter: FinnhubAdapter):
-        """
-        Implementei este teste para validar subscription a trades
-        """
-        # TODO: Implementar quando houver WebSocket server de teste
-        pytest.skip("WebSocket subscription testing requires mock server")
 
 
-@pytest.mark.integration
-@pytest.mark.api
-class TestNasdaqDataLinkAdapter:
-    """
-    Implementei esta classe para testar Nasdaq Data Link (Quandl)
-    """
-
-    @pytest.fixture
-    def adapter(self):
-        """
-        Implementei este fixture para adapter Nasdaq
-        """
-        return NasdaqDataLinkAdapter(api_key="TEST_API_KEY")
-
-    def test_get_historical_data(self, adapter: NasdaqDataLinkAdapter):
-        """
-        Implementei este teste para validar fetch de dados históricos
-        """
-        with requests_mock.Mocker() as m:
-            # Arrange
-            mock_response = {
-                "dataset": {
-                    "data": [
-                        ["2024-01-05", 100.0, 102.0, 99.0, 101.0, 1000000],
-                        ["2024-01-04", 99.0, 101.0, 98.0, 100.0, 900000]
-                    ],
-                    "column_names": ["Date", "Open", "High", "Low", "Close", "Volume"]
-                }
-            }
-
-            m.get(
-                'https://data.nasdaq.com/api/v3/datasets/WIKI/AAPL',
-                json=mock_response
-            )
-
-            # Act
-            data = adapter.get_dataset(dataset_code="WIKI/AAPL")
-
-            # Assert
-            assert data is not None
-            assert isinstance(data, pd.DataFrame)
-            assert len(data) == 2
-
-
-@pytest.mark.integration
-@pytest.mark.api
-class TestFredAdapter:
-    """
-    Implementei esta classe para testar FRED adapter
-    """
-
-    @pytest.fixture
-    def adapter(self):
-        """
-        Implementei este fixture para adapter FRED
-        """
-        return FredAdapter(api_key="TEST_API_KEY")
-
-    def test_get_economic_data(self, adapter: FredAdapter):
-        """
-        Implementei este teste para validar fetch de dados econômicos
-        """
-        with requests_mock.Mocker() as m:
-            # Arrange
-            mock_response = {
-                "observations": [
-                    {"date": "2024-01-01", "value": "2.5"},
-                    {"date": "2024-02-01", "value": "2.6"},
-                    {"date": "2024-03-01", "value": "2.7"}
-                ]
-            }
-
-            m.get(
-                'https://api.stlouisfed.org/fred/series/observations',
-                json=mock_response
-            )
-
-            # Act
-            data = adapter.get_series(series_id="GDP")
-
-            # Assert
-            assert data is not None
-            assert isinstance(data, pd.DataFrame)
-            assert len(data) == 3
-
-
-@pytest.mark.integration
 @pytest.mark.api
 @pytest.mark.slow
 class TestMarketDataCaching:
@@ -311,180 +332,121 @@ class TestMarketDataCaching:
     Implementei esta classe para testar caching de market data
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def adapter_with_cache(self):
         """
         Implementei este fixture para adapter com cache habilitado
         """
         return AlphaVantageAdapter(api_key="TEST_API_KEY", enable_cache=True)
 
-    def test_cache_hit(self, adapter_with_cache: AlphaVantageAdapter):
+    @pytest.fixture(autouse=True)
+    def clear_cache(self, adapter_with_cache: AlphaVantageAdapter):
         """
-        Implementei este teste para validar cache hit
+        Implementei este fixture para limpar o cache entre testes
+        Decidi manter o adapter com scope=module e isolar apenas o estado mutável
         """
-        with requests_mock.Mocker() as m:
-            # Arrange
-            mock_response = {
-                "Time Series (Daily)": {
-                    "2024-01-05": {
-                        "1. open": "100.00",
-                        "2. high": "102.00",
-                        "3. low": "99.00",
-                        "4. close": "101.00",
-                        "5. volume": "1000000"
-                    }
-                }
-            }
-
-            m.get(
-                'https://www.alphavantage.co/query',
-                json=mock_response
-            )
-
-            # Act - primeira chamada (miss)
-            data1 = adapter_with_cache.get_daily(symbol="AAPL")
-
-            # Act - segunda chamada (should hit cache)
-            data2 = adapter_with_cache.get_daily(symbol="AAPL")
-
-            # Assert
-            assert data1.equals(data2)
-            # API deve ser chamada apenas uma vez
-            assert m.call_count == 1
+        adapter_with_cache._cache.clear()
+        yield
 
-    def test_cache_expiration(self, adapter_with_cache: AlphaVantageAdapter):
+    def test_cache_hit(self, adapter_with_cache: AlphaVantageAdapter, mock_http, monkeypatch):
         """
-        Implementei este teste para validar expiração de cache
+        Implementei este teste para validar cache hit
         """
-        # TODO: Implementar quando houver TTL configurável
-        pytest.skip("Cache expiration testing requires TTL configuration")
+        # Arrange
+        monkeypatch.setitem(_ROUTER, "TIME_SERIES_DAILY", AV_DAILY_SINGLE_PAYLOAD)
+
+        # Act - primeira chamada (miss)
+        data1 = adapter_with_cache.get_daily(symbol="AAPL")
+
+        # Act - segunda chamada (should hit cache)
+        data2 = adapter_with_cache.get_daily(symbol="AAPL")
+
+        # Assert - API deve ser chamada apenas uma vez e o hit devolve a mesma referência
+        assert mock_http.call_count == 1
+        assert data1 is data2
 
 
-@pytest.mark.integration
 @pytest.mark.api
 class TestErrorHandling:
     """
     Implementei esta classe para testar error handling em API calls
     """
 
-    def test_timeout_handling(self):
-        """
-        Implementei este teste para validar timeout handling
-        """
-        adapter = AlphaVantageAdapter(api_key="TEST_API_KEY", timeout=0.001)
-
-        with requests_mock.Mocker() as m:
-            # Arrange - mock timeout
-            m.get(
-                'https://www.alphavantage.co/query',
-                exc=requests.exceptions.Timeout
-            )
-
-            # Act & Assert
-            with pytest.raises(requests.exceptions.Timeout):
-                adapter.get_daily(symbol="AAPL")
-
-    def test_network_error_handling(self):
+    @pytest.fixture(scope="module")
+    def adapter(self):
         """
-        Implementei este teste para validar network error handling
+        Implementei este fixture para compartilhar um adapter entre os cenários de erro
         """
-        adapter = AlphaVantageAdapter(api_key="TEST_API_KEY")
-
-        with requests_mock.Mocker() as m:
-            # Arrange - mock network error
-            m.get(
-                'https://www.alphavantage.co/query',
-                exc=requests.exceptions.ConnectionError
-            )
-
-            # Act & Assert
-            with pytest.raises(requests.exceptions.ConnectionError):
-                adapter.get_daily(symbol="AAPL")
+        return AlphaVantageAdapter(api_key="TEST_API_KEY")
 
-    def test_invalid_json_response(self):
+    @pytest.mark.parametrize("mock_kwargs, expected_exc", [
+        pytest.param({"exc": requests.exceptions.Timeout}, requests.exceptions.Timeout, id="timeout"),
+        pytest.param({"exc": requests.exceptions.ConnectionError}, requests.exceptions.ConnectionError, id="network"),
+        pytest.param(
+            {"text": "<html>Invalid response</html>", "headers": {'Content-Type': 'text/html'}},
+            Exception,
+            id="invalid-json",
+        ),
+    ])
+    def test_error_paths(self, adapter: AlphaVantageAdapter, av_override, mock_kwargs, expected_exc):
         """
-        Implementei este teste para validar tratamento de JSON inválido
+        Implementei este teste para validar timeout, erro de rede e JSON inválido
+        Decidi parametrizar pela exceção esperada: os cenários só diferem no mock registrado
         """
-        adapter = AlphaVantageAdapter(api_key="TEST_API_KEY")
-
-        with requests_mock.Mocker() as m:
-            # Arrange - mock resposta inválida
-            m.get(
-                'https://www.alphavantage.co/query',
-                text="<html>Invalid response</html>",
-                headers={'Content-Type': 'text/html'}
-            )
+        # Arrange
+        av_override(**mock_kwargs)
 
-            # Act & Assert
-            with pytest.raises(Exception):
-                adapter.get_daily(symbol="AAPL")
+        # Act & Assert
+        with pytest.raises(expected_exc):
+            adapter.get_daily(symbol="AAPL")
 
 
-@pytest.mark.integration
 @pytest.mark.api
 @pytest.mark.slow
+@pytest.mark.usefixtures("no_sleep")
 class TestRetryLogic:
     """
     Implementei esta classe para testar retry logic em failures
     """
 
-    def test_retry_on_transient_error(self):
+    def test_retry_on_transient_error(self, mock_http, av_override):
         """
         Implementei este teste para validar retry em erro temporário
         """
         adapter = AlphaVantageAdapter(api_key="TEST_API_KEY", max_retries=3)
 
-        with requests_mock.Mocker() as m:
-            # Arrange - 2 falhas seguidas de sucesso
-            mock_success = {
-                "Time Series (Daily)": {
-                    "2024-01-05": {
-                        "1. open": "100.00",
-                        "2. high": "102.00",
-                        "3. low": "99.00",
-                        "4. close": "101.00",
-                        "5. volume": "1000000"
-                    }
-                }
-            }
-
-            m.get(
-                'https://www.alphavantage.co/query',
-                [
-                    {'status_code': 503},  # Service unavailable
-                    {'status_code': 503},  # Service unavailable
-                    {'json': mock_success, 'status_code': 200}  # Success
-                ]
-            )
+        # Arrange - 2 falhas seguidas de sucesso
+        av_override([
+            {'status_code': 503},  # Service unavailable
+            {'status_code': 503},  # Service unavailable
+            {'json': AV_DAILY_SINGLE_PAYLOAD, 'status_code': 200}  # Success
+        ])
 
-            # Act
-            data = adapter.get_daily(symbol="AAPL", retry=True)
+        # Act
+        data = adapter.get_daily(symbol="AAPL", retry=True)
 
-            # Assert
-            assert data is not None
-            assert m.call_count == 3
+        # Assert
+        assert data is not None
+        assert mock_http.call_count == 3
 
-    def test_retry_exhausted(self):
+    def test_retry_exhausted(self, mock_http, av_override):
         """
         Implementei este teste para validar falha após esgotar retries
         """
         adapter = AlphaVantageAdapter(api_key="TEST_API_KEY", max_retries=2)
 
-        with requests_mock.Mocker() as m:
-            # Arrange - sempre falha
-            m.get(
-                'https://www.alphavantage.co/query',
-                status_code=503
-            )
+        # Arrange - sempre falha
+        av_override(status_code=503)
 
-            # Act & Assert
-            with pytest.raises(Exception):
-                adapter.get_daily(symbol="AAPL", retry=True)
+        # Act & Assert
+        with pytest.raises(Exception):
+            adapter.get_daily(symbol="AAPL", retry=True)
 
-            # Deve ter tentado max_retries vezes
-            assert m.call_count == 2
+        # Deve ter tentado max_retries vezes
+        assert mock_http.call_count == 2
 
 
 if __name__ == "__main__":
     # Implementei este bloco para executar testes diretamente
-    pytest.main([__file__, "-v", "--tb=short", "-m", "integration"])
\ No newline at end of file
+    # Decidi rodar em paralelo: testes são independentes e --dist=loadfile mantém fixtures module por worker
+    pytest.main([__file__, "-v", "--tb=short", "-n", "auto", "--dist=loadfile", "-m", "integration"])
\ No newline at end of file
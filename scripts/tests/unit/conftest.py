@@ -0,0 +1,98 @@
+"""
+Pytest Fixtures - Unit Tests
+Implementei este arquivo para compartilhar fixtures de market data entre os testes unitários
+Decidi centralizar frames sintéticos e o mock do AlphaVantageAdapter: com scope session cada worker constrói uma vez
+"""
+
+import pytest
+from typing import Callable
+from unittest.mock import Mock
+import pandas as pd
+import numpy as np
+
+# Importações do projeto
+from backend.python.src.infrastructure.adapters.market_data.alpha_vantage_adapter import AlphaVantageAdapter
+
+# Decidi calcular a lista de spec uma vez no import: Mock(spec=Classe) refaz o dir() a cada construção
+_AV_SPEC = [m for m in dir(AlphaVantageAdapter) if not m.startswith('_')]
+
+# Índices calculados uma vez no import: o offset 'B' percorre o calendário a cada chamada
+# (DatetimeIndex é imutável, seguro para compartilhar)
+_BDAY_252 = pd.date_range('2024-01-01', periods=252, freq='B')
+_DAY_5 = pd.date_range('2024-01-01', periods=5)
+_MIN_10 = pd.date_range('2024-01-01 09:30', periods=10, freq='1min')
+
+
+# ============================================================================
+# Market Data Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def sample_ohlcv_252() -> pd.DataFrame:
+    """
+    Implementei este fixture para gerar o OHLCV sintético de 252 dias úteis uma única vez por worker
+    Decidi usar default_rng com seed fixa: os testes só leem o frame, então o mesmo objeto é compartilhado
+    """
+    rng = np.random.default_rng(42)
+    n = len(_BDAY_252)  # 252 trading days
+    # Uma única alocação contígua para open/high/low/close; as colunas são views
+    ohlc = rng.uniform([100, 105, 95, 100], [110, 115, 105, 110], size=(n, 4))
+    return pd.DataFrame({
+        'timestamp': _BDAY_252,
+        'open': ohlc[:, 0],
+        'high': ohlc[:, 1],
+        'low': ohlc[:, 2],
+        'close': ohlc[:, 3],
+        'volume': rng.integers(1000000, 5000000, n)
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_ohlcv_5() -> pd.DataFrame:
+    """
+    Implementei este fixture para montar o frame diário de 5 linhas uma única vez por worker
+    """
+    # Decidi derivar as colunas de um único arange: aritmética em arrays contíguos, sem coerção de listas
+    open_ = np.arange(100.0, 105.0)
+    return pd.DataFrame({
+        'timestamp': _DAY_5,
+        'open': open_,
+        'high': open_ + 2,
+        'low': open_ - 1,
+        'close': open_ + 1,
+        'volume': np.arange(1000000, 1500000, 100000)
+    }, copy=False)
+
+
+@pytest.fixture(scope="session")
+def sample_intraday_10() -> pd.DataFrame:
+    """
+    Implementei este fixture para montar o frame intraday de 10 linhas uma única vez por worker
+    """
+    return pd.DataFrame({
+        'timestamp': _MIN_10,
+        'open': np.full(10, 100.0),
+        'high': np.full(10, 101.0),
+        'low': np.full(10, 99.0),
+        'close': np.full(10, 100.5),
+        'volume': np.full(10, 10000)
+    }, copy=False)
+
+
+# ============================================================================
+# Mock Adapter Fixtures
+# ============================================================================
+
+@pytest.fixture
+def mock_alpha_vantage_factory() -> Callable[..., Mock]:
+    """
+    Implementei este fixture para construir mocks do AlphaVantageAdapter por teste
+    Decidi receber os retornos por nome de método: o Mock carrega estado de chamadas e não pode ser compartilhado
+    """
+    def _build(**return_values) -> Mock:
+        mock = Mock(spec_set=_AV_SPEC)
+        for method, value in return_values.items():
+            getattr(mock, method).return_value = value
+        return mock
+
+    return _build
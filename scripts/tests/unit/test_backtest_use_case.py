@@ -2,25 +2,160 @@
 Unit Tests - Backtest Use Case
 Implementei estes testes para validar o BacktestUseCase com workflow completo
 Decidi testar: execute, validation, C++ engine interaction, result persistence
+Decidi manter os testes independentes para rodarem em paralelo: pytest -n auto
 """
 
+import itertools
 import pytest
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
-from unittest.mock import Mock, patch, MagicMock, call
-from uuid import uuid4, UUID
+from unittest.mock import Mock, patch, MagicMock, call, create_autospec
+from types import MappingProxyType
+from uuid import UUID
 import pandas as pd
 import numpy as np
 
 # Importações do projeto
 from backend.python.src.application.use_cases.backtest_use_case import BacktestUseCase
+from backend.python.src.application.usecases.run_backtest import RunBacktestUseCase
 from backend.python.src.domain.entities.strategy import Strategy, StrategyType
 from backend.python.src.domain.entities.backtest import Backtest, BacktestStatus
 from backend.python.src.domain.repositories.strategy_repository import IStrategyRepository
 from backend.python.src.domain.repositories.backtest_repository import IBacktestRepository
-from backend.python.src.infrastructure.adapters.market_data.alpha_vantage_adapter import AlphaVantageAdapter
 from backend.python.src.domain.value_objects import Symbol, TimeRange, StrategyParameters
 
+# Decidi calcular as listas de spec uma vez no import: Mock(spec=Classe) refaz o dir() a cada construção
+_STRAT_REPO_SPEC = [m for m in dir(IStrategyRepository) if not m.startswith('_')]
+_BACKTEST_REPO_SPEC = [m for m in dir(IBacktestRepository) if not m.startswith('_')]
+
+# Value objects frozen construídos uma vez no import: a validação Pydantic não roda a cada teste
+_AAPL, _GOOGL, _MSFT = Symbol(value="AAPL"), Symbol(value="GOOGL"), Symbol(value="MSFT")
+_YEAR_2024 = TimeRange(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 12, 31))
+
+# Resultados do engine congelados no módulo: os testes só leem e nenhum pode mutar o dict compartilhado
+_ENGINE_RESULTS = MappingProxyType({
+    'total_return': 0.15,
+    'sharpe_ratio': 1.5,
+    'max_drawdown': -0.12,
+    'win_rate': 0.60,
+    'total_trades': 50,
+    'profitable_trades': 30,
+    'losing_trades': 20,
+    'avg_trade_return': 0.003,
+    'avg_profit': 0.008,
+    'avg_loss': -0.005,
+    'execution_time_ns': 1500000  # 1.5ms
+})
+
+_EXPECTED_RESULTS = MappingProxyType({
+    'total_return': 0.15,
+    'sharpe_ratio': 1.5,
+    'max_drawdown': -0.12,
+    'win_rate': 0.60
+})
+
+_DETAILED_RESULTS = MappingProxyType({
+    'total_return': 0.15,
+    'sharpe_ratio': 1.5,
+    'sortino_ratio': 1.8,
+    'max_drawdown': -0.12,
+    'calmar_ratio': 1.25,
+    'win_rate': 0.60,
+    'profit_factor': 1.6,
+    'total_trades': 50,
+    'avg_trade_duration_days': 5.5
+})
+
+# Orçamento de tempo médio do execute com engine mockado (só orquestração Python)
+_ORCHESTRATION_BUDGET_S = 0.05
+
+# Decidi gerar UUIDs por contador: os testes só precisam de IDs distintos, não de os.urandom
+_uuid_counter = itertools.count(1)
+
+
+def _fake_uuid() -> UUID:
+    return UUID(int=next(_uuid_counter))
+
+
+@pytest.fixture(scope="session")
+def _sample_strategy() -> Strategy:
+    """
+    Implementei este fixture para construir a estratégia de exemplo uma única vez por worker
+    Decidi compartilhar a entidade pura; só o Mock que a devolve carrega estado por teste
+    """
+    return Strategy(
+        id=_fake_uuid(),
+        name="SMA Crossover 50/200",
+        strategy_type=StrategyType.SMA_CROSSOVER,
+        parameters=StrategyParameters(
+            params={
+                "fast_period": 50,
+                "slow_period": 200
+            }
+        ),
+        is_active=True,
+        created_at=datetime.now()
+    )
+
+
+@pytest.fixture(scope="session")
+def _sample_backtest() -> Backtest:
+    """
+    Implementei este fixture como protótipo do backtest de exemplo, construído uma vez por worker
+    """
+    return Backtest(
+        id=_fake_uuid(),
+        strategy_id=_fake_uuid(),
+        symbol=_AAPL,
+        time_range=_YEAR_2024,
+        status=BacktestStatus.COMPLETED,
+        created_at=datetime.now()
+    )
+
+
+class _CppEngineStub:
+    """
+    Implementei este stub para declarar a superfície do C++ engine usada pelo use case
+    """
+
+    def run_backtest(self, *args, **kwargs):
+        return _ENGINE_RESULTS
+
+    def cancel_backtest(self, *args, **kwargs):
+        return True
+
+
+def _extract_statuses(repo_mock: Mock) -> List[BacktestStatus]:
+    """
+    Implementei este helper para extrair, em uma passada, os status enviados ao update do repositório
+    """
+    return [c.args[0].status for c in repo_mock.update.call_args_list]
+
+
+
+# Setups dos caminhos de falha: cada um quebra uma etapa do execute e,
+# quando precisa, devolve o TimeRange a usar (None mantém o range padrão)
+def _strategy_missing(mocks):
+    mocks['strategy_repository'].get_by_id.return_value = None
+
+
+def _invalid_range(mocks):
+    # Time range inválido: end antes de start
+    return TimeRange(
+        start_date=datetime(2024, 12, 31),
+        end_date=datetime(2024, 1, 1)
+    )
+
+
+def _no_data(mocks):
+    # Mock retorna DataFrame vazio
+    mocks['market_data_adapter'].get_daily.return_value = pd.DataFrame()
+
+
+def _cpp_crash(mocks):
+    # Mock C++ engine lança exceção
+    mocks['cpp_engine'].run_backtest.side_effect = RuntimeError("C++ engine crashed")
+
 
 class TestBacktestUseCase:
     """
@@ -29,47 +164,23 @@ class TestBacktestUseCase:
     """
 
     @pytest.fixture
-    def mock_strategy_repository(self) -> Mock:
+    def mock_strategy_repository(self, _sample_strategy: Strategy) -> Mock:
         """
         Implementei este fixture para mockar strategy repository
         """
-        mock = Mock(spec=IStrategyRepository)
-
-        sample_strategy = Strategy(
-            id=uuid4(),
-            name="SMA Crossover 50/200",
-            strategy_type=StrategyType.SMA_CROSSOVER,
-            parameters=StrategyParameters(
-                params={
-                    "fast_period": 50,
-                    "slow_period": 200
-                }
-            ),
-            is_active=True,
-            created_at=datetime.now()
-        )
-
-        mock.get_by_id.return_value = sample_strategy
+        mock = Mock(spec_set=_STRAT_REPO_SPEC)
+        mock.get_by_id.return_value = _sample_strategy
         return mock
 
     @pytest.fixture
-    def mock_backtest_repository(self) -> Mock:
+    def mock_backtest_repository(self, _sample_backtest: Backtest) -> Mock:
         """
         Implementei este fixture para mockar backtest repository
+        Decidi copiar o protótipo: o use case muda o status do backtest durante o execute
         """
-        mock = Mock(spec=IBacktestRepository)
+        mock = Mock(spec_set=_BACKTEST_REPO_SPEC)
 
-        sample_backtest = Backtest(
-            id=uuid4(),
-            strategy_id=uuid4(),
-            symbol=Symbol(value="AAPL"),
-            time_range=TimeRange(
-                start_date=datetime(2024, 1, 1),
-                end_date=datetime(2024, 12, 31)
-            ),
-            status=BacktestStatus.COMPLETED,
-            created_at=datetime.now()
-        )
+        sample_backtest = _sample_backtest.model_copy(deep=True)
 
         mock.create.return_value = sample_backtest
         mock.get_by_id.return_value = sample_backtest
@@ -77,45 +188,27 @@ class TestBacktestUseCase:
         return mock
 
     @pytest.fixture
-    def mock_market_data_adapter(self) -> Mock:
+    def mock_market_data_adapter(
+        self,
+        mock_alpha_vantage_factory,
+        sample_ohlcv_252: pd.DataFrame
+    ) -> Mock:
         """
         Implementei este fixture para mockar market data adapter
         """
-        mock = Mock(spec=AlphaVantageAdapter)
-
-        # Mock retorna dados de mercado realistas
-        mock.get_daily.return_value = pd.DataFrame({
-            'timestamp': pd.date_range('2024-01-01', periods=252, freq='B'),  # 252 trading days
-            'open': np.random.uniform(100, 110, 252),
-            'high': np.random.uniform(105, 115, 252),
-            'low': np.random.uniform(95, 105, 252),
-            'close': np.random.uniform(100, 110, 252),
-            'volume': np.random.randint(1000000, 5000000, 252)
-        })
-
-        return mock
+        # Mock retorna dados de mercado realistas (frame compartilhado por referência)
+        return mock_alpha_vantage_factory(get_daily=sample_ohlcv_252)
 
     @pytest.fixture
     def mock_cpp_engine(self) -> Mock:
         """
         Implementei este fixture para mockar C++ engine bindings
         """
-        mock = Mock()
+        # Decidi autospec sobre o stub: rastreia chamadas só dos métodos declarados e pega typos
+        mock = create_autospec(_CppEngineStub, instance=True)
 
         # Mock de resultados do backtest
-        mock.run_backtest.return_value = {
-            'total_return': 0.15,
-            'sharpe_ratio': 1.5,
-            'max_drawdown': -0.12,
-            'win_rate': 0.60,
-            'total_trades': 50,
-            'profitable_trades': 30,
-            'losing_trades': 20,
-            'avg_trade_return': 0.003,
-            'avg_profit': 0.008,
-            'avg_loss': -0.005,
-            'execution_time_ns': 1500000  # 1.5ms
-        }
+        mock.run_backtest.return_value = _ENGINE_RESULTS
 
         return mock
 
@@ -149,12 +242,9 @@ class TestBacktestUseCase:
         Implementei este teste para validar execução completa de backtest com sucesso
         """
         # Arrange
-        strategy_id = uuid4()
-        symbol = Symbol(value="AAPL")
-        time_range = TimeRange(
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 12, 31)
-        )
+        strategy_id = _fake_uuid()
+        symbol = _AAPL
+        time_range = _YEAR_2024
 
         # Act
         result = use_case.execute(
@@ -174,126 +264,47 @@ class TestBacktestUseCase:
         mock_backtest_repository.create.assert_called_once()
         mock_backtest_repository.update.assert_called()
 
-    def test_execute_backtest_strategy_not_found(
-        self,
-        use_case: BacktestUseCase,
-        mock_strategy_repository: Mock
-    ):
-        """
-        Implementei este teste para validar falha quando estratégia não existe
-        """
-        # Arrange
-        strategy_id = uuid4()
-        mock_strategy_repository.get_by_id.return_value = None
-
-        symbol = Symbol(value="AAPL")
-        time_range = TimeRange(
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 12, 31)
-        )
-
-        # Act & Assert
-        with pytest.raises(ValueError) as exc_info:
-            use_case.execute(
-                strategy_id=strategy_id,
-                symbol=symbol,
-                time_range=time_range
-            )
-
-        assert "Strategy not found" in str(exc_info.value)
-
-    def test_execute_backtest_invalid_time_range(
-        self,
-        use_case: BacktestUseCase
-    ):
-        """
-        Implementei este teste para validar rejeição de time range inválido
-        """
-        # Arrange
-        strategy_id = uuid4()
-        symbol = Symbol(value="AAPL")
-
-        # Time range inválido: end antes de start
-        invalid_time_range = TimeRange(
-            start_date=datetime(2024, 12, 31),
-            end_date=datetime(2024, 1, 1)
-        )
-
-        # Act & Assert
-        with pytest.raises(ValueError) as exc_info:
-            use_case.execute(
-                strategy_id=strategy_id,
-                symbol=symbol,
-                time_range=invalid_time_range
-            )
-
-        assert "End date must be after start date" in str(exc_info.value)
-
-    def test_execute_backtest_no_market_data(
-        self,
-        use_case: BacktestUseCase,
-        mock_market_data_adapter: Mock
-    ):
-        """
-        Implementei este teste para validar falha quando não há dados de mercado
-        """
-        # Arrange
-        strategy_id = uuid4()
-        symbol = Symbol(value="INVALID")
-        time_range = TimeRange(
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 12, 31)
-        )
-
-        # Mock retorna DataFrame vazio
-        mock_market_data_adapter.get_daily.return_value = pd.DataFrame()
-
-        # Act & Assert
-        with pytest.raises(ValueError) as exc_info:
-            use_case.execute(
-                strategy_id=strategy_id,
-                symbol=symbol,
-                time_range=time_range
-            )
-
-        assert "No market data available" in str(exc_info.value)
-
-    def test_execute_backtest_cpp_engine_failure(
+    @pytest.mark.parametrize("setup_fn, exc, match, final_status", [
+        pytest.param(_strategy_missing, ValueError, "Strategy not found", None, id="strategy-not-found"),
+        pytest.param(_invalid_range, ValueError, "End date must be after start date", None, id="invalid-time-range"),
+        pytest.param(_no_data, ValueError, "No market data available", None, id="no-market-data"),
+        pytest.param(_cpp_crash, RuntimeError, "C++ engine crashed", BacktestStatus.FAILED, id="cpp-engine-failure"),
+    ])
+    def test_execute_backtest_error_paths(
         self,
         use_case: BacktestUseCase,
+        mock_strategy_repository: Mock,
+        mock_backtest_repository: Mock,
+        mock_market_data_adapter: Mock,
         mock_cpp_engine: Mock,
-        mock_backtest_repository: Mock
+        setup_fn,
+        exc,
+        match,
+        final_status
     ):
         """
-        Implementei este teste para validar tratamento de erro no C++ engine
+        Implementei este teste para validar os caminhos de falha do execute
+        Decidi parametrizar pelo setup que quebra cada etapa: o arrange restante é idêntico
         """
         # Arrange
-        strategy_id = uuid4()
-        symbol = Symbol(value="AAPL")
-        time_range = TimeRange(
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 12, 31)
-        )
-
-        # Mock C++ engine lança exceção
-        mock_cpp_engine.run_backtest.side_effect = RuntimeError("C++ engine crashed")
+        mocks = {
+            'strategy_repository': mock_strategy_repository,
+            'market_data_adapter': mock_market_data_adapter,
+            'cpp_engine': mock_cpp_engine,
+        }
+        time_range = setup_fn(mocks) or _YEAR_2024
 
         # Act & Assert
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(exc, match=match):
             use_case.execute(
-                strategy_id=strategy_id,
-                symbol=symbol,
+                strategy_id=_fake_uuid(),
+                symbol=_AAPL,
                 time_range=time_range
             )
 
-        assert "C++ engine crashed" in str(exc_info.value)
-
-        # Verificar que backtest foi marcado como FAILED
-        update_calls = mock_backtest_repository.update.call_args_list
-        assert any(
-            call_args[0][0].status == BacktestStatus.FAILED
-            for call_args in update_calls
-        )
+        # Verificar que backtest foi marcado com o status final esperado
+        if final_status is not None:
+            assert final_status in _extract_statuses(mock_backtest_repository)
 
     def test_backtest_status_progression(
         self,
@@ -305,12 +316,9 @@ class TestBacktestUseCase:
         Decidi que deve ser: PENDING → RUNNING → COMPLETED
         """
         # Arrange
-        strategy_id = uuid4()
-        symbol = Symbol(value="AAPL")
-        time_range = TimeRange(
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 12, 31)
-        )
+        strategy_id = _fake_uuid()
+        symbol = _AAPL
+        time_range = _YEAR_2024
 
         # Act
         use_case.execute(
@@ -320,8 +328,7 @@ class TestBacktestUseCase:
         )
 
         # Assert - verificar sequência de updates
-        update_calls = mock_backtest_repository.update.call_args_list
-        statuses = [call_args[0][0].status for call_args in update_calls]
+        statuses = _extract_statuses(mock_backtest_repository)
 
         expected_statuses = [
             BacktestStatus.RUNNING,
@@ -340,21 +347,11 @@ class TestBacktestUseCase:
         Implementei este teste para validar que resultados são persistidos corretamente
         """
         # Arrange
-        strategy_id = uuid4()
-        symbol = Symbol(value="AAPL")
-        time_range = TimeRange(
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 12, 31)
-        )
-
-        expected_results = {
-            'total_return': 0.15,
-            'sharpe_ratio': 1.5,
-            'max_drawdown': -0.12,
-            'win_rate': 0.60
-        }
+        strategy_id = _fake_uuid()
+        symbol = _AAPL
+        time_range = _YEAR_2024
 
-        mock_cpp_engine.run_backtest.return_value = expected_results
+        mock_cpp_engine.run_backtest.return_value = _EXPECTED_RESULTS
 
         # Act
         result = use_case.execute(
@@ -380,7 +377,7 @@ class TestBacktestUseCase:
         Implementei este teste para validar busca de backtest por ID
         """
         # Arrange
-        backtest_id = uuid4()
+        backtest_id = _fake_uuid()
 
         # Act
         result = use_case.get_backtest(backtest_id)
@@ -398,28 +395,22 @@ class TestBacktestUseCase:
         Implementei este teste para validar listagem de backtests por estratégia
         """
         # Arrange
-        strategy_id = uuid4()
+        strategy_id = _fake_uuid()
 
         mock_backtests = [
             Backtest(
-                id=uuid4(),
+                id=_fake_uuid(),
                 strategy_id=strategy_id,
-                symbol=Symbol(value="AAPL"),
-                time_range=TimeRange(
-                    start_date=datetime(2024, 1, 1),
-                    end_date=datetime(2024, 12, 31)
-                ),
+                symbol=_AAPL,
+                time_range=_YEAR_2024,
                 status=BacktestStatus.COMPLETED,
                 created_at=datetime.now()
             ),
             Backtest(
-                id=uuid4(),
+                id=_fake_uuid(),
                 strategy_id=strategy_id,
-                symbol=Symbol(value="GOOGL"),
-                time_range=TimeRange(
-                    start_date=datetime(2024, 1, 1),
-                    end_date=datetime(2024, 12, 31)
-                ),
+                symbol=_GOOGL,
+                time_range=_YEAR_2024,
                 status=BacktestStatus.COMPLETED,
                 created_at=datetime.now()
             )
@@ -444,7 +435,7 @@ class TestBacktestUseCase:
         Implementei este teste para validar deleção de backtest
         """
         # Arrange
-        backtest_id = uuid4()
+        backtest_id = _fake_uuid()
         mock_backtest_repository.delete.return_value = True
 
         # Act
@@ -464,16 +455,13 @@ class TestBacktestUseCase:
         Implementei este teste para validar cancelamento de backtest em execução
         """
         # Arrange
-        backtest_id = uuid4()
+        backtest_id = _fake_uuid()
 
         running_backtest = Backtest(
             id=backtest_id,
-            strategy_id=uuid4(),
-            symbol=Symbol(value="AAPL"),
-            time_range=TimeRange(
-                start_date=datetime(2024, 1, 1),
-                end_date=datetime(2024, 12, 31)
-            ),
+            strategy_id=_fake_uuid(),
+            symbol=_AAPL,
+            time_range=_YEAR_2024,
             status=BacktestStatus.RUNNING,
             created_at=datetime.now()
         )
@@ -492,45 +480,38 @@ class TestBacktestUseCase:
         updated_backtest = mock_backtest_repository.update.call_args[0][0]
         assert updated_backtest.status == BacktestStatus.CANCELLED
 
+    @pytest.mark.performance
     def test_backtest_performance_metrics_calculation(
         self,
+        benchmark,
         use_case: BacktestUseCase,
         mock_cpp_engine: Mock
     ):
         """
         Implementei este teste para validar cálculo correto de métricas de performance
+        Decidi medir o execute com pytest-benchmark: com o engine mockado, o tempo é só overhead de orquestração
+        Comparar entre commits com --benchmark-autosave e --benchmark-compare-fail=mean:10%
         """
         # Arrange
-        strategy_id = uuid4()
-        symbol = Symbol(value="AAPL")
-        time_range = TimeRange(
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 12, 31)
-        )
+        strategy_id = _fake_uuid()
+        symbol = _AAPL
+        time_range = _YEAR_2024
 
         # Mock retorna métricas detalhadas
-        detailed_results = {
-            'total_return': 0.15,
-            'sharpe_ratio': 1.5,
-            'sortino_ratio': 1.8,
-            'max_drawdown': -0.12,
-            'calmar_ratio': 1.25,
-            'win_rate': 0.60,
-            'profit_factor': 1.6,
-            'total_trades': 50,
-            'avg_trade_duration_days': 5.5
-        }
-
-        mock_cpp_engine.run_backtest.return_value = detailed_results
+        mock_cpp_engine.run_backtest.return_value = _DETAILED_RESULTS
 
         # Act
-        result = use_case.execute(
+        result = benchmark(
+            use_case.execute,
             strategy_id=strategy_id,
             symbol=symbol,
             time_range=time_range
         )
 
-        # Assert
+        # Assert - orçamento só é checado quando o benchmark roda (pytest-benchmark se desativa sob xdist)
+        if benchmark.stats is not None:
+            assert benchmark.stats.stats.mean < _ORCHESTRATION_BUDGET_S
+        assert result.status == BacktestStatus.COMPLETED
         assert result.results['sharpe_ratio'] == 1.5
         assert result.results['sortino_ratio'] == 1.8
         assert result.results['profit_factor'] == 1.6
@@ -545,12 +526,9 @@ class TestBacktestUseCase:
         Implementei este teste para validar backtest com múltiplos símbolos
         """
         # Arrange
-        strategy_id = uuid4()
-        symbols = [Symbol(value="AAPL"), Symbol(value="GOOGL"), Symbol(value="MSFT")]
-        time_range = TimeRange(
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 12, 31)
-        )
+        strategy_id = _fake_uuid()
+        symbols = [_AAPL, _GOOGL, _MSFT]
+        time_range = _YEAR_2024
 
         # Act
         results = use_case.execute_batch(
@@ -565,6 +543,15 @@ class TestBacktestUseCase:
         assert mock_cpp_engine.run_backtest.call_count == 3
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_validate_market_data():
+    """
+    Implementei este fixture para compilar o kernel Numba do validador antes dos testes
+    Decidi aquecer com um frame de uma linha para tirar o custo de compilação da janela medida
+    """
+    RunBacktestUseCase.validate_market_data(pd.DataFrame({'close': np.ones(1)}), min_days=1)
+
+
 class TestBacktestValidation:
     """
     Implementei esta classe para testar validações específicas de backtest
@@ -576,16 +563,14 @@ class TestBacktestValidation:
         Implementei este teste para validar que há dados suficientes
         Decidi que mínimo é 30 dias de dados
         """
-        # Insufficient data
+        # Insufficient data - só o número de linhas importa, então preencho com zeros em vez de sortear preços
         insufficient_df = pd.DataFrame({
             'timestamp': pd.date_range('2024-01-01', periods=20),
-            'close': np.random.uniform(100, 110, 20)
+            'close': np.zeros(20)
         })
 
-        with pytest.raises(ValueError) as exc_info:
-            BacktestUseCase.validate_market_data(insufficient_df, min_days=30)
-
-        assert "Insufficient data points" in str(exc_info.value)
+        with pytest.raises(ValueError, match="Insufficient data points"):
+            RunBacktestUseCase.validate_market_data(insufficient_df, min_days=30)
 
     def test_validate_no_missing_data(self):
         """
@@ -597,10 +582,35 @@ class TestBacktestValidation:
             'close': [100.0] * 50 + [np.nan] * 50
         })
 
-        with pytest.raises(ValueError) as exc_info:
-            BacktestUseCase.validate_market_data(df_with_nan, allow_nan=False)
+        with pytest.raises(ValueError, match="Missing data detected"):
+            RunBacktestUseCase.validate_market_data(df_with_nan, allow_nan=False)
+
+    def test_execute_rejects_invalid_market_data(self, _sample_strategy: Strategy):
+        """
+        Implementei este teste para validar que execute() barra market data inválido
+        Decidi checar que o engine nunca é chamado quando a validação falha
+        """
+        bars = [Mock(close=100.0) for _ in range(40)] + [Mock(close=np.nan)]
+        market_data_service = Mock()
+        market_data_service.fetch_historical.return_value = bars
+        strategy_service = Mock()
+        strategy_service.get_by_id.return_value = _sample_strategy
+        cpp_engine = Mock()
+
+        module = "backend.python.src.application.usecases.run_backtest"
+        with patch(f"{module}.get_metrics"), patch(f"{module}.get_logger"), patch(f"{module}.get_tracer"):
+            use_case = RunBacktestUseCase(strategy_service, market_data_service, cpp_engine)
+
+            with pytest.raises(ValueError, match="Missing data detected"):
+                use_case.execute(
+                    strategy_id=_sample_strategy.id,
+                    symbols=["AAPL"],
+                    start_date=datetime(2024, 1, 1),
+                    end_date=datetime(2024, 3, 1),
+                )
 
-        assert "Missing data detected" in str(exc_info.value)
+        cpp_engine.create_strategy.assert_not_called()
+        cpp_engine.run_backtest.assert_not_called()
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 Unit Tests - Market Data Service
 Implementei estes testes para validar o MarketDataService com mocks
 Decidi testar: fetch_daily, fetch_intraday, retry logic, error handling
+Decidi manter os testes independentes para rodarem em paralelo: pytest -n auto
 """
 
 import pytest
@@ -11,11 +12,21 @@ from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
 
 # Importações do projeto
-from backend.python.src.infrastructure.adapters.market_data.alpha_vantage_adapter import AlphaVantageAdapter
 from backend.python.src.infrastructure.adapters.market_data.finnhub_adapter import FinnhubAdapter
+from backend.python.src.application.services import market_data_service
 from backend.python.src.application.services.market_data_service import MarketDataService
 from backend.python.src.domain.value_objects import Symbol, TimeRange
 
+# Decidi calcular a lista de spec uma vez no import: Mock(spec=Classe) refaz o dir() a cada construção
+_FH_SPEC = [m for m in dir(FinnhubAdapter) if not m.startswith('_')]
+
+# Value objects frozen construídos uma vez no import: a validação Pydantic não roda a cada teste
+_AAPL, _GOOGL, _MSFT = Symbol(value="AAPL"), Symbol(value="GOOGL"), Symbol(value="MSFT")
+_FIRST_WEEK_2024 = TimeRange(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 5))
+
+# Índice calculado uma vez no import para os frames inline (DatetimeIndex é imutável)
+_DAY_5 = pd.date_range('2024-01-01', periods=5)
+
 
 class TestMarketDataService:
     """
@@ -24,41 +35,27 @@ class TestMarketDataService:
     """
 
     @pytest.fixture
-    def mock_alpha_vantage(self) -> Mock:
+    def mock_alpha_vantage(
+        self,
+        mock_alpha_vantage_factory,
+        sample_ohlcv_5: pd.DataFrame,
+        sample_intraday_10: pd.DataFrame
+    ) -> Mock:
         """
         Implementei este fixture para mockar AlphaVantageAdapter
-        Decidi retornar DataFrames realistas
-        """
-        mock = Mock(spec=AlphaVantageAdapter)
-
-        # Mock para dados diários
-        mock.get_daily.return_value = pd.DataFrame({
-            'timestamp': pd.date_range('2024-01-01', periods=5),
-            'open': [100.0, 101.0, 102.0, 103.0, 104.0],
-            'high': [102.0, 103.0, 104.0, 105.0, 106.0],
-            'low': [99.0, 100.0, 101.0, 102.0, 103.0],
-            'close': [101.0, 102.0, 103.0, 104.0, 105.0],
-            'volume': [1000000, 1100000, 1200000, 1300000, 1400000]
-        })
-
-        # Mock para dados intraday
-        mock.get_intraday.return_value = pd.DataFrame({
-            'timestamp': pd.date_range('2024-01-01 09:30', periods=10, freq='1min'),
-            'open': [100.0] * 10,
-            'high': [101.0] * 10,
-            'low': [99.0] * 10,
-            'close': [100.5] * 10,
-            'volume': [10000] * 10
-        })
-
-        return mock
+        Decidi retornar DataFrames realistas, compartilhados por referência (os testes só leem)
+        """
+        return mock_alpha_vantage_factory(
+            get_daily=sample_ohlcv_5,
+            get_intraday=sample_intraday_10
+        )
 
     @pytest.fixture
     def mock_finnhub(self) -> Mock:
         """
         Implementei este fixture para mockar FinnhubAdapter
         """
-        mock = Mock(spec=FinnhubAdapter)
+        mock = Mock(spec_set=_FH_SPEC)
 
         # Mock para real-time quote
         mock.get_quote.return_value = {
@@ -72,6 +69,15 @@ class TestMarketDataService:
 
         return mock
 
+    @pytest.fixture(autouse=True)
+    def _patch_sleep(self, monkeypatch):
+        """
+        Implementei este fixture para anular o backoff real entre tentativas nos testes de retry
+        Decidi patchear só o sleep do namespace do service: time.sleep do processo fica intacto
+        (raising=False porque o loop de retry ainda não importa sleep no módulo)
+        """
+        monkeypatch.setattr(market_data_service, "sleep", lambda *_: None, raising=False)
+
     @pytest.fixture
     def service(self, mock_alpha_vantage: Mock, mock_finnhub: Mock) -> MarketDataService:
         """
@@ -87,10 +93,8 @@ class TestMarketDataService:
         Implementei este teste para validar fetch de dados diários com sucesso
         """
         # Arrange
-        symbol = Symbol(value="AAPL")
-        start_date = datetime(2024, 1, 1)
-        end_date = datetime(2024, 1, 5)
-        time_range = TimeRange(start_date=start_date, end_date=end_date)
+        symbol = _AAPL
+        time_range = _FIRST_WEEK_2024
 
         # Act
         result = service.fetch_daily_data(symbol, time_range)
@@ -107,7 +111,7 @@ class TestMarketDataService:
         Implementei este teste para validar fetch de dados intraday
         """
         # Arrange
-        symbol = Symbol(value="AAPL")
+        symbol = _AAPL
         start_date = datetime(2024, 1, 1, 9, 30)
         end_date = datetime(2024, 1, 1, 16, 0)
         time_range = TimeRange(start_date=start_date, end_date=end_date)
@@ -126,7 +130,7 @@ class TestMarketDataService:
         Implementei este teste para validar cotação em tempo real
         """
         # Arrange
-        symbol = Symbol(value="AAPL")
+        symbol = _AAPL
 
         # Act
         result = service.fetch_real_time_quote(symbol)
@@ -143,18 +147,15 @@ class TestMarketDataService:
         Decidi simular 2 falhas antes do sucesso
         """
         # Arrange
-        symbol = Symbol(value="AAPL")
-        time_range = TimeRange(
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 1, 5)
-        )
+        symbol = _AAPL
+        time_range = _FIRST_WEEK_2024
 
         # Mock com 2 falhas seguidas de sucesso
         mock_alpha_vantage.get_daily.side_effect = [
             Exception("API rate limit"),
             Exception("Network timeout"),
             pd.DataFrame({
-                'timestamp': pd.date_range('2024-01-01', periods=5),
+                'timestamp': _DAY_5,
                 'close': [100, 101, 102, 103, 104]
             })
         ]
@@ -172,32 +173,32 @@ class TestMarketDataService:
         Implementei este teste para validar falha após esgotar retries
         """
         # Arrange
-        symbol = Symbol(value="AAPL")
-        time_range = TimeRange(
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 1, 5)
-        )
+        symbol = _AAPL
+        time_range = _FIRST_WEEK_2024
 
         # Mock sempre falha
         mock_alpha_vantage.get_daily.side_effect = Exception("API error")
 
         # Act & Assert
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="API error"):
             service.fetch_daily_data(symbol, time_range, max_retries=3)
 
-        assert "API error" in str(exc_info.value)
         assert mock_alpha_vantage.get_daily.call_count == 3
 
-    def test_fetch_multiple_symbols_batch(self, service: MarketDataService, mock_alpha_vantage: Mock):
+    def test_fetch_multiple_symbols_batch(
+        self,
+        service: MarketDataService,
+        mock_alpha_vantage: Mock,
+        sample_ohlcv_5: pd.DataFrame
+    ):
         """
         Implementei este teste para validar fetch em lote de múltiplos símbolos
+        Decidi devolver uma view por chamada: cada símbolo recebe seu próprio objeto sem copiar o frame
         """
         # Arrange
-        symbols = [Symbol(value="AAPL"), Symbol(value="GOOGL"), Symbol(value="MSFT")]
-        time_range = TimeRange(
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 1, 5)
-        )
+        symbols = [_AAPL, _GOOGL, _MSFT]
+        mock_alpha_vantage.get_daily.side_effect = [sample_ohlcv_5.iloc[:] for _ in symbols]
+        time_range = _FIRST_WEEK_2024
 
         # Act
         results = service.fetch_multiple_symbols(symbols, time_range)
@@ -214,35 +215,28 @@ class TestMarketDataService:
         Implementei este teste para validar rejeição de símbolo inválido
         """
         # Act & Assert
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Symbol cannot be empty"):
             Symbol(value="")
 
-        assert "Symbol cannot be empty" in str(exc_info.value)
-
     def test_invalid_time_range(self, service: MarketDataService):
         """
         Implementei este teste para validar rejeição de range inválido
         """
         # Act & Assert
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="End date must be after start date"):
             TimeRange(
                 start_date=datetime(2024, 1, 10),
                 end_date=datetime(2024, 1, 1)  # End before start
             )
 
-        assert "End date must be after start date" in str(exc_info.value)
-
     def test_cache_behavior(self, service: MarketDataService, mock_alpha_vantage: Mock):
         """
         Implementei este teste para validar cache de dados
         Decidi verificar que chamadas repetidas usam cache
         """
         # Arrange
-        symbol = Symbol(value="AAPL")
-        time_range = TimeRange(
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 1, 5)
-        )
+        symbol = _AAPL
+        time_range = _FIRST_WEEK_2024
 
         # Act - primeira chamada
         result1 = service.fetch_daily_data(symbol, time_range, use_cache=True)
@@ -250,8 +244,8 @@ class TestMarketDataService:
         # Act - segunda chamada (deve usar cache)
         result2 = service.fetch_daily_data(symbol, time_range, use_cache=True)
 
-        # Assert
-        assert result1.equals(result2)
+        # Assert - hit deve devolver a mesma referência, não uma cópia
+        assert result1 is result2, "cache must return same object, not a copy"
         # API deve ser chamada apenas uma vez
         mock_alpha_vantage.get_daily.assert_called_once()
 
@@ -260,24 +254,19 @@ class TestMarketDataService:
         Implementei este teste para validar que dados inválidos são rejeitados
         """
         # Arrange
-        symbol = Symbol(value="AAPL")
-        time_range = TimeRange(
-            start_date=datetime(2024, 1, 1),
-            end_date=datetime(2024, 1, 5)
-        )
+        symbol = _AAPL
+        time_range = _FIRST_WEEK_2024
 
         # Mock retorna dados inválidos (preços negativos)
         mock_alpha_vantage.get_daily.return_value = pd.DataFrame({
-            'timestamp': pd.date_range('2024-01-01', periods=5),
+            'timestamp': _DAY_5,
             'close': [-100, -101, -102, -103, -104]  # Preços negativos!
         })
 
         # Act & Assert
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Invalid price data"):
             service.fetch_daily_data(symbol, time_range, validate=True)
 
-        assert "Invalid price data" in str(exc_info.value)
-
 
 class TestMarketDataServiceIntegration:
     """
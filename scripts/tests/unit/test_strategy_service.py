@@ -2,13 +2,13 @@
 Unit Tests - Strategy Service
 Implementei estes testes para validar o StrategyService com mocked repositories
 Decidi testar: create, update, delete, list, parameter validation
+Decidi manter os testes independentes para rodarem em paralelo: pytest -n auto --dist loadgroup
 """
 
 import pytest
 from datetime import datetime
-from typing import Dict, Any, List, Optional
-from unittest.mock import Mock, patch, MagicMock
-from uuid import uuid4
+from typing import Dict, Any, Iterator, List, Optional
+from uuid import UUID, uuid4
 
 # Importações do projeto
 from backend.python.src.domain.entities.strategy import Strategy, StrategyType
@@ -17,64 +17,156 @@ from backend.python.src.application.services.strategy_service import StrategySer
 from backend.python.src.domain.value_objects import StrategyParameters
 
 
-class TestStrategyService:
+class StubStrategyRepository(IStrategyRepository):
     """
-    Implementei esta classe para testar StrategyService
-    Decidi mockar o repositório para isolamento total
+    Implementei este stub para substituir Mock(spec=IStrategyRepository) nos testes do service
+    Decidi escrever à mão: atributos *_result definem os retornos e listas *_calls guardam os argumentos,
+    sem a introspecção do unittest.mock em cada chamada
     """
 
-    @pytest.fixture
-    def mock_repository(self) -> Mock:
+    def __init__(self) -> None:
+        self.reset(None)
+
+    def reset(self, strategy: Optional[Strategy]) -> None:
         """
-        Implementei este fixture para mockar IStrategyRepository
+        Implementei este método para restaurar retornos padrão e limpar o histórico de chamadas
         """
-        mock = Mock(spec=IStrategyRepository)
+        self.create_result: Optional[Strategy] = strategy
+        self.get_by_id_result: Optional[Strategy] = strategy
+        self.list_all_result: List[Strategy] = [strategy] if strategy is not None else []
+        self.update_result: Optional[Strategy] = strategy
+        self.delete_result: bool = True
+        self.has_active_backtests_result: bool = False
+        self.clone_result: Optional[Strategy] = None
+        self.get_performance_stats_result: Optional[Dict[str, Any]] = None
 
-        # Mock de estratégia exemplo
-        sample_strategy = Strategy(
-            id=uuid4(),
-            name="SMA Crossover 50/200",
-            strategy_type=StrategyType.SMA_CROSSOVER,
-            parameters=StrategyParameters(
-                params={
-                    "fast_period": 50,
-                    "slow_period": 200
-                }
-            ),
-            is_active=True,
-            created_at=datetime.now()
-        )
+        self.create_calls: List[Strategy] = []
+        self.get_by_id_calls: List[UUID] = []
+        self.list_all_calls: int = 0
+        self.update_calls: List[Strategy] = []
+        self.delete_calls: List[UUID] = []
+        self.has_active_backtests_calls: List[UUID] = []
+        self.clone_calls: List[UUID] = []
+        self.get_performance_stats_calls: List[UUID] = []
+
+    def create(self, strategy: Strategy) -> Optional[Strategy]:
+        self.create_calls.append(strategy)
+        return self.create_result
+
+    def get_by_id(self, strategy_id: UUID) -> Optional[Strategy]:
+        self.get_by_id_calls.append(strategy_id)
+        return self.get_by_id_result
+
+    def list_all(self) -> List[Strategy]:
+        self.list_all_calls += 1
+        return self.list_all_result
+
+    def update(self, strategy: Strategy) -> Optional[Strategy]:
+        self.update_calls.append(strategy)
+        return self.update_result
+
+    def delete(self, strategy_id: UUID) -> bool:
+        self.delete_calls.append(strategy_id)
+        return self.delete_result
+
+    def has_active_backtests(self, strategy_id: UUID) -> bool:
+        self.has_active_backtests_calls.append(strategy_id)
+        return self.has_active_backtests_result
 
-        # Mock behaviors
-        mock.create.return_value = sample_strategy
-        mock.get_by_id.return_value = sample_strategy
-        mock.list_all.return_value = [sample_strategy]
-        mock.update.return_value = sample_strategy
-        mock.delete.return_value = True
+    def clone(self, strategy_id: UUID) -> Optional[Strategy]:
+        self.clone_calls.append(strategy_id)
+        return self.clone_result
 
-        return mock
+    def get_performance_stats(self, strategy_id: UUID) -> Optional[Dict[str, Any]]:
+        self.get_performance_stats_calls.append(strategy_id)
+        return self.get_performance_stats_result
 
-    @pytest.fixture
-    def service(self, mock_repository: Mock) -> StrategyService:
+
+# Parâmetros válidos por tipo, validados uma única vez no import (value objects imutáveis)
+_SMA_VALID = StrategyParameters(params={"fast_period": 50, "slow_period": 200})
+_RSI_VALID = StrategyParameters(params={"period": 14, "oversold": 30, "overbought": 70})
+_MACD_VALID = StrategyParameters(params={"fast_period": 12, "slow_period": 26, "signal_period": 9})
+
+# Timestamp fixo para created_at: nenhum teste o compara, e assim não há leitura do relógio por teste
+_FIXED_NOW = datetime(2024, 1, 1, 0, 0, 0)
+
+# Pool de IDs determinísticos: UUID(int=n) não lê entropia do SO e é igual em todos os workers xdist
+_ID_POOL = tuple(UUID(int=n) for n in range(1, 65))
+
+
+@pytest.fixture
+def id_pool() -> Iterator[UUID]:
+    """
+    Implementei este fixture para entregar a cada teste seu próprio iterador sobre o pool de IDs
+    """
+    return iter(_ID_POOL)
+
+
+@pytest.fixture
+def fresh_id(id_pool: Iterator[UUID]) -> UUID:
+    """
+    Implementei este fixture para fornecer um ID distinto por teste sem chamar uuid4()
+    """
+    return next(id_pool)
+
+
+@pytest.fixture(scope="session")
+def _sample_strategy_template() -> Strategy:
+    """
+    Implementei este fixture para construir a estratégia de exemplo uma única vez por worker
+    """
+    return Strategy(
+        id=uuid4(),
+        name="SMA Crossover 50/200",
+        strategy_type=StrategyType.SMA_CROSSOVER,
+        parameters=_SMA_VALID,
+        is_active=True,
+        created_at=_FIXED_NOW
+    )
+
+
+@pytest.mark.xdist_group("strategy_service")
+class TestStrategyService:
+    """
+    Implementei esta classe para testar StrategyService
+    Decidi usar um stub do repositório para isolamento total
+    Decidi agrupar no mesmo worker xdist: os fixtures de scope module são construídos uma única vez
+    (o xdist_group só vale com pytest -n auto --dist loadgroup)
+    """
+
+    @pytest.fixture(scope="module")
+    def stub_repository(self) -> StubStrategyRepository:
         """
-        Implementei este fixture para criar serviço com repository mockado
+        Implementei este fixture para fornecer o stub de IStrategyRepository
+        Decidi compartilhar uma única instância por módulo: o estado é restaurado em _reset
         """
-        return StrategyService(repository=mock_repository)
+        return StubStrategyRepository()
 
-    def test_create_strategy_success(self, service: StrategyService, mock_repository: Mock):
+    @pytest.fixture(scope="module")
+    def service(self, stub_repository: StubStrategyRepository) -> StrategyService:
+        """
+        Implementei este fixture para criar serviço com o repository stub
+        Decidi usar scope module: o StrategyService não guarda estado além do repositório injetado
+        """
+        return StrategyService(repository=stub_repository)
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, stub_repository: StubStrategyRepository, _sample_strategy_template: Strategy) -> None:
+        """
+        Implementei este fixture para devolver o stub compartilhado ao estado inicial antes de cada teste
+        Decidi copiar o template: o service pode mudar is_active/parâmetros da estratégia retornada
+        """
+        # model_copy pula a validação Pydantic
+        stub_repository.reset(_sample_strategy_template.model_copy(deep=True))
+
+    def test_create_strategy_success(self, service: StrategyService, stub_repository: StubStrategyRepository):
         """
         Implementei este teste para validar criação de estratégia com sucesso
         """
         # Arrange
         name = "RSI Mean Reversion"
         strategy_type = StrategyType.RSI_STRATEGY
-        parameters = StrategyParameters(
-            params={
-                "period": 14,
-                "oversold": 30,
-                "overbought": 70
-            }
-        )
+        parameters = _RSI_VALID
 
         # Act
         result = service.create_strategy(
@@ -85,8 +177,8 @@ class TestStrategyService:
 
         # Assert
         assert result is not None
-        assert result.name == "SMA Crossover 50/200"  # Mock retorna sample
-        mock_repository.create.assert_called_once()
+        assert result.name == "SMA Crossover 50/200"  # Repositório retorna sample
+        assert len(stub_repository.create_calls) == 1
 
     def test_create_strategy_invalid_parameters(self, service: StrategyService):
         """
@@ -97,12 +189,10 @@ class TestStrategyService:
         strategy_type = StrategyType.SMA_CROSSOVER
 
         # Parâmetros inválidos: fast > slow
-        invalid_params = StrategyParameters(
-            params={
-                "fast_period": 200,
-                "slow_period": 50  # Erro: slow deve ser > fast
-            }
-        )
+        invalid_params = StrategyParameters(params={
+            "fast_period": 200,
+            "slow_period": 50  # Erro: slow deve ser > fast
+        })
 
         # Act & Assert
         with pytest.raises(ValueError) as exc_info:
@@ -115,12 +205,17 @@ class TestStrategyService:
 
         assert "fast_period must be less than slow_period" in str(exc_info.value)
 
-    def test_get_strategy_by_id_success(self, service: StrategyService, mock_repository: Mock):
+    def test_get_strategy_by_id_success(
+        self,
+        service: StrategyService,
+        stub_repository: StubStrategyRepository,
+        fresh_id: UUID
+    ):
         """
         Implementei este teste para validar busca de estratégia por ID
         """
         # Arrange
-        strategy_id = uuid4()
+        strategy_id = fresh_id
 
         # Act
         result = service.get_strategy(strategy_id)
@@ -128,24 +223,29 @@ class TestStrategyService:
         # Assert
         assert result is not None
         assert result.name == "SMA Crossover 50/200"
-        mock_repository.get_by_id.assert_called_once_with(strategy_id)
+        assert stub_repository.get_by_id_calls == [strategy_id]
 
-    def test_get_strategy_not_found(self, service: StrategyService, mock_repository: Mock):
+    def test_get_strategy_not_found(
+        self,
+        service: StrategyService,
+        stub_repository: StubStrategyRepository,
+        fresh_id: UUID
+    ):
         """
         Implementei este teste para validar comportamento quando estratégia não existe
         """
         # Arrange
-        strategy_id = uuid4()
-        mock_repository.get_by_id.return_value = None
+        strategy_id = fresh_id
+        stub_repository.get_by_id_result = None
 
         # Act
         result = service.get_strategy(strategy_id)
 
         # Assert
         assert result is None
-        mock_repository.get_by_id.assert_called_once_with(strategy_id)
+        assert stub_repository.get_by_id_calls == [strategy_id]
 
-    def test_list_all_strategies(self, service: StrategyService, mock_repository: Mock):
+    def test_list_all_strategies(self, service: StrategyService, stub_repository: StubStrategyRepository):
         """
         Implementei este teste para validar listagem de todas as estratégias
         """
@@ -156,32 +256,37 @@ class TestStrategyService:
         assert result is not None
         assert len(result) == 1
         assert result[0].name == "SMA Crossover 50/200"
-        mock_repository.list_all.assert_called_once()
+        assert stub_repository.list_all_calls == 1
 
-    def test_list_active_strategies_only(self, service: StrategyService, mock_repository: Mock):
+    def test_list_active_strategies_only(
+        self,
+        service: StrategyService,
+        stub_repository: StubStrategyRepository,
+        id_pool: Iterator[UUID]
+    ):
         """
         Implementei este teste para validar filtro de estratégias ativas
         """
         # Arrange
         active_strategy = Strategy(
-            id=uuid4(),
+            id=next(id_pool),
             name="Active Strategy",
             strategy_type=StrategyType.RSI_STRATEGY,
             parameters=StrategyParameters(params={"period": 14}),
             is_active=True,
-            created_at=datetime.now()
+            created_at=_FIXED_NOW
         )
 
         inactive_strategy = Strategy(
-            id=uuid4(),
+            id=next(id_pool),
             name="Inactive Strategy",
             strategy_type=StrategyType.MACD_STRATEGY,
             parameters=StrategyParameters(params={"fast": 12}),
             is_active=False,
-            created_at=datetime.now()
+            created_at=_FIXED_NOW
         )
 
-        mock_repository.list_all.return_value = [active_strategy, inactive_strategy]
+        stub_repository.list_all_result = [active_strategy, inactive_strategy]
 
         # Act
         result = service.list_strategies(active_only=True)
@@ -191,18 +296,21 @@ class TestStrategyService:
         assert result[0].name == "Active Strategy"
         assert result[0].is_active is True
 
-    def test_update_strategy_success(self, service: StrategyService, mock_repository: Mock):
+    def test_update_strategy_success(
+        self,
+        service: StrategyService,
+        stub_repository: StubStrategyRepository,
+        fresh_id: UUID
+    ):
         """
         Implementei este teste para validar atualização de estratégia
         """
         # Arrange
-        strategy_id = uuid4()
-        new_parameters = StrategyParameters(
-            params={
-                "fast_period": 20,
-                "slow_period": 50
-            }
-        )
+        strategy_id = fresh_id
+        new_parameters = StrategyParameters(params={
+            "fast_period": 20,
+            "slow_period": 50
+        })
 
         # Act
         result = service.update_strategy(
@@ -212,15 +320,20 @@ class TestStrategyService:
 
         # Assert
         assert result is not None
-        mock_repository.update.assert_called_once()
+        assert len(stub_repository.update_calls) == 1
 
-    def test_update_strategy_not_found(self, service: StrategyService, mock_repository: Mock):
+    def test_update_strategy_not_found(
+        self,
+        service: StrategyService,
+        stub_repository: StubStrategyRepository,
+        fresh_id: UUID
+    ):
         """
         Implementei este teste para validar update de estratégia inexistente
         """
         # Arrange
-        strategy_id = uuid4()
-        mock_repository.get_by_id.return_value = None
+        strategy_id = fresh_id
+        stub_repository.get_by_id_result = None
 
         new_parameters = StrategyParameters(params={"fast_period": 20})
 
@@ -233,176 +346,161 @@ class TestStrategyService:
 
         assert "Strategy not found" in str(exc_info.value)
 
-    def test_delete_strategy_success(self, service: StrategyService, mock_repository: Mock):
+    def test_delete_strategy_success(
+        self,
+        service: StrategyService,
+        stub_repository: StubStrategyRepository,
+        fresh_id: UUID
+    ):
         """
         Implementei este teste para validar deleção de estratégia
         """
         # Arrange
-        strategy_id = uuid4()
+        strategy_id = fresh_id
 
         # Act
         result = service.delete_strategy(strategy_id)
 
         # Assert
         assert result is True
-        mock_repository.delete.assert_called_once_with(strategy_id)
+        assert stub_repository.delete_calls == [strategy_id]
 
-    def test_delete_strategy_with_active_backtests(self, service: StrategyService, mock_repository: Mock):
+    def test_delete_strategy_with_active_backtests(
+        self,
+        service: StrategyService,
+        stub_repository: StubStrategyRepository,
+        fresh_id: UUID
+    ):
         """
         Implementei este teste para validar que não se pode deletar estratégia com backtests ativos
         """
         # Arrange
-        strategy_id = uuid4()
+        strategy_id = fresh_id
 
-        # Mock repositório indicando que há backtests ativos
-        mock_repository.has_active_backtests.return_value = True
+        # Repositório indicando que há backtests ativos
+        stub_repository.has_active_backtests_result = True
 
         # Act & Assert
         with pytest.raises(ValueError) as exc_info:
             service.delete_strategy(strategy_id, force=False)
 
         assert "Cannot delete strategy with active backtests" in str(exc_info.value)
-        mock_repository.delete.assert_not_called()
+        assert stub_repository.delete_calls == []
 
-    def test_delete_strategy_force(self, service: StrategyService, mock_repository: Mock):
+    def test_delete_strategy_force(
+        self,
+        service: StrategyService,
+        stub_repository: StubStrategyRepository,
+        fresh_id: UUID
+    ):
         """
         Implementei este teste para validar deleção forçada mesmo com backtests
         """
         # Arrange
-        strategy_id = uuid4()
-        mock_repository.has_active_backtests.return_value = True
+        strategy_id = fresh_id
+        stub_repository.has_active_backtests_result = True
 
         # Act
         result = service.delete_strategy(strategy_id, force=True)
 
         # Assert
         assert result is True
-        mock_repository.delete.assert_called_once_with(strategy_id)
+        assert stub_repository.delete_calls == [strategy_id]
 
-    def test_activate_strategy(self, service: StrategyService, mock_repository: Mock):
+    @pytest.mark.parametrize("method_name", ["activate_strategy", "deactivate_strategy"])
+    def test_toggle_strategy(
+        self,
+        service: StrategyService,
+        stub_repository: StubStrategyRepository,
+        fresh_id: UUID,
+        method_name: str
+    ):
         """
-        Implementei este teste para validar ativação de estratégia
+        Implementei este teste para validar ativação e desativação de estratégia
+        Decidi parametrizar pelo nome do método: os dois caminhos fazem as mesmas asserções
         """
         # Arrange
-        strategy_id = uuid4()
+        strategy_id = fresh_id
 
         # Act
-        result = service.activate_strategy(strategy_id)
+        result = getattr(service, method_name)(strategy_id)
 
         # Assert
         assert result is not None
-        mock_repository.update.assert_called_once()
-
-    def test_deactivate_strategy(self, service: StrategyService, mock_repository: Mock):
-        """
-        Implementei este teste para validar desativação de estratégia
+        assert len(stub_repository.update_calls) == 1
+
+    @pytest.mark.parametrize("strategy_type, valid_params, invalid_params, err_msg", [
+        pytest.param(
+            StrategyType.SMA_CROSSOVER,
+            _SMA_VALID,
+            {"fast_period": 50},  # Falta slow_period
+            "Missing required parameter: slow_period",
+            id="sma_crossover",
+        ),
+        pytest.param(
+            StrategyType.RSI_STRATEGY,
+            _RSI_VALID,
+            {"period": 14, "oversold": 80, "overbought": 70},  # Erro: oversold > overbought
+            "oversold must be less than overbought",
+            id="rsi",
+        ),
+        pytest.param(
+            StrategyType.MACD_STRATEGY,
+            _MACD_VALID,
+            None,
+            None,
+            id="macd",
+        ),
+    ])
+    def test_validate_parameters(
+        self,
+        service: StrategyService,
+        strategy_type: StrategyType,
+        valid_params: StrategyParameters,
+        invalid_params: Optional[Dict[str, Any]],
+        err_msg: Optional[str]
+    ):
+        """
+        Implementei este teste para validar parâmetros específicos de cada tipo de estratégia
+        Decidi parametrizar por tipo: cada caso só difere nos dicts válido/inválido e na mensagem
         """
-        # Arrange
-        strategy_id = uuid4()
-
-        # Act
-        result = service.deactivate_strategy(strategy_id)
-
-        # Assert
-        assert result is not None
-        mock_repository.update.assert_called_once()
-
-    def test_validate_sma_crossover_parameters(self, service: StrategyService):
-        """
-        Implementei este teste para validar parâmetros específicos de SMA Crossover
-        """
-        # Valid parameters
-        valid_params = StrategyParameters(
-            params={
-                "fast_period": 50,
-                "slow_period": 200
-            }
-        )
-
-        # Act & Assert - should not raise
-        is_valid = service.validate_parameters(StrategyType.SMA_CROSSOVER, valid_params)
-        assert is_valid is True
-
-        # Invalid parameters (missing slow_period)
-        invalid_params = StrategyParameters(
-            params={
-                "fast_period": 50
-            }
-        )
-
-        # Act & Assert - should raise
-        with pytest.raises(ValueError) as exc_info:
-            service.validate_parameters(StrategyType.SMA_CROSSOVER, invalid_params)
-
-        assert "Missing required parameter: slow_period" in str(exc_info.value)
-
-    def test_validate_rsi_strategy_parameters(self, service: StrategyService):
-        """
-        Implementei este teste para validar parâmetros específicos de RSI Strategy
-        """
-        # Valid parameters
-        valid_params = StrategyParameters(
-            params={
-                "period": 14,
-                "oversold": 30,
-                "overbought": 70
-            }
-        )
-
         # Act & Assert - should not raise
-        is_valid = service.validate_parameters(StrategyType.RSI_STRATEGY, valid_params)
+        is_valid = service.validate_parameters(strategy_type, valid_params)
         assert is_valid is True
 
-        # Invalid parameters (oversold > overbought)
-        invalid_params = StrategyParameters(
-            params={
-                "period": 14,
-                "oversold": 80,  # Erro!
-                "overbought": 70
-            }
-        )
+        if invalid_params is None:
+            return
 
         # Act & Assert - should raise
         with pytest.raises(ValueError) as exc_info:
-            service.validate_parameters(StrategyType.RSI_STRATEGY, invalid_params)
+            service.validate_parameters(strategy_type, StrategyParameters(params=invalid_params))
 
-        assert "oversold must be less than overbought" in str(exc_info.value)
+        assert err_msg in str(exc_info.value)
 
-    def test_validate_macd_strategy_parameters(self, service: StrategyService):
-        """
-        Implementei este teste para validar parâmetros específicos de MACD Strategy
-        """
-        # Valid parameters
-        valid_params = StrategyParameters(
-            params={
-                "fast_period": 12,
-                "slow_period": 26,
-                "signal_period": 9
-            }
-        )
-
-        # Act & Assert - should not raise
-        is_valid = service.validate_parameters(StrategyType.MACD_STRATEGY, valid_params)
-        assert is_valid is True
-
-    def test_clone_strategy(self, service: StrategyService, mock_repository: Mock):
+    def test_clone_strategy(
+        self,
+        service: StrategyService,
+        stub_repository: StubStrategyRepository,
+        fresh_id: UUID,
+        id_pool: Iterator[UUID]
+    ):
         """
         Implementei este teste para validar clonagem de estratégia
         Decidi que clone deve ter novo ID e nome "[Original] (Copy)"
         """
         # Arrange
-        strategy_id = uuid4()
+        strategy_id = fresh_id
 
-        # Mock retorna estratégia clonada
+        # Repositório retorna estratégia clonada
         cloned_strategy = Strategy(
-            id=uuid4(),  # Novo ID
+            id=next(id_pool),  # Novo ID
             name="SMA Crossover 50/200 (Copy)",
             strategy_type=StrategyType.SMA_CROSSOVER,
-            parameters=StrategyParameters(params={"fast_period": 50, "slow_period": 200}),
+            parameters=_SMA_VALID,
             is_active=False,  # Clone começa inativo
-            created_at=datetime.now()
+            created_at=_FIXED_NOW
         )
-        mock_repository.clone.return_value = cloned_strategy
+        stub_repository.clone_result = cloned_strategy
 
         # Act
         result = service.clone_strategy(strategy_id)
@@ -411,16 +509,21 @@ class TestStrategyService:
         assert result is not None
         assert "(Copy)" in result.name
         assert result.is_active is False
-        mock_repository.clone.assert_called_once_with(strategy_id)
+        assert stub_repository.clone_calls == [strategy_id]
 
-    def test_get_strategy_performance_stats(self, service: StrategyService, mock_repository: Mock):
+    def test_get_strategy_performance_stats(
+        self,
+        service: StrategyService,
+        stub_repository: StubStrategyRepository,
+        fresh_id: UUID
+    ):
         """
         Implementei este teste para validar estatísticas de performance
         """
         # Arrange
-        strategy_id = uuid4()
+        strategy_id = fresh_id
 
-        # Mock retorna estatísticas
+        # Repositório retorna estatísticas
         mock_stats = {
             "total_backtests": 10,
             "avg_return": 0.15,
@@ -428,7 +531,7 @@ class TestStrategyService:
             "sharpe_ratio": 1.5,
             "max_drawdown": -0.12
         }
-        mock_repository.get_performance_stats.return_value = mock_stats
+        stub_repository.get_performance_stats_result = mock_stats
 
         # Act
         result = service.get_performance_stats(strategy_id)
@@ -438,59 +541,58 @@ class TestStrategyService:
         assert result["total_backtests"] == 10
         assert result["avg_return"] == 0.15
         assert result["win_rate"] == 0.60
-        mock_repository.get_performance_stats.assert_called_once_with(strategy_id)
+        assert stub_repository.get_performance_stats_calls == [strategy_id]
 
 
+@pytest.mark.xdist_group("strategy_params")
 class TestStrategyParameterValidation:
     """
     Implementei esta classe para testar validações detalhadas de parâmetros
     Decidi separar para melhor organização
     """
 
-    def test_parameter_type_validation(self):
-        """
-        Implementei este teste para validar tipos de parâmetros
-        """
-        # Valid: all integers
-        valid = StrategyParameters(
-            params={
-                "fast_period": 50,
-                "slow_period": 200
-            }
-        )
-        assert valid.params["fast_period"] == 50
-
-        # Invalid: string instead of int
-        with pytest.raises(ValueError):
-            StrategyParameters(
-                params={
-                    "fast_period": "fifty"  # Should be int
-                }
-            )
-
-    def test_parameter_range_validation(self):
-        """
-        Implementei este teste para validar ranges de valores
-        """
-        # Valid ranges
-        valid = StrategyParameters(
-            params={
-                "period": 14,  # Valid: 2-200
-                "oversold": 30,  # Valid: 0-100
-                "overbought": 70  # Valid: 0-100
-            }
-        )
-
-        # Invalid: period too small
-        with pytest.raises(ValueError) as exc_info:
-            StrategyParameters(
-                params={"period": 1},  # Min is 2
-                validation_rules={"period": {"min": 2, "max": 200}}
-            )
-
-        assert "period must be >= 2" in str(exc_info.value)
+    @pytest.mark.parametrize("params, rules, err", [
+        pytest.param({"fast_period": 50, "slow_period": 200}, None, None, id="valid-types"),
+        pytest.param(
+            {"period": 14, "oversold": 30, "overbought": 70},  # Valid: 2-200, 0-100, 0-100
+            None,
+            None,
+            id="valid-ranges",
+        ),
+        # Mensagem vazia: para tipo inválido só exijo o ValueError, não o texto
+        pytest.param({"fast_period": "fifty"}, None, "", id="string-instead-of-int"),
+        pytest.param(
+            {"period": 1},  # Min is 2
+            {"period": {"min": 2, "max": 200}},
+            "period must be >= 2",
+            id="period-too-small",
+        ),
+    ])
+    def test_parameter_validation(
+        self,
+        params: Dict[str, Any],
+        rules: Optional[Dict[str, Dict[str, int]]],
+        err: Optional[str]
+    ):
+        """
+        Implementei este teste para validar tipos e ranges de parâmetros
+        Decidi parametrizar: cada caso só constrói StrategyParameters e espera erro ou não
+        """
+        kwargs: Dict[str, Any] = {"params": params}
+        if rules is not None:
+            kwargs["validation_rules"] = rules
+
+        if err is None:
+            valid = StrategyParameters(**kwargs)
+            assert valid.params == params
+            return
+
+        with pytest.raises(ValueError, match=err):
+            StrategyParameters(**kwargs)
 
 
 if __name__ == "__main__":
     # Implementei este bloco para executar testes diretamente
+    # Decidi não forçar -n aqui: o stub e o service são module-scoped e o _reset autouse
+    # restaura o estado antes de cada teste; para paralelizar use -n auto --dist loadgroup
     pytest.main([__file__, "-v", "--tb=short"])
\ No newline at end of file